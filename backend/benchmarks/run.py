@@ -0,0 +1,308 @@
+import argparse
+import json
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+import numpy as np
+
+from backend.benchmarks.synthetic import GraphSpec, generate_articles, generate_graph
+from backend.knowledge_graph import DEFAULT_NODE_IMPORTANCE, KnowledgeGraphScorer
+from backend.memory_graph import MemoryGraph, MemoryGraphSession
+
+
+class CountingMemoryGraph(MemoryGraph):
+    def __init__(self):
+        super().__init__()
+        self.round_trips: Dict[str, int] = {}
+
+    @classmethod
+    def wrap(cls, graph: MemoryGraph) -> "CountingMemoryGraph":
+        counting = cls()
+        counting.__dict__.update(graph.__dict__)
+        counting.round_trips = {}
+        return counting
+
+    def session(self, database: Optional[str] = None) -> MemoryGraphSession:
+        return CountingMemoryGraphSession(self)
+
+    def reset_round_trips(self) -> Dict[str, int]:
+        counts = self.round_trips
+        self.round_trips = {}
+        return counts
+
+
+class CountingMemoryGraphSession(MemoryGraphSession):
+    def _execute(self, transaction_function: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        name = transaction_function.__name__
+        self.graph.round_trips[name] = self.graph.round_trips.get(name, 0) + 1
+        return super()._execute(transaction_function, *args, **kwargs)
+
+
+def latency_summary(samples: List[float]) -> Dict[str, float]:
+    values = np.asarray(samples, dtype=np.float64) * 1000.0
+    return {
+        "mean_ms": round(float(values.mean()), 4),
+        "p50_ms": round(float(np.percentile(values, 50)), 4),
+        "p99_ms": round(float(np.percentile(values, 99)), 4),
+        "max_ms": round(float(values.max()), 4),
+    }
+
+
+def time_calls(function: Callable[[Any], Any], inputs: List[Any], repeat: int) -> Dict[str, Any]:
+    samples: List[float] = []
+    for _ in range(repeat):
+        for item in inputs:
+            started = time.perf_counter()
+            function(item)
+            samples.append(time.perf_counter() - started)
+    total = sum(samples)
+    result = {"calls": len(samples), "calls_per_sec": round(len(samples) / total, 2) if total else None}
+    result.update(latency_summary(samples))
+    return result
+
+
+def build_scorer(
+    graph: MemoryGraph,
+    enable_ml_model: bool,
+    traversal: Optional[Dict[str, Any]] = None,
+    write_mode: str = "direct",
+    inference_mode: str = "immediate",
+    scoring_mode: str = "full",
+) -> KnowledgeGraphScorer:
+    scorer = KnowledgeGraphScorer()
+    scorer.use_memory_graph(graph)
+    scorer.enable_ml_model = enable_ml_model
+    scorer.graph_write_mode = write_mode
+    scorer.graph_inference_mode = inference_mode
+    scorer.graph_scoring_mode = scoring_mode
+    if traversal:
+        scorer.graph_traversal_mode = traversal["mode"]
+        scorer.graph_traversal_fanout = traversal["fanout"]
+        scorer.graph_traversal_min_path_weight = traversal["min_path_weight"]
+    return scorer
+
+
+def run_micro(
+    spec: GraphSpec,
+    articles: List[Dict[str, Any]],
+    repeat: int,
+    traversal: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Any]:
+    synthetic = generate_graph(spec)
+    scorer = build_scorer(synthetic.build_memory_graph(), enable_ml_model=True, traversal=traversal)
+    graph = scorer._get_driver()
+    settings = scorer._traversal_settings()
+
+    def fetch(item):
+        if settings is None:
+            return graph.fetch_node_with_neighbors(*item)
+        return graph.fetch_node_with_pruned_neighbors(
+            *item, settings["max_hops"], settings["fanout"], settings["min_path_weight"]
+        )
+
+    candidate_sets = [scorer._build_candidate_entities(article) for article in articles]
+    fetch_sets = [
+        [
+            (candidate["label"], candidate["key"], DEFAULT_NODE_IMPORTANCE.get(candidate["label"], 0.5))
+            for candidate in candidates
+        ]
+        for candidates in candidate_sets
+    ]
+    fetch_inputs = [item for fetches in fetch_sets for item in fetches]
+    aggregate_inputs = [
+        (candidates, [fetch(item) for item in fetches])
+        for candidates, fetches in zip(candidate_sets, fetch_sets)
+    ]
+
+    graph_signals = []
+    for candidates, node_data_list in aggregate_inputs:
+        requested_weight = sum(candidate["base_weight"] for candidate in candidates)
+        aggregate = scorer._aggregate_graph_evidence(candidates, node_data_list, set())
+        summary = scorer._summarize_graph_evidence(aggregate, requested_weight)
+        graph_signals.append(scorer._build_graph_signal(aggregate, summary, requested_weight, 0))
+    ml_signals = [scorer.estimate_ml_signal(article) for article in articles]
+
+    return {
+        "build_candidate_entities": time_calls(scorer._build_candidate_entities, articles, repeat),
+        "fetch_node_with_neighbors": time_calls(fetch, fetch_inputs, repeat),
+        "aggregate_graph_evidence": time_calls(
+            lambda item: scorer._aggregate_graph_evidence(item[0], item[1], set()), aggregate_inputs, repeat
+        ),
+        "estimate_ml_signal": time_calls(scorer.estimate_ml_signal, articles, repeat),
+        "combine_signals": time_calls(
+            lambda item: scorer.combine_signals(item[0], item[1]),
+            list(zip(ml_signals, graph_signals)),
+            repeat,
+        ),
+        "evidence_per_article": round(
+            float(np.mean([len(signal.get("evidence") or []) for signal in graph_signals])), 2
+        ),
+    }
+
+
+def run_macro(
+    spec: GraphSpec,
+    articles: List[Dict[str, Any]],
+    enable_ml_model: bool,
+    traversal: Optional[Dict[str, Any]] = None,
+    write_mode: str = "direct",
+    inference_mode: str = "immediate",
+    flush_every: int = 50,
+    scoring_mode: str = "full",
+) -> Dict[str, Any]:
+    synthetic = generate_graph(spec)
+    graph = CountingMemoryGraph.wrap(synthetic.build_memory_graph())
+    scorer = build_scorer(
+        graph,
+        enable_ml_model=enable_ml_model,
+        traversal=traversal,
+        write_mode=write_mode,
+        inference_mode=inference_mode,
+        scoring_mode=scoring_mode,
+    )
+    graph.reset_round_trips()
+
+    samples: List[float] = []
+    statuses: Dict[str, int] = {}
+    round_trip_totals: Dict[str, int] = {}
+    truncated_articles = 0
+    started = time.perf_counter()
+    for position, article in enumerate(articles, start=1):
+        article_started = time.perf_counter()
+        bundle = scorer.compute_article_bias(article)
+        samples.append(time.perf_counter() - article_started)
+        if position % flush_every == 0 or position == len(articles):
+            if write_mode == "coalesced":
+                scorer.flush_graph_writes()
+            if inference_mode == "deferred":
+                scorer.flush_inference()
+            scorer.flush_graph_version()
+        status = bundle["graph_signal"].get("status", "unknown")
+        statuses[status] = statuses.get(status, 0) + 1
+        if (bundle["graph_signal"].get("traversal") or {}).get("truncated"):
+            truncated_articles += 1
+        for name, count in graph.reset_round_trips().items():
+            round_trip_totals[name] = round_trip_totals.get(name, 0) + count
+    elapsed = time.perf_counter() - started
+
+    article_count = max(1, len(articles))
+    result: Dict[str, Any] = {
+        "articles": len(articles),
+        "articles_per_sec": round(len(articles) / elapsed, 2) if elapsed else None,
+        "round_trips_per_article": round(sum(round_trip_totals.values()) / article_count, 3),
+        "round_trips_by_operation": {
+            name: round(count / article_count, 3) for name, count in sorted(round_trip_totals.items())
+        },
+        "graph_status": statuses,
+        "traversal_truncated_articles": truncated_articles,
+        "graph_nodes_after": len(graph.nodes),
+        "graph_relationships_after": len(graph.relationships),
+        "inferred_nodes_after": sum(1 for node in graph.nodes.values() if node.get("inferred_from_articles")),
+        "scoring_paths": scorer.get_scoring_metrics()["paths"],
+    }
+    result.update(latency_summary(samples))
+    return result
+
+
+def compare_reports(current: Dict[str, Any], baseline: Dict[str, Any]) -> Dict[str, Any]:
+    changes: Dict[str, Any] = {}
+    for suite in ("micro", "macro"):
+        for name, values in (current.get(suite) or {}).items():
+            previous = (baseline.get(suite) or {}).get(name)
+            if not isinstance(values, dict) or not isinstance(previous, dict):
+                continue
+            for metric in ("calls_per_sec", "articles_per_sec", "p50_ms", "p99_ms"):
+                if values.get(metric) and previous.get(metric):
+                    changes[f"{suite}.{name}.{metric}"] = round(values[metric] / previous[metric], 3)
+    return changes
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmark the graph scoring pipeline against the in-memory backend with synthetic data."
+    )
+    parser.add_argument("--suite", choices=["micro", "macro", "all"], default="all")
+    parser.add_argument("--articles", type=int, default=300, help="Synthetic articles per macro run.")
+    parser.add_argument("--repeat", type=int, default=3, help="Repetitions for micro benchmarks.")
+    parser.add_argument(
+        "--micro-articles", type=int, default=100, help="Articles used as micro benchmark inputs."
+    )
+    parser.add_argument("--seed", type=int, default=7, help="Seed for graph and article generation.")
+    parser.add_argument("--authors", type=int, default=2000)
+    parser.add_argument("--publishers", type=int, default=150)
+    parser.add_argument("--topics", type=int, default=300)
+    parser.add_argument("--organizations", type=int, default=400)
+    parser.add_argument("--hub-exponent", type=float, default=1.1, help="Zipf exponent for hub popularity.")
+    parser.add_argument("--new-entity-ratio", type=float, default=0.1)
+    parser.add_argument("--enable-ml", action="store_true", help="Fuse the lexical ML signal in macro runs.")
+    parser.add_argument("--traversal-mode", choices=["full", "pruned"], default="full")
+    parser.add_argument("--write-mode", choices=["direct", "coalesced"], default="direct")
+    parser.add_argument("--inference-mode", choices=["immediate", "deferred"], default="immediate")
+    parser.add_argument("--scoring-mode", choices=["full", "adaptive"], default="full")
+    parser.add_argument(
+        "--write-flush-every",
+        type=int,
+        default=50,
+        help="Articles between flushes of coalesced graph writes and deferred inference.",
+    )
+    parser.add_argument("--traversal-fanout", type=int, default=25, help="Per-hop fan-out cap in pruned mode.")
+    parser.add_argument(
+        "--traversal-min-path-weight", type=float, default=0.05, help="Path weight floor in pruned mode."
+    )
+    parser.add_argument("--output", help="Write the JSON report to this path.")
+    parser.add_argument("--baseline", help="Compare against a previously written JSON report.")
+    args = parser.parse_args()
+
+    spec = GraphSpec(
+        authors=args.authors,
+        publishers=args.publishers,
+        topics=args.topics,
+        organizations=args.organizations,
+        hub_exponent=args.hub_exponent,
+        seed=args.seed,
+    )
+    articles = generate_articles(
+        generate_graph(spec), args.articles, seed=args.seed + 1, new_entity_ratio=args.new_entity_ratio
+    )
+
+    traversal = {
+        "mode": args.traversal_mode,
+        "fanout": max(1, args.traversal_fanout),
+        "min_path_weight": max(0.0, args.traversal_min_path_weight),
+    }
+    report: Dict[str, Any] = {
+        "spec": spec.as_dict(),
+        "articles": args.articles,
+        "traversal": traversal,
+        "write_mode": args.write_mode,
+        "inference_mode": args.inference_mode,
+        "scoring_mode": args.scoring_mode,
+    }
+    if args.suite in {"micro", "all"}:
+        report["micro"] = run_micro(spec, articles[: args.micro_articles], args.repeat, traversal)
+    if args.suite in {"macro", "all"}:
+        report["macro"] = {
+            "compute_article_bias": run_macro(
+                spec,
+                articles,
+                args.enable_ml,
+                traversal,
+                write_mode=args.write_mode,
+                inference_mode=args.inference_mode,
+                flush_every=max(1, args.write_flush_every),
+                scoring_mode=args.scoring_mode,
+            )
+        }
+    if args.baseline:
+        baseline = json.loads(Path(args.baseline).read_text(encoding="utf-8"))
+        report["relative_to_baseline"] = compare_reports(report, baseline)
+
+    body = json.dumps(report, indent=2)
+    if args.output:
+        Path(args.output).write_text(body, encoding="utf-8")
+    print(body)
+
+
+if __name__ == "__main__":
+    main()
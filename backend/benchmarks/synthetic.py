@@ -0,0 +1,236 @@
+import random
+from typing import Any, Dict, List, Sequence
+
+from backend.knowledge_graph import (
+    DEFAULT_NODE_IMPORTANCE,
+    ENTITY_TYPE_TO_LABEL,
+    LEFT_LEAN_TERMS,
+    RIGHT_LEAN_TERMS,
+    normalize_text,
+    score_to_allsides_label,
+)
+from backend.memory_graph import MemoryGraph
+
+CATEGORIES = ["Politics", "Policy", "Economy", "World", "Opinion", "Technology"]
+
+FILLER_SENTENCES = [
+    "Lawmakers continued negotiations on the proposal after a long committee session.",
+    "Analysts said the outcome would depend on turnout in several districts.",
+    "The agency released updated figures on spending and revenue for the quarter.",
+    "Officials declined to comment on the timeline for a final vote.",
+    "Advocates on both sides expect further amendments before the deadline.",
+    "The report cited interviews with residents, business owners and local officials.",
+]
+
+
+class GraphSpec:
+    def __init__(
+        self,
+        authors: int = 2000,
+        publishers: int = 150,
+        publisher_houses: int = 40,
+        organizations: int = 400,
+        think_tanks: int = 120,
+        topics: int = 300,
+        known_bias_ratio: float = 0.7,
+        hub_exponent: float = 1.1,
+        topics_per_advocate: int = 3,
+        topics_per_publisher: int = 6,
+        seed: int = 7,
+    ):
+        self.authors = authors
+        self.publishers = publishers
+        self.publisher_houses = publisher_houses
+        self.organizations = organizations
+        self.think_tanks = think_tanks
+        self.topics = topics
+        self.known_bias_ratio = known_bias_ratio
+        self.hub_exponent = hub_exponent
+        self.topics_per_advocate = topics_per_advocate
+        self.topics_per_publisher = topics_per_publisher
+        self.seed = seed
+
+    def counts(self) -> Dict[str, int]:
+        return {
+            "author": self.authors,
+            "publisher": self.publishers,
+            "publisher_house": self.publisher_houses,
+            "organization": self.organizations,
+            "think_tank": self.think_tanks,
+            "topic": self.topics,
+        }
+
+    def as_dict(self) -> Dict[str, Any]:
+        return dict(vars(self))
+
+
+class SyntheticGraph:
+    def __init__(self, spec: GraphSpec):
+        self.spec = spec
+        self.names: Dict[str, List[str]] = {}
+        self.rows: List[Dict[str, Any]] = []
+        self.unknown: List[Dict[str, str]] = []
+        self.links: List[Dict[str, Any]] = []
+
+    def build_memory_graph(self) -> MemoryGraph:
+        graph = MemoryGraph()
+        for row in self.rows:
+            graph.seed_row(row)
+        for node in self.unknown:
+            graph.merge_candidate_node(node)
+        for link in self.links:
+            graph.merge_relationship(
+                link["from_label"],
+                link["from_key"],
+                link["to_label"],
+                link["to_key"],
+                link["type"],
+                link["weight"],
+            )
+        return graph
+
+
+def zipf_weights(count: int, exponent: float) -> List[float]:
+    return [1.0 / ((rank + 1) ** exponent) for rank in range(count)]
+
+
+def pick_hubs(rng: random.Random, names: Sequence[str], weights: Sequence[float], k: int) -> List[str]:
+    if not names:
+        return []
+    picked: List[str] = []
+    for _ in range(k * 3):
+        name = rng.choices(names, weights=weights, k=1)[0]
+        if name not in picked:
+            picked.append(name)
+        if len(picked) >= k:
+            break
+    return picked
+
+
+def generate_graph(spec: GraphSpec) -> SyntheticGraph:
+    rng = random.Random(spec.seed)
+    synthetic = SyntheticGraph(spec=spec)
+    for entity_type, count in spec.counts().items():
+        title = entity_type.replace("_", " ").title()
+        synthetic.names[entity_type] = [f"{title} {index:05d}" for index in range(count)]
+
+    weights = {
+        entity_type: zipf_weights(len(names), spec.hub_exponent)
+        for entity_type, names in synthetic.names.items()
+    }
+
+    def targets_for(entity_type: str) -> List[Dict[str, Any]]:
+        if entity_type == "author":
+            return [
+                {"target_type": "publisher", "name": name, "type": "WRITES_FOR", "weight": 0.95}
+                for name in pick_hubs(rng, synthetic.names["publisher"], weights["publisher"], rng.randint(1, 2))
+            ]
+        if entity_type == "publisher":
+            houses = pick_hubs(rng, synthetic.names["publisher_house"], weights["publisher_house"], 1)
+            topics = pick_hubs(rng, synthetic.names["topic"], weights["topic"], spec.topics_per_publisher)
+            return [
+                {"target_type": "publisher_house", "name": name, "type": "OWNED_BY", "weight": 0.9}
+                for name in houses
+            ] + [
+                {"target_type": "topic", "name": name, "type": "COVERS", "weight": 0.62}
+                for name in topics
+            ]
+        if entity_type in {"organization", "think_tank"}:
+            return [
+                {"target_type": "topic", "name": name, "type": "ADVOCATES_FOR", "weight": 0.68}
+                for name in pick_hubs(rng, synthetic.names["topic"], weights["topic"], spec.topics_per_advocate)
+            ]
+        return []
+
+    for entity_type, names in synthetic.names.items():
+        label = ENTITY_TYPE_TO_LABEL[entity_type]
+        for name in names:
+            targets = targets_for(entity_type)
+            if rng.random() < spec.known_bias_ratio:
+                bias_score = round(rng.uniform(-1.0, 1.0), 3)
+                base_row = {
+                    "entity_type": entity_type,
+                    "name": name,
+                    "bias_label": score_to_allsides_label(bias_score),
+                    "bias_score": bias_score,
+                    "bias_confidence": round(rng.uniform(0.5, 0.95), 3),
+                    "importance_weight": DEFAULT_NODE_IMPORTANCE[label],
+                    "source": "synthetic",
+                }
+                if not targets:
+                    synthetic.rows.append(base_row)
+                for target in targets:
+                    row = dict(base_row)
+                    row.update(
+                        {
+                            "target_type": target["target_type"],
+                            "target_name": target["name"],
+                            "relationship_type": target["type"],
+                            "relationship_weight": target["weight"],
+                        }
+                    )
+                    synthetic.rows.append(row)
+                continue
+
+            synthetic.unknown.append({"label": label, "key": normalize_text(name), "name": name})
+            for target in targets:
+                target_label = ENTITY_TYPE_TO_LABEL[target["target_type"]]
+                synthetic.unknown.append(
+                    {"label": target_label, "key": normalize_text(target["name"]), "name": target["name"]}
+                )
+                synthetic.links.append(
+                    {
+                        "from_label": label,
+                        "from_key": normalize_text(name),
+                        "to_label": target_label,
+                        "to_key": normalize_text(target["name"]),
+                        "type": target["type"],
+                        "weight": target["weight"],
+                    }
+                )
+    return synthetic
+
+
+def generate_articles(
+    graph: SyntheticGraph,
+    count: int,
+    seed: int = 11,
+    new_entity_ratio: float = 0.1,
+) -> List[Dict[str, Any]]:
+    rng = random.Random(seed)
+    spec = graph.spec
+    weights = {
+        entity_type: zipf_weights(len(names), spec.hub_exponent)
+        for entity_type, names in graph.names.items()
+    }
+    lean_terms = sorted(LEFT_LEAN_TERMS) + sorted(RIGHT_LEAN_TERMS)
+
+    def pick(entity_type: str, k: int) -> List[str]:
+        picked = pick_hubs(rng, graph.names[entity_type], weights[entity_type], k)
+        return [
+            f"New {entity_type.replace('_', ' ').title()} {rng.randint(0, 10**6)}"
+            if rng.random() < new_entity_ratio
+            else name
+            for name in picked
+        ]
+
+    articles = []
+    for index in range(count):
+        keywords = pick("topic", rng.randint(2, 4))
+        sentences = rng.sample(FILLER_SENTENCES, 3)
+        sentences.append(f"Supporters framed the debate around {' and '.join(rng.sample(lean_terms, 2))}.")
+        articles.append(
+            {
+                "title": f"Synthetic Article {index:06d} On {keywords[0] if keywords else 'Policy'}",
+                "content": " ".join(sentences),
+                "category": rng.choice(CATEGORIES),
+                "author": (pick("author", 1) or [""])[0],
+                "publisher": (pick("publisher", 1) or [""])[0],
+                "publisher_house": (pick("publisher_house", 1) or [""])[0],
+                "organizations": pick("organization", rng.randint(0, 2)),
+                "think_tanks": pick("think_tank", rng.randint(0, 1)),
+                "keywords": keywords,
+                "topic_scores": {topic: round(rng.uniform(0.4, 0.95), 2) for topic in keywords[:2]},
+            }
+        )
+    return articles
@@ -0,0 +1,193 @@
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from bson import ObjectId
+from pymongo import ASCENDING, UpdateOne
+
+ROLLUP_ENTITY_FIELDS = {
+    "all": None,
+    "publisher": "publisher_id",
+    "author": "author_id",
+    "category": "category",
+}
+ROLLUP_ENTITY_TYPES = tuple(ROLLUP_ENTITY_FIELDS)
+ROLLUP_INDEX_KEYS = [("entity_type", ASCENDING), ("entity_key", ASCENDING), ("day", ASCENDING), ("label", ASCENDING)]
+
+RollupKey = Tuple[str, str, str, str]
+
+
+def rollup_day(value: Any) -> Optional[str]:
+    if isinstance(value, datetime):
+        return value.strftime("%Y-%m-%d")
+    return None
+
+
+def article_rollup_keys(article: Optional[Dict[str, Any]]) -> List[RollupKey]:
+    if not article:
+        return []
+    label = (article.get("classification") or {}).get("label")
+    day = rollup_day(article.get("created_at"))
+    if not label or not day:
+        return []
+
+    keys = []
+    for entity_type, field in ROLLUP_ENTITY_FIELDS.items():
+        entity_key = "all" if field is None else article.get(field)
+        if entity_key is None or entity_key == "":
+            continue
+        keys.append((entity_type, str(entity_key), day, label))
+    return keys
+
+
+def article_rollup_values(article: Dict[str, Any]) -> Dict[str, float]:
+    classification = article.get("classification") or {}
+    return {
+        "count": 1,
+        "score_sum": float(classification.get("score") or 0.0),
+        "confidence_sum": float(classification.get("confidence") or 0.0),
+    }
+
+
+def rollup_operations(
+    previous: Optional[Dict[str, Any]],
+    current: Optional[Dict[str, Any]],
+) -> List[UpdateOne]:
+    deltas: Dict[RollupKey, Dict[str, float]] = {}
+    for article, sign in ((previous, -1), (current, 1)):
+        keys = article_rollup_keys(article)
+        if not keys:
+            continue
+        values = article_rollup_values(article)
+        for key in keys:
+            delta = deltas.setdefault(key, {"count": 0, "score_sum": 0.0, "confidence_sum": 0.0})
+            for field, value in values.items():
+                delta[field] += sign * value
+
+    operations = []
+    for (entity_type, entity_key, day, label), delta in deltas.items():
+        if not any(delta.values()):
+            continue
+        operations.append(
+            UpdateOne(
+                {"entity_type": entity_type, "entity_key": entity_key, "day": day, "label": label},
+                {"$inc": delta},
+                upsert=True,
+            )
+        )
+    return operations
+
+
+def apply_rollup_changes(
+    rollups_collection,
+    previous: Optional[Dict[str, Any]],
+    current: Optional[Dict[str, Any]],
+) -> int:
+    operations = rollup_operations(previous, current)
+    if operations:
+        rollups_collection.bulk_write(operations, ordered=False)
+    return len(operations)
+
+
+def rebuild_rollups(articles_collection, rollups_collection, batch_size: int = 1000) -> Dict[str, int]:
+    staging = rollups_collection.database[f"{rollups_collection.name}_rebuild_{ObjectId()}"]
+    try:
+        staging.create_index(ROLLUP_INDEX_KEYS, unique=True)
+        stats = _write_rollups(articles_collection, staging, batch_size)
+        staging.rename(rollups_collection.name, dropTarget=True)
+    except Exception:
+        staging.drop()
+        raise
+    return stats
+
+
+def _write_rollups(articles_collection, rollups_collection, batch_size: int) -> Dict[str, int]:
+    stats: Dict[str, int] = {}
+    for entity_type, field in ROLLUP_ENTITY_FIELDS.items():
+        match: Dict[str, Any] = {
+            "classification.label": {"$exists": True},
+            "created_at": {"$type": "date"},
+        }
+        if field is not None:
+            match[field] = {"$nin": [None, ""]}
+        pipeline = [
+            {"$match": match},
+            {
+                "$group": {
+                    "_id": {
+                        "entity_key": "all" if field is None else f"${field}",
+                        "day": {"$dateToString": {"format": "%Y-%m-%d", "date": "$created_at"}},
+                        "label": "$classification.label",
+                    },
+                    "count": {"$sum": 1},
+                    "score_sum": {"$sum": {"$ifNull": ["$classification.score", 0]}},
+                    "confidence_sum": {"$sum": {"$ifNull": ["$classification.confidence", 0]}},
+                }
+            },
+        ]
+
+        written = 0
+        batch = []
+        for row in articles_collection.aggregate(pipeline, allowDiskUse=True):
+            batch.append(
+                {
+                    "entity_type": entity_type,
+                    "entity_key": str(row["_id"]["entity_key"]),
+                    "day": row["_id"]["day"],
+                    "label": row["_id"]["label"],
+                    "count": row["count"],
+                    "score_sum": float(row["score_sum"]),
+                    "confidence_sum": float(row["confidence_sum"]),
+                }
+            )
+            if len(batch) >= batch_size:
+                rollups_collection.insert_many(batch, ordered=False)
+                written += len(batch)
+                batch = []
+        if batch:
+            rollups_collection.insert_many(batch, ordered=False)
+            written += len(batch)
+        stats[entity_type] = written
+    return stats
+
+
+def query_bias_trends(
+    rollups_collection,
+    entity_type: str,
+    entity_keys: Iterable[str],
+    start_day: Optional[str] = None,
+    end_day: Optional[str] = None,
+) -> List[Dict[str, Any]]:
+    query: Dict[str, Any] = {
+        "entity_type": entity_type,
+        "entity_key": {"$in": list(entity_keys)},
+        "count": {"$gt": 0},
+    }
+    day_range: Dict[str, str] = {}
+    if start_day:
+        day_range["$gte"] = start_day
+    if end_day:
+        day_range["$lte"] = end_day
+    if day_range:
+        query["day"] = day_range
+
+    days: Dict[str, Dict[str, Any]] = {}
+    for row in rollups_collection.find(query, {"_id": 0}).sort("day", 1):
+        bucket = days.setdefault(row["day"], {"day": row["day"], "total": 0, "labels": {}})
+        label = bucket["labels"].setdefault(
+            row["label"], {"count": 0, "score_sum": 0.0, "confidence_sum": 0.0}
+        )
+        label["count"] += row["count"]
+        label["score_sum"] += row["score_sum"]
+        label["confidence_sum"] += row["confidence_sum"]
+        bucket["total"] += row["count"]
+
+    series = []
+    for day in sorted(days):
+        bucket = days[day]
+        for label in bucket["labels"].values():
+            label["avg_score"] = round(label["score_sum"] / label["count"], 4)
+            label["avg_confidence"] = round(label["confidence_sum"] / label["count"], 4)
+            label["score_sum"] = round(label["score_sum"], 6)
+            label["confidence_sum"] = round(label["confidence_sum"], 6)
+        series.append(bucket)
+    return series
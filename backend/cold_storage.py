@@ -0,0 +1,180 @@
+import json
+import re
+import zlib
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Iterable, List, Optional
+
+import gridfs
+from bson import Binary, ObjectId
+
+SEARCH_TEXT_VERSION = 2
+COMPRESSION_LEVEL = 6
+GRIDFS_BUCKET = "article_bodies"
+COLD_FIELDS = ("content", "evidence")
+
+SEARCH_WORD_PATTERN = re.compile(r"[^\W_]+", re.UNICODE)
+
+
+def build_search_text(content: str) -> str:
+    seen = set()
+    terms: List[str] = []
+    for word in SEARCH_WORD_PATTERN.findall((content or "").lower()):
+        if len(word) < 2 or word in seen:
+            continue
+        seen.add(word)
+        terms.append(word)
+    return " ".join(terms)
+
+
+def search_text_fields(content: str) -> Dict[str, Any]:
+    return {"search_text": build_search_text(content), "search_text_version": SEARCH_TEXT_VERSION}
+
+
+def compress_text(value: str) -> Binary:
+    return Binary(zlib.compress(value.encode("utf-8"), COMPRESSION_LEVEL))
+
+
+def decompress_text(value: bytes) -> str:
+    return zlib.decompress(bytes(value)).decode("utf-8")
+
+
+def compress_json(value: Any) -> Binary:
+    return compress_text(json.dumps(value, default=str, separators=(",", ":")))
+
+
+def decompress_json(value: bytes) -> Any:
+    return json.loads(decompress_text(value))
+
+
+class ColdStorage:
+    def __init__(
+        self,
+        age_days: float = 180.0,
+        gridfs_min_bytes: int = 4 * 1024 * 1024,
+        batch_size: int = 200,
+    ):
+        self.age_days = max(0.0, age_days)
+        self.gridfs_min_bytes = max(1, int(gridfs_min_bytes))
+        self.batch_size = max(1, int(batch_size))
+
+    @property
+    def enabled(self) -> bool:
+        return self.age_days > 0
+
+    @staticmethod
+    def _bucket(contents_collection):
+        return gridfs.GridFS(contents_collection.database, collection=GRIDFS_BUCKET)
+
+    def archive_article(self, collections, article: Dict[str, Any]) -> bool:
+        article_id = article["_id"]
+        content = article.get("content")
+        evidence = (article.get("graph_signal") or {}).get("evidence")
+
+        cold_doc: Dict[str, Any] = {"_id": article_id, "archived_at": datetime.now(timezone.utc)}
+        unset_fields: Dict[str, str] = {}
+        if content is not None:
+            compressed = compress_text(content)
+            if len(compressed) >= self.gridfs_min_bytes:
+                cold_doc["content_file_id"] = self._bucket(collections["article_contents"]).put(
+                    bytes(compressed), filename=str(article_id)
+                )
+            else:
+                cold_doc["content_z"] = compressed
+            cold_doc["content_length"] = len(content)
+            unset_fields["content"] = ""
+        if evidence is not None:
+            cold_doc["evidence_z"] = compress_json(evidence)
+            unset_fields["graph_signal.evidence"] = ""
+
+        set_fields: Dict[str, Any] = {"storage_tier": "cold"}
+        if content is not None and article.get("search_text_version") != SEARCH_TEXT_VERSION:
+            set_fields.update(search_text_fields(content))
+
+        collections["article_contents"].replace_one({"_id": article_id}, cold_doc, upsert=True)
+        update_ops: Dict[str, Any] = {"$set": set_fields}
+        if unset_fields:
+            update_ops["$unset"] = unset_fields
+        result = collections["articles"].update_one(
+            {"_id": article_id, "updated_at": article.get("updated_at")},
+            update_ops,
+        )
+        if result.matched_count == 0:
+            self.release(collections, article_id, COLD_FIELDS)
+            return False
+        return True
+
+    def archive_due(self, collections, limit: Optional[int] = None) -> int:
+        if not self.enabled:
+            return 0
+        cutoff = datetime.now(timezone.utc) - timedelta(days=self.age_days)
+        cursor = collections["articles"].find(
+            {"created_at": {"$lt": cutoff}, "storage_tier": {"$ne": "cold"}},
+            {"content": 1, "graph_signal.evidence": 1, "search_text_version": 1, "updated_at": 1},
+        ).sort("created_at", 1).limit(limit or self.batch_size)
+
+        archived = 0
+        for article in cursor:
+            if self.archive_article(collections, article):
+                archived += 1
+        return archived
+
+    def load(self, collections, article_ids: Iterable[ObjectId]) -> Dict[ObjectId, Dict[str, Any]]:
+        ids = list(article_ids)
+        if not ids:
+            return {}
+
+        payloads: Dict[ObjectId, Dict[str, Any]] = {}
+        bucket = None
+        for doc in collections["article_contents"].find({"_id": {"$in": ids}}):
+            payload: Dict[str, Any] = {}
+            if doc.get("content_z") is not None:
+                payload["content"] = decompress_text(doc["content_z"])
+            elif doc.get("content_file_id") is not None:
+                bucket = bucket or self._bucket(collections["article_contents"])
+                try:
+                    payload["content"] = decompress_text(bucket.get(doc["content_file_id"]).read())
+                except gridfs.errors.NoFile:
+                    pass
+            if doc.get("evidence_z") is not None:
+                payload["evidence"] = decompress_json(doc["evidence_z"])
+            payloads[doc["_id"]] = payload
+        return payloads
+
+    def rehydrate(self, collections, docs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        cold_ids = [doc["_id"] for doc in docs if doc.get("storage_tier") == "cold"]
+        payloads = self.load(collections, cold_ids)
+        for doc in docs:
+            payload = payloads.get(doc["_id"])
+            if not payload:
+                continue
+            if "content" not in doc and "content" in payload:
+                doc["content"] = payload["content"]
+            graph_signal = doc.get("graph_signal")
+            if isinstance(graph_signal, dict) and "evidence" not in graph_signal and "evidence" in payload:
+                graph_signal["evidence"] = payload["evidence"]
+        return docs
+
+    def release(self, collections, article_id: ObjectId, fields: Iterable[str]) -> bool:
+        cold_doc = collections["article_contents"].find_one({"_id": article_id})
+        if not cold_doc:
+            return False
+
+        released = set(fields)
+        unset_fields: Dict[str, str] = {}
+        if "content" in released:
+            if cold_doc.get("content_file_id") is not None:
+                self._bucket(collections["article_contents"]).delete(cold_doc["content_file_id"])
+            unset_fields.update({"content_z": "", "content_file_id": "", "content_length": ""})
+        if "evidence" in released:
+            unset_fields["evidence_z"] = ""
+
+        keeps_content = "content" not in released and (
+            cold_doc.get("content_z") is not None or cold_doc.get("content_file_id") is not None
+        )
+        keeps_evidence = "evidence" not in released and cold_doc.get("evidence_z") is not None
+        if keeps_content or keeps_evidence:
+            collections["article_contents"].update_one({"_id": article_id}, {"$unset": unset_fields})
+            return False
+
+        collections["article_contents"].delete_one({"_id": article_id})
+        return True
@@ -0,0 +1,140 @@
+import logging
+import threading
+from typing import Any, Callable, Dict, Optional
+
+from bson import ObjectId
+from pymongo import UpdateOne
+from pymongo.errors import BulkWriteError
+
+from backend.background import PeriodicWorker
+
+ENGAGEMENT_FIELDS = ("likes", "shares", "views")
+
+logger = logging.getLogger(__name__)
+
+
+class EngagementBuffer:
+    def __init__(
+        self,
+        flush_interval_seconds: float = 5.0,
+        max_pending_articles: int = 5000,
+        max_buffered_articles: int = 100000,
+        max_retries: int = 3,
+    ):
+        self.flush_interval_seconds = max(0.1, flush_interval_seconds)
+        self.max_pending_articles = max(1, int(max_pending_articles))
+        self.max_buffered_articles = max(self.max_pending_articles, int(max_buffered_articles))
+        self.max_retries = max(0, int(max_retries))
+        self._pending: Dict[ObjectId, Dict[str, int]] = {}
+        self._attempts: Dict[ObjectId, int] = {}
+        self._lock = threading.Lock()
+        self._worker: Optional[PeriodicWorker] = None
+        self.flush_failures = 0
+        self.rejected = 0
+        self.dropped = 0
+        self.last_error: Optional[str] = None
+
+    def add(self, article_id: ObjectId, increments: Dict[str, int]) -> Optional[Dict[str, int]]:
+        with self._lock:
+            if article_id not in self._pending and len(self._pending) >= self.max_buffered_articles:
+                self.rejected += 1
+                snapshot = None
+            else:
+                snapshot = dict(self._merge(article_id, increments))
+            overflow = len(self._pending) >= self.max_pending_articles
+        if overflow and self._worker is not None:
+            self._worker.wake()
+        return snapshot
+
+    def _merge(self, article_id: ObjectId, increments: Dict[str, int]) -> Dict[str, int]:
+        pending = self._pending.setdefault(article_id, {field: 0 for field in ENGAGEMENT_FIELDS})
+        for field in ENGAGEMENT_FIELDS:
+            pending[field] += int(increments.get(field) or 0)
+        return pending
+
+    def pending_count(self) -> int:
+        with self._lock:
+            return len(self._pending)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "pending_articles": len(self._pending),
+                "max_buffered_articles": self.max_buffered_articles,
+                "flush_failures": self.flush_failures,
+                "rejected": self.rejected,
+                "dropped": self.dropped,
+                "last_error": self.last_error,
+            }
+
+    def _drain(self) -> Dict[ObjectId, Dict[str, int]]:
+        with self._lock:
+            drained = self._pending
+            self._pending = {}
+        return drained
+
+    def _restore(self, failed: Dict[ObjectId, Dict[str, int]], exc: Exception) -> None:
+        dropped = []
+        with self._lock:
+            self.flush_failures += 1
+            self.last_error = f"{type(exc).__name__}: {exc}"
+            for article_id, increments in failed.items():
+                attempts = self._attempts.get(article_id, 0) + 1
+                if attempts > self.max_retries:
+                    self._attempts.pop(article_id, None)
+                    self.dropped += 1
+                    dropped.append(article_id)
+                    continue
+                self._attempts[article_id] = attempts
+                self._merge(article_id, increments)
+        if dropped:
+            logger.warning(
+                "Dropped engagement increments for %d articles after %d retries", len(dropped), self.max_retries
+            )
+
+    def flush(self, articles_collection) -> int:
+        drained = self._drain()
+        article_ids = []
+        operations = []
+        for article_id, increments in drained.items():
+            inc = {
+                f"engagement.{field}": value
+                for field, value in increments.items()
+                if value
+            }
+            if inc:
+                article_ids.append(article_id)
+                operations.append(UpdateOne({"_id": article_id}, {"$inc": inc}))
+        if not operations:
+            return 0
+
+        try:
+            articles_collection.bulk_write(operations, ordered=False)
+        except BulkWriteError as exc:
+            failed = {article_ids[error["index"]] for error in exc.details.get("writeErrors", [])}
+            self._forget(set(article_ids) - failed)
+            self._restore({article_id: drained[article_id] for article_id in failed}, exc)
+            raise
+        except Exception as exc:
+            self._restore(drained, exc)
+            raise
+        self._forget(article_ids)
+        return len(operations)
+
+    def _forget(self, article_ids) -> None:
+        with self._lock:
+            for article_id in article_ids:
+                self._attempts.pop(article_id, None)
+
+    def start(self, flush_callback: Callable[[], None]) -> None:
+        if self._worker is None:
+            def flush_pending():
+                if self.pending_count():
+                    flush_callback()
+
+            self._worker = PeriodicWorker("engagement-flush", self.flush_interval_seconds, flush_pending)
+        self._worker.start()
+
+    def stop(self) -> None:
+        if self._worker is not None:
+            self._worker.stop()
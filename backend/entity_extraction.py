@@ -0,0 +1,258 @@
+import re
+import threading
+import time
+from collections import deque
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Iterable, List, Optional, Tuple
+
+WORD_PATTERN = re.compile(r"[a-z0-9]+")
+
+EXTRACTION_LABEL_FIELDS = {
+    "Organization": "organizations",
+    "ThinkTank": "think_tanks",
+    "Topic": "keywords",
+}
+
+MIN_PATTERN_LENGTH = 3
+MIN_TOPIC_LENGTH = 4
+
+TOPIC_STOPWORDS = frozenset(
+    """
+    a about after all also an and any are as at be been before but by can day days did do does for from
+    general had has have he her his how if in into is it its latest live local more most new news no not
+    now of on one opinion or other our out over people report reports said says she so some story than
+    that the their them then there these they this time today top update updates us video was we week
+    were what when where which who why will with world year years you
+    """.split()
+)
+
+
+def tokenize(text: str) -> List[str]:
+    return WORD_PATTERN.findall(str(text or "").lower())
+
+
+def is_specific_topic(
+    form: str, stopwords: Iterable[str] = TOPIC_STOPWORDS, min_length: int = MIN_TOPIC_LENGTH
+) -> bool:
+    words = tokenize(form)
+    if len(" ".join(words)) < min_length:
+        return False
+    return any(word not in stopwords and not word.isdigit() for word in words)
+
+
+class PhraseAutomaton:
+    def __init__(self, min_length: int = MIN_PATTERN_LENGTH):
+        self.min_length = max(1, int(min_length))
+        self._word_ids: Dict[str, int] = {}
+        self._goto: List[Dict[int, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output_link: List[int] = [0]
+        self._first_match: List[int] = [0]
+        self._depth: List[int] = [0]
+        self._outputs: Dict[int, List[int]] = {}
+        self._entries: List[Tuple[str, str]] = []
+        self._entry_index: Dict[Tuple[str, str], int] = {}
+        self._dirty = False
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def add(self, label: str, name: str, aliases: Iterable[str] = ()) -> int:
+        display = " ".join(str(name or "").split())
+        if not display:
+            return 0
+        added = 0
+        for form in [display] + [str(alias) for alias in aliases or []]:
+            words = tokenize(form)
+            if not words or len(" ".join(words)) < self.min_length:
+                continue
+            entry = self._entry_index.get((label, display))
+            if entry is None:
+                entry = len(self._entries)
+                self._entries.append((label, display))
+                self._entry_index[(label, display)] = entry
+            targets = self._outputs.setdefault(self._insert(words), [])
+            if entry in targets:
+                continue
+            targets.append(entry)
+            added += 1
+        if added:
+            self._dirty = True
+        return added
+
+    def _insert(self, words: List[str]) -> int:
+        state = 0
+        for word in words:
+            word_id = self._word_ids.setdefault(word, len(self._word_ids))
+            next_state = self._goto[state].get(word_id)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][word_id] = next_state
+                self._goto.append({})
+                self._fail.append(0)
+                self._output_link.append(0)
+                self._first_match.append(0)
+                self._depth.append(self._depth[state] + 1)
+            state = next_state
+        return state
+
+    def _build(self) -> None:
+        queue = deque(self._goto[0].values())
+        for state in queue:
+            self._fail[state] = 0
+            self._output_link[state] = 0
+        while queue:
+            state = queue.popleft()
+            for word_id, child in self._goto[state].items():
+                queue.append(child)
+                fallback = self._fail[state]
+                while fallback and word_id not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(word_id, 0)
+                self._fail[child] = target
+                self._output_link[child] = target if target in self._outputs else self._output_link[target]
+        self._first_match = [
+            state if state in self._outputs else link for state, link in enumerate(self._output_link)
+        ]
+        self._dirty = False
+
+    def find(self, words: List[str]) -> List[Tuple[int, int, List[Tuple[str, str]]]]:
+        if self._dirty:
+            self._build()
+
+        goto = self._goto
+        fail = self._fail
+        outputs = self._outputs
+        output_link = self._output_link
+        first_match = self._first_match
+        depth = self._depth
+
+        candidates: List[Tuple[int, int, int]] = []
+        state = 0
+        for position, word_id in enumerate(map(self._word_ids.get, words)):
+            if word_id is None:
+                state = 0
+                continue
+            while state and word_id not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(word_id, 0)
+            matched = first_match[state]
+            while matched:
+                candidates.append((position + 1 - depth[matched], position + 1, matched))
+                matched = output_link[matched]
+
+        matches = []
+        covered_until = 0
+        for start, end, matched in sorted(candidates, key=lambda item: (item[0], -item[1])):
+            if start < covered_until:
+                continue
+            matches.append((start, end, [self._entries[entry] for entry in outputs[matched]]))
+            covered_until = end
+        return matches
+
+
+class EntityExtractor:
+    def __init__(
+        self,
+        refresh_seconds: float = 300.0,
+        max_per_field: int = 25,
+        min_length: int = MIN_PATTERN_LENGTH,
+        min_topic_length: int = MIN_TOPIC_LENGTH,
+        topic_stopwords: Iterable[str] = TOPIC_STOPWORDS,
+    ):
+        self.refresh_seconds = max(0.0, refresh_seconds)
+        self.max_per_field = max(1, int(max_per_field))
+        self.min_topic_length = max(1, int(min_topic_length))
+        self.topic_stopwords = frozenset(tokenize(" ".join(topic_stopwords)))
+        self.min_length = max(1, int(min_length))
+        self._automaton = PhraseAutomaton(min_length=self.min_length)
+        self._forms: Dict[Tuple[str, str], Dict[str, None]] = {}
+        self._staged = False
+        self._lock = threading.Lock()
+        self._refresh_lock = threading.Lock()
+        self._graph_watermark: Optional[datetime] = None
+        self._last_refresh: Optional[float] = None
+
+    def add(self, label: str, name: Optional[str], aliases: Iterable[str] = ()) -> int:
+        if label not in EXTRACTION_LABEL_FIELDS or not name:
+            return 0
+        if label == "Topic":
+            if not self._is_specific_topic(name):
+                return 0
+            aliases = [alias for alias in aliases or [] if self._is_specific_topic(alias)]
+        display = " ".join(str(name).split())
+        added = 0
+        with self._lock:
+            forms = self._forms.setdefault((label, display), {})
+            for form in [display] + [str(alias) for alias in aliases or []]:
+                words = tokenize(form)
+                normalized = " ".join(words)
+                if len(normalized) < self.min_length or normalized in forms:
+                    continue
+                forms[normalized] = None
+                added += 1
+            if not forms:
+                del self._forms[(label, display)]
+            self._staged = self._staged or bool(added)
+        return added
+
+    def publish(self) -> bool:
+        with self._lock:
+            if not self._staged:
+                return False
+            entries = [(label, display, list(forms)) for (label, display), forms in self._forms.items()]
+            self._staged = False
+
+        automaton = PhraseAutomaton(min_length=self.min_length)
+        for label, display, forms in entries:
+            automaton.add(label, display, forms)
+        automaton._build()
+        self._automaton = automaton
+        return True
+
+    def pattern_count(self) -> int:
+        return len(self._automaton)
+
+    def _is_specific_topic(self, form: str) -> bool:
+        return is_specific_topic(form, self.topic_stopwords, self.min_topic_length)
+
+    @property
+    def ready(self) -> bool:
+        return self._last_refresh is not None
+
+    def refresh(self, scorer) -> int:
+        if not self._refresh_lock.acquire(blocking=False):
+            return 0
+        try:
+            started_at = datetime.now(timezone.utc) - timedelta(seconds=5)
+            rows = scorer.list_entity_names(updated_since=self._graph_watermark)
+            if scorer.get_connection_error() is None:
+                self._graph_watermark = started_at
+            added = 0
+            for row in rows:
+                added += self.add(row.get("label"), row.get("name"), row.get("aliases") or [])
+            self.publish()
+            self._last_refresh = time.monotonic()
+            return added
+        finally:
+            self._refresh_lock.release()
+
+    def extract(self, *texts: str) -> Dict[str, List[str]]:
+        counts: Dict[Tuple[str, str], List[int]] = {}
+        automaton = self._automaton
+        offset = 0
+        for text in texts:
+            words = tokenize(text)
+            matches = automaton.find(words)
+            for start, _, entries in matches:
+                for entry in entries:
+                    seen = counts.setdefault(entry, [0, offset + start])
+                    seen[0] += 1
+            offset += len(words)
+
+        detected: Dict[str, List[str]] = {field: [] for field in EXTRACTION_LABEL_FIELDS.values()}
+        for (label, name), _ in sorted(counts.items(), key=lambda item: (-item[1][0], item[1][1])):
+            values = detected[EXTRACTION_LABEL_FIELDS[label]]
+            if len(values) < self.max_per_field:
+                values.append(name)
+        return detected
@@ -0,0 +1,205 @@
+import threading
+import time
+from bisect import bisect_left, insort
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from backend.knowledge_graph import ENTITY_TYPE_TO_LABEL, normalize_text
+
+SUGGESTION_ENTITY_TYPES = (
+    "author",
+    "publisher",
+    "publisher_house",
+    "organization",
+    "think_tank",
+    "topic",
+    "keyword",
+)
+
+LABEL_TO_SUGGESTION_TYPES = {
+    label: [entity_type] for entity_type, label in ENTITY_TYPE_TO_LABEL.items()
+}
+LABEL_TO_SUGGESTION_TYPES["Topic"] = ["topic", "keyword"]
+
+ARTICLE_SUGGESTION_FIELDS = {
+    "publisher_house": "publisher_house",
+    "organizations": "organization",
+    "think_tanks": "think_tank",
+    "keywords": "keyword",
+    "category": "topic",
+}
+
+
+def prefix_entries(value: Optional[str], aliases: Iterable[str] = ()) -> Set[Tuple[str, str]]:
+    display = " ".join(str(value or "").split())
+    entries: Set[Tuple[str, str]] = set()
+    if not display:
+        return entries
+    for form in [display] + [str(alias) for alias in aliases or []]:
+        words = normalize_text(form).split()
+        for index in range(len(words)):
+            entries.add((" ".join(words[index:]), display))
+    return entries
+
+
+def article_prefix_entries(article: Dict[str, Any]) -> Iterable[Tuple[str, Set[Tuple[str, str]]]]:
+    for field, entity_type in ARTICLE_SUGGESTION_FIELDS.items():
+        values = article.get(field)
+        if isinstance(values, str):
+            values = [values]
+        for value in values or []:
+            yield entity_type, prefix_entries(value)
+
+
+class PrefixIndex:
+    def __init__(self, entries: Iterable[Tuple[str, str]] = ()):
+        self._seen: Set[Tuple[str, str]] = set(entries)
+        self._tokens: List[Tuple[str, str]] = sorted(self._seen)
+
+    def __len__(self) -> int:
+        return len(self._tokens)
+
+    def add(self, value: str, aliases: Iterable[str] = ()) -> None:
+        self.add_entries(prefix_entries(value, aliases))
+
+    def add_entries(self, entries: Iterable[Tuple[str, str]]) -> None:
+        new_entries = [entry for entry in entries if entry not in self._seen]
+        if not new_entries:
+            return
+        self._seen.update(new_entries)
+        if len(new_entries) == 1:
+            insort(self._tokens, new_entries[0])
+            return
+        self._tokens.extend(new_entries)
+        self._tokens.sort()
+
+    def search(self, prefix: str, limit: int = 10) -> List[str]:
+        needle = normalize_text(prefix)
+        if not needle:
+            return []
+        results: List[str] = []
+        seen: Set[str] = set()
+        position = bisect_left(self._tokens, (needle, ""))
+        while position < len(self._tokens) and len(results) < limit:
+            token, display = self._tokens[position]
+            if not token.startswith(needle):
+                break
+            if display not in seen:
+                seen.add(display)
+                results.append(display)
+            position += 1
+        return results
+
+
+class SuggestionIndex:
+    def __init__(self, refresh_seconds: float = 60.0, rebuild_seconds: float = 3600.0):
+        self.refresh_seconds = max(0.0, refresh_seconds)
+        self.rebuild_seconds = max(0.0, rebuild_seconds)
+        self._indexes: Dict[str, PrefixIndex] = {
+            entity_type: PrefixIndex() for entity_type in SUGGESTION_ENTITY_TYPES
+        }
+        self._lock = threading.Lock()
+        self._refresh_lock = threading.Lock()
+        self._rebuild_pending: Optional[Dict[str, Set[Tuple[str, str]]]] = None
+        self._mongo_watermark: Optional[datetime] = None
+        self._graph_watermark: Optional[datetime] = None
+        self._last_rebuild: Optional[float] = None
+
+    @property
+    def ready(self) -> bool:
+        return self._last_rebuild is not None
+
+    def _add_entries(self, entity_type: str, entries: Set[Tuple[str, str]]) -> None:
+        if entity_type not in self._indexes or not entries:
+            return
+        with self._lock:
+            self._indexes[entity_type].add_entries(entries)
+            if self._rebuild_pending is not None:
+                self._rebuild_pending[entity_type].update(entries)
+
+    def add(self, entity_type: str, value: Optional[str], aliases: Iterable[str] = ()) -> None:
+        self._add_entries(entity_type, prefix_entries(value, aliases))
+
+    def add_article(self, article: Dict[str, Any]) -> None:
+        for entity_type, entries in article_prefix_entries(article):
+            self._add_entries(entity_type, entries)
+
+    def suggest(self, entity_type: str, prefix: str, limit: int = 10) -> List[str]:
+        with self._lock:
+            return self._indexes[entity_type].search(prefix, limit)
+
+    def needs_rebuild(self) -> bool:
+        if self._last_rebuild is None:
+            return True
+        return time.monotonic() - self._last_rebuild >= self.rebuild_seconds
+
+    def refresh(self, collections, scorer, full: bool = False) -> Dict[str, Any]:
+        if not self._refresh_lock.acquire(blocking=False):
+            return {}
+        try:
+            full = full or self._last_rebuild is None
+            started_at = datetime.now(timezone.utc) - timedelta(seconds=5)
+            staged: Dict[str, Set[Tuple[str, str]]] = {entity_type: set() for entity_type in SUGGESTION_ENTITY_TYPES}
+            if full:
+                with self._lock:
+                    self._rebuild_pending = {entity_type: set() for entity_type in SUGGESTION_ENTITY_TYPES}
+            try:
+                mongo_filter = self._mongo_filter(full)
+                counts: Dict[str, Any] = {
+                    "authors": self._load_mongo_entities(collections["authors"], "author", mongo_filter, staged),
+                    "publishers": self._load_mongo_entities(
+                        collections["publishers"], "publisher", mongo_filter, staged
+                    ),
+                    "articles": self._load_article_entities(collections["articles"], mongo_filter, staged),
+                    "graph_nodes": self._load_graph_entities(scorer, full, staged),
+                }
+                with self._lock:
+                    for entity_type, entries in staged.items():
+                        if full:
+                            entries.update(self._rebuild_pending[entity_type])
+                            self._indexes[entity_type] = PrefixIndex(entries)
+                        else:
+                            self._indexes[entity_type].add_entries(entries)
+            finally:
+                with self._lock:
+                    self._rebuild_pending = None
+            self._mongo_watermark = started_at
+            if full:
+                self._last_rebuild = time.monotonic()
+            counts["full"] = full
+            return counts
+        finally:
+            self._refresh_lock.release()
+
+    def _mongo_filter(self, full: bool) -> Dict[str, Any]:
+        if full or self._mongo_watermark is None:
+            return {}
+        return {"updated_at": {"$gte": self._mongo_watermark}}
+
+    @staticmethod
+    def _load_mongo_entities(collection, entity_type: str, mongo_filter, staged) -> int:
+        count = 0
+        for doc in collection.find(mongo_filter, {"name": 1, "aliases": 1}):
+            staged[entity_type].update(prefix_entries(doc.get("name"), doc.get("aliases") or []))
+            count += 1
+        return count
+
+    @staticmethod
+    def _load_article_entities(collection, mongo_filter, staged) -> int:
+        projection = {field: 1 for field in ARTICLE_SUGGESTION_FIELDS}
+        count = 0
+        for doc in collection.find(mongo_filter, projection):
+            for entity_type, entries in article_prefix_entries(doc):
+                staged[entity_type].update(entries)
+            count += 1
+        return count
+
+    def _load_graph_entities(self, scorer, full: bool, staged) -> int:
+        started_at = datetime.now(timezone.utc) - timedelta(seconds=5)
+        rows = scorer.list_entity_names(updated_since=None if full else self._graph_watermark)
+        if scorer.get_connection_error() is None:
+            self._graph_watermark = started_at
+        for row in rows:
+            for entity_type in LABEL_TO_SUGGESTION_TYPES.get(row.get("label"), []):
+                staged[entity_type].update(prefix_entries(row.get("name"), row.get("aliases") or []))
+        return len(rows)
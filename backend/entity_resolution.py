@@ -0,0 +1,233 @@
+import re
+import threading
+import time
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from backend.knowledge_graph import normalize_text
+
+FORM_PATTERN = re.compile(r"[a-z0-9]+")
+
+FUZZY_LABELS = {"Author", "Publisher", "PublisherHouse", "Organization", "ThinkTank"}
+FUZZY_MIN_LENGTH = 5
+FUZZY_MAX_BLOCK_SIZE = 1000
+FUZZY_SHORTLIST = 20
+
+FormRef = Tuple[str, str]
+
+
+def alias_form(value: Optional[str]) -> str:
+    return " ".join(FORM_PATTERN.findall(str(value or "").lower()))
+
+
+def trigrams(form: str) -> Set[str]:
+    padded = f" {form} "
+    return {padded[index:index + 3] for index in range(len(padded) - 2)}
+
+
+class AliasIndex:
+    def __init__(self, fuzzy: bool = False, fuzzy_threshold: float = 0.8, refresh_seconds: float = 300.0):
+        self.fuzzy = fuzzy
+        self.fuzzy_threshold = min(1.0, max(0.0, fuzzy_threshold))
+        self.refresh_seconds = max(0.0, refresh_seconds)
+        self._names: Dict[FormRef, str] = {}
+        self._canonical: Dict[FormRef, str] = {}
+        self._aliases: Dict[FormRef, str] = {}
+        self._declared: Dict[FormRef, str] = {}
+        self._form_grams: Dict[FormRef, Set[str]] = {}
+        self._blocks: Dict[FormRef, Set[str]] = {}
+        self._lock = threading.Lock()
+        self._refresh_lock = threading.Lock()
+        self._mongo_watermark: Optional[datetime] = None
+        self._graph_watermark: Optional[datetime] = None
+        self._last_refresh: Optional[float] = None
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._names)
+
+    def add(self, label: str, key: Optional[str], name: Optional[str], aliases: Iterable[str] = ()) -> None:
+        display = " ".join(str(name or "").split())
+        key = normalize_text(str(key or display))
+        if not key:
+            return
+        with self._lock:
+            self._names[(label, key)] = display or key
+            form = alias_form(display or key)
+            if form:
+                self._canonical.setdefault((label, form), key)
+                if self._aliases.get((label, form), key) != key:
+                    del self._aliases[(label, form)]
+                self._index_form(label, form)
+            for alias in aliases or []:
+                other = alias_form(alias)
+                if not other or other == form:
+                    continue
+                self._declared.setdefault((label, other), key)
+                if self._canonical.get((label, other), key) != key:
+                    continue
+                self._aliases.setdefault((label, other), key)
+                self._index_form(label, other)
+
+    def _index_form(self, label: str, form: str) -> None:
+        if label not in FUZZY_LABELS or (label, form) in self._form_grams:
+            return
+        grams = trigrams(form)
+        self._form_grams[(label, form)] = grams
+        for gram in grams:
+            self._blocks.setdefault((label, gram), set()).add(form)
+
+    def _lookup(self, label: str, form: str) -> Optional[Tuple[str, str]]:
+        key = self._canonical.get((label, form))
+        if key is not None:
+            return key, "exact"
+        key = self._aliases.get((label, form))
+        if key is not None:
+            return key, "alias"
+        return None
+
+    def resolve(self, label: str, name: Optional[str], fuzzy: Optional[bool] = None) -> Optional[Dict[str, Any]]:
+        form = alias_form(name)
+        if not form:
+            return None
+        fuzzy = self.fuzzy if fuzzy is None else fuzzy
+        with self._lock:
+            found = self._lookup(label, form)
+            score = 1.0
+            if found is None and fuzzy and label in FUZZY_LABELS and len(form) >= FUZZY_MIN_LENGTH:
+                matched = self._fuzzy_form(label, form)
+                if matched is not None:
+                    key, _ = self._lookup(label, matched[0])
+                    found, score = (key, "fuzzy"), matched[1]
+            if found is None:
+                return None
+            key, method = found
+            return {
+                "key": key,
+                "name": self._names.get((label, key), key),
+                "method": method,
+                "score": round(score, 4),
+            }
+
+    def _fuzzy_form(self, label: str, form: str, exclude_key: Optional[str] = None) -> Optional[Tuple[str, float]]:
+        grams = trigrams(form)
+        shared: Counter = Counter()
+        for gram in grams:
+            block = self._blocks.get((label, gram))
+            if block and len(block) <= FUZZY_MAX_BLOCK_SIZE:
+                shared.update(block)
+
+        best: Optional[Tuple[str, float]] = None
+        for candidate, count in shared.most_common(FUZZY_SHORTLIST):
+            if exclude_key is not None and (candidate == form or self._lookup(label, candidate)[0] == exclude_key):
+                continue
+            score = count / (len(grams) + len(self._form_grams[(label, candidate)]) - count)
+            if score >= self.fuzzy_threshold and (best is None or score > best[1]):
+                best = (candidate, score)
+        return best
+
+    def needs_refresh(self) -> bool:
+        if self._last_refresh is None:
+            return True
+        return time.monotonic() - self._last_refresh >= self.refresh_seconds
+
+    def refresh(self, collections, scorer) -> Dict[str, int]:
+        if not self._refresh_lock.acquire(blocking=False):
+            return {}
+        try:
+            started_at = datetime.now(timezone.utc) - timedelta(seconds=5)
+            counts = {"authors": 0, "publishers": 0}
+            if collections is not None:
+                counts["authors"] = self._load_mongo_entities(collections["authors"], "Author", None)
+                counts["publishers"] = self._load_mongo_entities(
+                    collections["publishers"], "Publisher", "publisher_key"
+                )
+                self._mongo_watermark = started_at
+            counts["graph_nodes"] = self._load_graph_entities(scorer)
+            self._last_refresh = time.monotonic()
+            return counts
+        finally:
+            self._refresh_lock.release()
+
+    def _load_mongo_entities(self, collection, label: str, key_field: Optional[str]) -> int:
+        query = {} if self._mongo_watermark is None else {"updated_at": {"$gte": self._mongo_watermark}}
+        projection = {"name": 1, "aliases": 1}
+        if key_field:
+            projection[key_field] = 1
+        count = 0
+        for doc in collection.find(query, projection):
+            self.add(label, doc.get(key_field) if key_field else None, doc.get("name"), doc.get("aliases") or [])
+            count += 1
+        return count
+
+    def _load_graph_entities(self, scorer) -> int:
+        started_at = datetime.now(timezone.utc) - timedelta(seconds=5)
+        rows = scorer.list_entity_names(updated_since=self._graph_watermark)
+        if scorer.get_connection_error() is None:
+            self._graph_watermark = started_at
+        for row in rows:
+            self.add(row.get("label"), row.get("key"), row.get("name"), row.get("aliases") or [])
+        return len(rows)
+
+    def _resolve_duplicate(self, label: str, key: str, name: str, fuzzy: bool) -> Optional[Dict[str, Any]]:
+        form = alias_form(name)
+        if not form:
+            return None
+        with self._lock:
+            found = None
+            score = 1.0
+            if self._canonical.get((label, form), key) != key:
+                found = (self._canonical[(label, form)], "exact")
+            elif self._declared.get((label, form), key) != key:
+                found = (self._declared[(label, form)], "alias")
+            elif fuzzy and label in FUZZY_LABELS and len(form) >= FUZZY_MIN_LENGTH:
+                matched = self._fuzzy_form(label, form, exclude_key=key)
+                if matched is not None:
+                    found, score = (self._lookup(label, matched[0])[0], "fuzzy"), matched[1]
+            if found is None:
+                return None
+            return {"key": found[0], "method": found[1], "score": round(score, 4)}
+
+    def duplicate_pairs(
+        self, nodes: List[Dict[str, Any]], fuzzy: bool = False
+    ) -> List[Dict[str, Any]]:
+        existing = {(node["label"], node["key"]) for node in nodes}
+        targets: Dict[FormRef, Dict[str, Any]] = {}
+        for node in nodes:
+            resolved = self._resolve_duplicate(node["label"], node["key"], node.get("name") or node["key"], fuzzy)
+            if resolved is None:
+                continue
+            if (node["label"], resolved["key"]) not in existing:
+                continue
+            targets[(node["label"], node["key"])] = resolved
+
+        with self._lock:
+            alias_counts = Counter((label, key) for (label, _), key in self._declared.items())
+        for (label, key), resolved in list(targets.items()):
+            other = resolved["key"]
+            back = targets.get((label, other))
+            if resolved["method"] != "fuzzy" or back is None or back["key"] != key:
+                continue
+            if (alias_counts[(label, key)], len(key), key) > (alias_counts[(label, other)], len(other), other):
+                del targets[(label, key)]
+
+        pairs: List[Dict[str, Any]] = []
+        for (label, key), resolved in sorted(targets.items()):
+            canonical = resolved["key"]
+            seen = {key}
+            while (label, canonical) in targets and canonical not in seen:
+                seen.add(canonical)
+                canonical = targets[(label, canonical)]["key"]
+            if canonical in seen:
+                continue
+            pairs.append(
+                {
+                    "label": label,
+                    "duplicate": key,
+                    "canonical": canonical,
+                    "method": resolved["method"],
+                    "score": resolved["score"],
+                }
+            )
+        return pairs
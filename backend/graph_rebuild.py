@@ -0,0 +1,113 @@
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from backend.graph_writer import GraphWriteQueue
+
+ARTICLE_GRAPH_PROJECTION = {
+    "author_id": 1,
+    "publisher_id": 1,
+    "category": 1,
+    "publisher_house": 1,
+    "organizations": 1,
+    "think_tanks": 1,
+    "keywords": 1,
+    "topic_scores": 1,
+    "detected_entities": 1,
+}
+
+CHECKPOINT_COLLECTION = "graph_rebuild_checkpoints"
+
+
+def iter_article_pages(
+    collections,
+    build_context: Callable[[Dict[str, Any], Dict[str, Any], Dict[str, Any]], Dict[str, Any]],
+    after_id=None,
+    page_size: int = 5000,
+) -> Iterable[Tuple[Any, List[Dict[str, Any]]]]:
+    while True:
+        query = {} if after_id is None else {"_id": {"$gt": after_id}}
+        articles = list(
+            collections["articles"].find(query, ARTICLE_GRAPH_PROJECTION).sort("_id", 1).limit(page_size)
+        )
+        if not articles:
+            return
+
+        author_ids = list({article["author_id"] for article in articles if article.get("author_id")})
+        publisher_ids = list({article["publisher_id"] for article in articles if article.get("publisher_id")})
+        authors = {doc["_id"]: doc for doc in collections["authors"].find({"_id": {"$in": author_ids}}, {"name": 1})}
+        publishers = {
+            doc["_id"]: doc for doc in collections["publishers"].find({"_id": {"$in": publisher_ids}}, {"name": 1})
+        }
+
+        contexts = [
+            build_context(article, authors.get(article.get("author_id")), publishers.get(article.get("publisher_id")))
+            for article in articles
+        ]
+        after_id = articles[-1]["_id"]
+        yield after_id, contexts
+
+
+def read_checkpoint(collections, name: str) -> Optional[Dict[str, Any]]:
+    return collections["articles"].database[CHECKPOINT_COLLECTION].find_one({"_id": name})
+
+
+def write_checkpoint(collections, name: str, last_article_id, stats: Dict[str, Any], completed: bool = False) -> None:
+    collections["articles"].database[CHECKPOINT_COLLECTION].update_one(
+        {"_id": name},
+        {
+            "$set": {
+                "last_article_id": last_article_id,
+                "stats": stats,
+                "completed": completed,
+                "updated_at": datetime.now(timezone.utc),
+            }
+        },
+        upsert=True,
+    )
+
+
+def clear_checkpoint(collections, name: str) -> None:
+    collections["articles"].database[CHECKPOINT_COLLECTION].delete_one({"_id": name})
+
+
+class ArticleGraphLoader:
+    def __init__(self, scorer, batch_size: int = 500):
+        self.scorer = scorer
+        self.queue = GraphWriteQueue(batch_size=batch_size)
+        self._node_ids: Dict[Tuple[str, str], int] = {}
+        self._relationships: Set[Tuple[int, str, int]] = set()
+
+    def _node_id(self, label: str, key: str) -> Tuple[int, bool]:
+        node_id = self._node_ids.get((label, key))
+        if node_id is not None:
+            return node_id, False
+        node_id = len(self._node_ids)
+        self._node_ids[(label, key)] = node_id
+        return node_id, True
+
+    def add(self, metadata: Dict[str, Any]) -> int:
+        candidates = self.scorer._build_candidate_entities(metadata)
+        new_candidates = [
+            candidate for candidate in candidates if self._node_id(candidate["label"], candidate["key"])[1]
+        ]
+
+        new_relationships = []
+        for rel in self.scorer._build_article_relationships(candidates):
+            edge = (
+                self._node_ids[(rel["from"]["label"], rel["from"]["key"])],
+                rel["type"],
+                self._node_ids[(rel["to"]["label"], rel["to"]["key"])],
+            )
+            if edge not in self._relationships:
+                self._relationships.add(edge)
+                new_relationships.append(rel)
+
+        if new_candidates or new_relationships:
+            self.queue.add(new_candidates, new_relationships)
+        return len(new_candidates) + len(new_relationships)
+
+    def flush(self) -> Dict[str, Any]:
+        return self.scorer.flush_graph_writes(self.queue)
+
+    def seen_counts(self) -> Dict[str, int]:
+        return {"nodes": len(self._node_ids), "relationships": len(self._relationships)}
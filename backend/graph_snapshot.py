@@ -0,0 +1,314 @@
+import json
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Hashable, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from backend.graph_traversal import Neighbor, beam_traverse, collect_related_nodes, neighbor_expander
+
+SNAPSHOT_FORMAT_VERSION = 1
+MANIFEST_FILE = "manifest.json"
+
+SNAPSHOT_ARRAYS = (
+    "node_label",
+    "node_key_blob",
+    "node_key_offsets",
+    "node_name_blob",
+    "node_name_offsets",
+    "node_bias_score",
+    "node_bias_confidence",
+    "node_importance_weight",
+    "rel_source",
+    "rel_target",
+    "rel_type",
+    "rel_weight",
+    "adj_indptr",
+    "adj_rel",
+    "adj_node",
+)
+
+def _pack_strings(values: Sequence[str]) -> Tuple[np.ndarray, np.ndarray]:
+    encoded = [value.encode("utf-8") for value in values]
+    offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+    if encoded:
+        offsets[1:] = np.cumsum([len(item) for item in encoded])
+    blob = np.frombuffer(b"".join(encoded), dtype=np.uint8) if encoded else np.zeros(0, dtype=np.uint8)
+    return blob, offsets
+
+
+def _optional_floats(values: Iterable[Any]) -> np.ndarray:
+    return np.array([np.nan if value is None else float(value) for value in values], dtype=np.float64)
+
+
+def _optional_float(value: float) -> Optional[float]:
+    return None if np.isnan(value) else float(value)
+
+
+def write_snapshot(
+    path: str,
+    nodes: List[Dict[str, Any]],
+    relationships: List[Dict[str, Any]],
+    metadata: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Any]:
+    target = Path(path)
+    target.mkdir(parents=True, exist_ok=True)
+
+    labels = sorted({node["label"] for node in nodes})
+    label_index = {label: position for position, label in enumerate(labels)}
+    ordered = sorted(nodes, key=lambda node: (label_index[node["label"]], node["key"].encode("utf-8")))
+    node_index = {(node["label"], node["key"]): position for position, node in enumerate(ordered)}
+
+    label_ranges = {}
+    for position, node in enumerate(ordered):
+        start, _ = label_ranges.get(node["label"], (position, position))
+        label_ranges[node["label"]] = (start, position + 1)
+
+    rel_types = sorted({rel["type"] for rel in relationships})
+    rel_type_index = {rel_type: position for position, rel_type in enumerate(rel_types)}
+    kept = [
+        rel
+        for rel in relationships
+        if (rel["from_label"], rel["from_key"]) in node_index and (rel["to_label"], rel["to_key"]) in node_index
+    ]
+    rel_source = np.array([node_index[(rel["from_label"], rel["from_key"])] for rel in kept], dtype=np.int64)
+    rel_target = np.array([node_index[(rel["to_label"], rel["to_key"])] for rel in kept], dtype=np.int64)
+
+    loops = rel_source == rel_target
+    rel_ids = np.arange(len(kept), dtype=np.int64)
+    adj_owner = np.concatenate([rel_source, rel_target[~loops]])
+    adj_node = np.concatenate([rel_target, rel_source[~loops]])
+    adj_rel = np.concatenate([rel_ids, rel_ids[~loops]])
+    order = np.argsort(adj_owner, kind="stable")
+    adj_indptr = np.zeros(len(ordered) + 1, dtype=np.int64)
+    adj_indptr[1:] = np.cumsum(np.bincount(adj_owner, minlength=len(ordered)))
+
+    key_blob, key_offsets = _pack_strings([node["key"] for node in ordered])
+    name_blob, name_offsets = _pack_strings([node.get("name") or "" for node in ordered])
+    arrays = {
+        "node_label": np.array([label_index[node["label"]] for node in ordered], dtype=np.int16),
+        "node_key_blob": key_blob,
+        "node_key_offsets": key_offsets,
+        "node_name_blob": name_blob,
+        "node_name_offsets": name_offsets,
+        "node_bias_score": _optional_floats(node.get("bias_score") for node in ordered),
+        "node_bias_confidence": _optional_floats(node.get("bias_confidence") for node in ordered),
+        "node_importance_weight": _optional_floats(node.get("importance_weight") for node in ordered),
+        "rel_source": rel_source,
+        "rel_target": rel_target,
+        "rel_type": np.array([rel_type_index[rel["type"]] for rel in kept], dtype=np.int16),
+        "rel_weight": _optional_floats(rel.get("weight") for rel in kept),
+        "adj_indptr": adj_indptr,
+        "adj_rel": adj_rel[order],
+        "adj_node": adj_node[order],
+    }
+    for name, array in arrays.items():
+        np.save(target / f"{name}.npy", array, allow_pickle=False)
+
+    manifest = {
+        "format_version": SNAPSHOT_FORMAT_VERSION,
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "node_count": len(ordered),
+        "relationship_count": len(kept),
+        "labels": labels,
+        "label_ranges": {label: list(bounds) for label, bounds in label_ranges.items()},
+        "relationship_types": rel_types,
+        "metadata": metadata or {},
+    }
+    (target / MANIFEST_FILE).write_text(json.dumps(manifest, indent=2, default=str), encoding="utf-8")
+    return manifest
+
+
+class GraphSnapshot:
+    def __init__(self, path: str, manifest: Dict[str, Any], arrays: Dict[str, np.ndarray]):
+        self.path = path
+        self.manifest = manifest
+        self.labels: List[str] = manifest["labels"]
+        self.relationship_types: List[str] = manifest["relationship_types"]
+        self._label_ranges = {label: tuple(bounds) for label, bounds in manifest["label_ranges"].items()}
+        self._arrays = arrays
+
+    @classmethod
+    def load(cls, path: str, mmap: bool = True) -> "GraphSnapshot":
+        source = Path(path)
+        manifest_path = source / MANIFEST_FILE
+        if not manifest_path.exists():
+            raise FileNotFoundError(f"Graph snapshot manifest not found: {manifest_path}")
+        manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+        if manifest.get("format_version") != SNAPSHOT_FORMAT_VERSION:
+            raise ValueError(f"Unsupported graph snapshot format: {manifest.get('format_version')}")
+        mode = "r" if mmap else None
+        arrays = {
+            name: np.load(source / f"{name}.npy", mmap_mode=mode, allow_pickle=False)
+            for name in SNAPSHOT_ARRAYS
+        }
+        return cls(str(source), manifest, arrays)
+
+    @property
+    def node_count(self) -> int:
+        return int(self.manifest["node_count"])
+
+    @property
+    def relationship_count(self) -> int:
+        return int(self.manifest["relationship_count"])
+
+    @property
+    def graph_version(self) -> Optional[int]:
+        return self.manifest.get("metadata", {}).get("graph_version")
+
+    def _string(self, prefix: str, index: int) -> str:
+        offsets = self._arrays[f"{prefix}_offsets"]
+        blob = self._arrays[f"{prefix}_blob"]
+        return bytes(blob[offsets[index]:offsets[index + 1]]).decode("utf-8")
+
+    def _key_bytes(self, index: int) -> bytes:
+        offsets = self._arrays["node_key_offsets"]
+        return bytes(self._arrays["node_key_blob"][offsets[index]:offsets[index + 1]])
+
+    def find_node(self, label: str, key: str) -> Optional[int]:
+        bounds = self._label_ranges.get(label)
+        if not bounds:
+            return None
+        target = key.encode("utf-8")
+        low, high = bounds
+        while low < high:
+            middle = (low + high) // 2
+            if self._key_bytes(middle) < target:
+                low = middle + 1
+            else:
+                high = middle
+        if low < bounds[1] and self._key_bytes(low) == target:
+            return low
+        return None
+
+    def node_properties(self, index: int) -> Dict[str, Any]:
+        return {
+            "label": self.labels[int(self._arrays["node_label"][index])],
+            "key": self._string("node_key", index),
+            "name": self._string("node_name", index) or None,
+            "bias_score": _optional_float(self._arrays["node_bias_score"][index]),
+            "bias_confidence": _optional_float(self._arrays["node_bias_confidence"][index]),
+            "importance_weight": _optional_float(self._arrays["node_importance_weight"][index]),
+        }
+
+    def neighbors(self, index: int) -> List[Neighbor]:
+        indptr = self._arrays["adj_indptr"]
+        start, end = int(indptr[index]), int(indptr[index + 1])
+        rel_ids = self._arrays["adj_rel"][start:end]
+        nodes = self._arrays["adj_node"][start:end]
+        weights = self._arrays["rel_weight"][rel_ids]
+        return [
+            (int(rel_id), int(node), _optional_float(weight))
+            for rel_id, node, weight in zip(rel_ids, nodes, weights)
+        ]
+
+    def has_relationship(self, source: int, target: int, relationship_type: str) -> bool:
+        if relationship_type not in self.relationship_types:
+            return False
+        type_index = self.relationship_types.index(relationship_type)
+        for rel_id, node, _ in self.neighbors(source):
+            if (
+                node == target
+                and int(self._arrays["rel_source"][rel_id]) == source
+                and int(self._arrays["rel_type"][rel_id]) == type_index
+            ):
+                return True
+        return False
+
+    def iter_nodes(self) -> Iterator[Dict[str, Any]]:
+        for index in range(self.node_count):
+            yield self.node_properties(index)
+
+    def iter_relationships(self) -> Iterator[Dict[str, Any]]:
+        for rel_id in range(self.relationship_count):
+            source = int(self._arrays["rel_source"][rel_id])
+            target = int(self._arrays["rel_target"][rel_id])
+            yield {
+                "from_label": self.labels[int(self._arrays["node_label"][source])],
+                "from_key": self._string("node_key", source),
+                "to_label": self.labels[int(self._arrays["node_label"][target])],
+                "to_key": self._string("node_key", target),
+                "type": self.relationship_types[int(self._arrays["rel_type"][rel_id])],
+                "weight": _optional_float(self._arrays["rel_weight"][rel_id]),
+            }
+
+    def fetch_node_with_neighbors(
+        self,
+        label: str,
+        key: str,
+        default_importance: float,
+        candidates: Optional[List[Dict[str, Any]]] = None,
+        relationships: Optional[List[Dict[str, Any]]] = None,
+        traversal: Optional[Dict[str, Any]] = None,
+    ) -> Optional[Dict[str, Any]]:
+        virtual_nodes: Dict[Hashable, Dict[str, Any]] = {}
+        refs: Dict[Tuple[str, str], Hashable] = {}
+        for candidate in candidates or []:
+            ref_key = (candidate["label"], candidate["key"])
+            index = self.find_node(*ref_key)
+            if index is None:
+                ref: Hashable = ("virtual",) + ref_key
+                virtual_nodes.setdefault(
+                    ref,
+                    {
+                        "label": candidate["label"],
+                        "key": candidate["key"],
+                        "name": candidate["name"],
+                        "bias_score": None,
+                        "bias_confidence": None,
+                        "importance_weight": default_importance,
+                    },
+                )
+                refs[ref_key] = ref
+            else:
+                refs[ref_key] = index
+
+        overlay: Dict[Hashable, List[Neighbor]] = {}
+        for position, rel in enumerate(relationships or []):
+            source = refs.get((rel["from"]["label"], rel["from"]["key"]))
+            target = refs.get((rel["to"]["label"], rel["to"]["key"]))
+            if source is None or target is None:
+                continue
+            if isinstance(source, int) and isinstance(target, int) and self.has_relationship(
+                source, target, rel["type"]
+            ):
+                continue
+            rel_ref = ("overlay", position)
+            overlay.setdefault(source, []).append((rel_ref, target, rel["weight"]))
+            if source != target:
+                overlay.setdefault(target, []).append((rel_ref, source, rel["weight"]))
+
+        start = refs.get((label, key))
+        if start is None:
+            start = self.find_node(label, key)
+        if start is None:
+            return None
+
+        def neighbors(ref: Hashable) -> List[Neighbor]:
+            found = self.neighbors(ref) if isinstance(ref, int) else []
+            return found + overlay.get(ref, [])
+
+        def properties(ref: Hashable) -> Dict[str, Any]:
+            return virtual_nodes[ref] if ref in virtual_nodes else self.node_properties(ref)
+
+        node = properties(start)
+        node_data = {
+            "node_name": node.get("name"),
+            "node_type": node.get("label"),
+            "bias_score": node.get("bias_score"),
+            "bias_confidence": 0.65 if node.get("bias_confidence") is None else node["bias_confidence"],
+            "importance_weight": (
+                default_importance if node.get("importance_weight") is None else node["importance_weight"]
+            ),
+        }
+        if traversal is None:
+            node_data["related"] = collect_related_nodes(start, neighbors, properties)
+        else:
+            node_data["related"], node_data["traversal"] = beam_traverse(
+                start,
+                neighbor_expander(neighbors, properties),
+                traversal["max_hops"],
+                traversal["fanout"],
+                traversal["min_path_weight"],
+            )
+        return node_data
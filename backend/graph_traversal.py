@@ -0,0 +1,130 @@
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+
+Neighbor = Tuple[Hashable, Hashable, Optional[float]]
+Expansion = Tuple[List[Dict[str, Any]], int]
+
+DEFAULT_RELATIONSHIP_WEIGHT = 0.75
+
+
+def hop_decay(hops: int) -> float:
+    return 0.55 if hops <= 1 else 0.35
+
+
+def related_node_entry(props: Dict[str, Any], relationship_weight: float, hops: int) -> Dict[str, Any]:
+    return {
+        "node_name": props.get("name"),
+        "node_type": props.get("label"),
+        "bias_score": props["bias_score"],
+        "bias_confidence": 0.55 if props.get("bias_confidence") is None else props["bias_confidence"],
+        "importance_weight": 0.35 if props.get("importance_weight") is None else props["importance_weight"],
+        "relationship_weight": relationship_weight,
+        "hops": hops,
+    }
+
+
+def collect_related_nodes(
+    start: Hashable,
+    neighbors: Callable[[Hashable], List[Neighbor]],
+    node_properties: Callable[[Hashable], Dict[str, Any]],
+) -> List[Dict[str, Any]]:
+    related = []
+    for first_rel, middle, first_weight in neighbors(start):
+        first_factor = DEFAULT_RELATIONSHIP_WEIGHT if first_weight is None else first_weight
+        paths = [(middle, first_factor, 1)]
+        for second_rel, end, second_weight in neighbors(middle):
+            if second_rel == first_rel:
+                continue
+            second_factor = DEFAULT_RELATIONSHIP_WEIGHT if second_weight is None else second_weight
+            paths.append((end, first_factor * second_factor, 2))
+
+        for node_ref, relationship_weight, hops in paths:
+            props = node_properties(node_ref)
+            if props.get("bias_score") is None:
+                continue
+            related.append(related_node_entry(props, relationship_weight, hops))
+    return related
+
+
+def beam_traverse(
+    start: Hashable,
+    expand: Callable[[List[Dict[str, Any]], int], List[Expansion]],
+    max_hops: int,
+    fanout: int,
+    min_path_weight: float,
+) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+    related: List[Dict[str, Any]] = []
+    stats = {
+        "paths_explored": 0,
+        "fanout_truncated": 0,
+        "beam_truncated": 0,
+        "weight_pruned": 0,
+    }
+    frontier = [{"node": start, "rel_ids": [], "weight": 1.0}]
+
+    for hops in range(1, max_hops + 1):
+        if not frontier:
+            break
+        decay = hop_decay(hops)
+        next_frontier = []
+        for path, (items, available) in zip(frontier, expand(frontier, fanout)):
+            stats["fanout_truncated"] += max(0, available - len(items))
+            for position, item in enumerate(items):
+                step_weight = item.get("weight")
+                if step_weight is None:
+                    step_weight = DEFAULT_RELATIONSHIP_WEIGHT
+                path_weight = path["weight"] * step_weight
+                if path_weight * decay < min_path_weight:
+                    stats["weight_pruned"] += len(items) - position
+                    break
+
+                stats["paths_explored"] += 1
+                props = item["props"]
+                if props.get("bias_score") is not None:
+                    related.append(related_node_entry(props, path_weight, hops))
+                next_frontier.append(
+                    {
+                        "node": item["node"],
+                        "rel_ids": path["rel_ids"] + [item["rel_id"]],
+                        "weight": path_weight,
+                    }
+                )
+
+        if hops == max_hops:
+            break
+        next_frontier.sort(key=lambda candidate: candidate["weight"], reverse=True)
+        stats["beam_truncated"] += max(0, len(next_frontier) - fanout)
+        frontier = next_frontier[:fanout]
+
+    stats["truncated"] = bool(stats["fanout_truncated"] or stats["beam_truncated"] or stats["weight_pruned"])
+    return related, stats
+
+
+def neighbor_expander(
+    neighbors: Callable[[Hashable], List[Neighbor]],
+    node_properties: Callable[[Hashable], Dict[str, Any]],
+) -> Callable[[List[Dict[str, Any]], int], List[Expansion]]:
+    def expand(frontier: List[Dict[str, Any]], fanout: int) -> List[Expansion]:
+        expansions = []
+        for path in frontier:
+            used = set(path["rel_ids"])
+            options = [
+                (rel_id, node, weight)
+                for rel_id, node, weight in neighbors(path["node"])
+                if rel_id not in used
+            ]
+            options.sort(
+                key=lambda option: DEFAULT_RELATIONSHIP_WEIGHT if option[2] is None else option[2],
+                reverse=True,
+            )
+            expansions.append(
+                (
+                    [
+                        {"rel_id": rel_id, "node": node, "weight": weight, "props": node_properties(node)}
+                        for rel_id, node, weight in options[:fanout]
+                    ],
+                    len(options),
+                )
+            )
+        return expansions
+
+    return expand
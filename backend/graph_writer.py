@@ -0,0 +1,167 @@
+import threading
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from backend.background import PeriodicWorker
+
+NodeKey = Tuple[str, str]
+RelationshipKey = Tuple[str, str, str, str, str]
+
+
+def chunked(rows: List[Dict[str, Any]], size: int) -> Iterable[List[Dict[str, Any]]]:
+    for start in range(0, len(rows), size):
+        yield rows[start:start + size]
+
+
+class GraphWriteQueue:
+    def __init__(
+        self,
+        flush_interval_seconds: float = 1.0,
+        max_pending_writes: int = 5000,
+        batch_size: int = 500,
+        max_queued_writes: int = 20000,
+    ):
+        self.flush_interval_seconds = max(0.1, flush_interval_seconds)
+        self.max_pending_writes = max(1, int(max_pending_writes))
+        self.batch_size = max(1, int(batch_size))
+        self.max_queued_writes = max(self.max_pending_writes, int(max_queued_writes))
+        self._nodes: Dict[NodeKey, str] = {}
+        self._relationships: Dict[RelationshipKey, float] = {}
+        self._inferences: Dict[NodeKey, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        self._worker: Optional[PeriodicWorker] = None
+        self.flushes = 0
+        self.inline_flushes = 0
+        self.flush_failures = 0
+        self.last_error: Optional[str] = None
+
+    def add(
+        self,
+        candidates: List[Dict[str, Any]],
+        relationships: List[Dict[str, Any]],
+    ) -> int:
+        with self._lock:
+            for candidate in candidates:
+                self._nodes[(candidate["label"], candidate["key"])] = candidate["name"]
+            for rel in relationships:
+                key = (rel["from"]["label"], rel["from"]["key"], rel["type"], rel["to"]["label"], rel["to"]["key"])
+                self._relationships.setdefault(key, rel["weight"])
+            pending = len(self._nodes) + len(self._relationships) + len(self._inferences)
+        if pending >= self.max_pending_writes and self._worker is not None:
+            self._worker.wake()
+        return pending
+
+    def add_inference(self, label: str, key: str, update: Dict[str, Any]) -> None:
+        with self._lock:
+            self._inferences.setdefault((label, key), update)
+
+    def pending_count(self) -> int:
+        with self._lock:
+            return len(self._nodes) + len(self._relationships) + len(self._inferences)
+
+    def is_full(self) -> bool:
+        return self.pending_count() >= self.max_queued_writes
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "pending": len(self._nodes) + len(self._relationships) + len(self._inferences),
+                "max_pending_writes": self.max_pending_writes,
+                "max_queued_writes": self.max_queued_writes,
+                "flushes": self.flushes,
+                "inline_flushes": self.inline_flushes,
+                "flush_failures": self.flush_failures,
+                "last_error": self.last_error,
+            }
+
+    def _drain(self):
+        with self._lock:
+            drained = (self._nodes, self._relationships, self._inferences)
+            self._nodes, self._relationships, self._inferences = {}, {}, {}
+        return drained
+
+    def _restore(self, drained) -> None:
+        nodes, relationships, inferences = drained
+        with self._lock:
+            for key, name in nodes.items():
+                self._nodes.setdefault(key, name)
+            for key, weight in relationships.items():
+                self._relationships.setdefault(key, weight)
+            for key, update in inferences.items():
+                self._inferences.setdefault(key, update)
+
+    def flush(self, session, scorer, inline: bool = False) -> Dict[str, Any]:
+        drained = self._drain()
+        nodes, relationships, inferences = drained
+        counts: Dict[str, Any] = {
+            "nodes_merged": 0,
+            "nodes_created": 0,
+            "relationships_merged": 0,
+            "relationships_created": 0,
+            "nodes_inferred": 0,
+            "labels": [],
+        }
+        if not (nodes or relationships or inferences):
+            return counts
+        changed_labels = set()
+
+        node_groups: Dict[str, List[Dict[str, Any]]] = {}
+        for (label, key), name in sorted(nodes.items()):
+            node_groups.setdefault(label, []).append({"key": key, "name": name})
+
+        relationship_groups: Dict[Tuple[str, str, str], List[Dict[str, Any]]] = {}
+        for (from_label, from_key, rel_type, to_label, to_key), weight in sorted(relationships.items()):
+            relationship_groups.setdefault((from_label, rel_type, to_label), []).append(
+                {"from_key": from_key, "to_key": to_key, "weight": weight}
+            )
+
+        inference_groups: Dict[str, List[Dict[str, Any]]] = {}
+        for (label, key), update in sorted(inferences.items()):
+            inference_groups.setdefault(label, []).append(dict(update, key=key))
+
+        try:
+            for label, rows in node_groups.items():
+                for batch in chunked(rows, self.batch_size):
+                    result = session.execute_write(scorer._merge_candidate_nodes_batch, label, batch)
+                    counts["nodes_merged"] += result["merged"]
+                    counts["nodes_created"] += result["created"]
+                    if result["created"]:
+                        changed_labels.add(label)
+            for (from_label, rel_type, to_label), rows in relationship_groups.items():
+                for batch in chunked(rows, self.batch_size):
+                    result = session.execute_write(
+                        scorer._merge_relationships_batch, from_label, rel_type, to_label, batch
+                    )
+                    counts["relationships_merged"] += result["merged"]
+                    counts["relationships_created"] += result["created"]
+                    if result["created"]:
+                        changed_labels.update((from_label, to_label))
+            for label, rows in inference_groups.items():
+                for batch in chunked(rows, self.batch_size):
+                    updated = session.execute_write(scorer._update_inferred_nodes_batch, label, batch)
+                    counts["nodes_inferred"] += updated
+                    if updated:
+                        changed_labels.add(label)
+        except Exception as exc:
+            self._restore(drained)
+            with self._lock:
+                self.flush_failures += 1
+                self.last_error = f"{type(exc).__name__}: {exc}"
+            raise
+        with self._lock:
+            self.flushes += 1
+            self.inline_flushes += int(inline)
+        counts["labels"] = sorted(changed_labels)
+        return counts
+
+    def start(self, flush_callback: Callable[[], Any]) -> None:
+        if self._worker is None:
+            def flush_pending():
+                if self.pending_count():
+                    flush_callback()
+
+            self._worker = PeriodicWorker("graph-writer", self.flush_interval_seconds, flush_pending)
+        self._worker.start()
+
+    def stop(self) -> None:
+        if self._worker is not None:
+            self._worker.stop()
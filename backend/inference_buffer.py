@@ -0,0 +1,85 @@
+import threading
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from backend.background import PeriodicWorker
+from backend.graph_writer import chunked
+
+NodeKey = Tuple[str, str]
+
+INFERENCE_FIELDS = ("weight_sum", "weighted_sum", "confidence_weighted_sum", "observations")
+
+
+class InferenceBuffer:
+    def __init__(
+        self,
+        flush_interval_seconds: float = 30.0,
+        max_pending_nodes: int = 5000,
+        batch_size: int = 500,
+    ):
+        self.flush_interval_seconds = max(0.1, flush_interval_seconds)
+        self.max_pending_nodes = max(1, int(max_pending_nodes))
+        self.batch_size = max(1, int(batch_size))
+        self._pending: Dict[NodeKey, Dict[str, float]] = {}
+        self._lock = threading.Lock()
+        self._worker: Optional[PeriodicWorker] = None
+
+    def add(self, label: str, key: str, observation: Dict[str, float]) -> int:
+        with self._lock:
+            pending = self._pending.setdefault((label, key), {field: 0.0 for field in INFERENCE_FIELDS})
+            for field in INFERENCE_FIELDS:
+                pending[field] += float(observation.get(field) or 0.0)
+            overflow = len(self._pending) >= self.max_pending_nodes
+        if overflow and self._worker is not None:
+            self._worker.wake()
+        return int(pending["observations"])
+
+    def pending_count(self) -> int:
+        with self._lock:
+            return len(self._pending)
+
+    def _drain(self) -> Dict[NodeKey, Dict[str, float]]:
+        with self._lock:
+            drained = self._pending
+            self._pending = {}
+        return drained
+
+    def _restore(self, label: str, rows: List[Dict[str, Any]]) -> None:
+        for row in rows:
+            self.add(label, row["key"], row)
+
+    def flush(self, session, scorer) -> Dict[str, Any]:
+        drained = self._drain()
+        groups: Dict[str, list] = {}
+        for (label, key), observation in sorted(drained.items()):
+            if observation["weight_sum"] > 0:
+                groups.setdefault(label, []).append(dict(observation, key=key))
+        batches = [(label, batch) for label, rows in groups.items() for batch in chunked(rows, self.batch_size)]
+
+        updated = 0
+        labels = set()
+        error: Optional[Exception] = None
+        for position, (label, batch) in enumerate(batches):
+            try:
+                count = session.execute_write(scorer._apply_inference_observations_batch, label, batch)
+            except Exception as exc:
+                for pending_label, pending_rows in batches[position:]:
+                    self._restore(pending_label, pending_rows)
+                error = exc
+                break
+            updated += count
+            if count:
+                labels.add(label)
+        return {"nodes_updated": updated, "labels": sorted(labels), "error": error}
+
+    def start(self, flush_callback: Callable[[], Any]) -> None:
+        if self._worker is None:
+            def flush_pending():
+                if self.pending_count():
+                    flush_callback()
+
+            self._worker = PeriodicWorker("inference-flush", self.flush_interval_seconds, flush_pending)
+        self._worker.start()
+
+    def stop(self) -> None:
+        if self._worker is not None:
+            self._worker.stop()
@@ -1,12 +1,22 @@
 import csv
 import os
 import re
+import threading
+import time
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
 
+import numpy as np
 from dotenv import load_dotenv
 
+from backend.background import PeriodicWorker
+from backend.graph_snapshot import GraphSnapshot, write_snapshot
+from backend.graph_traversal import beam_traverse, hop_decay
+from backend.graph_writer import GraphWriteQueue, chunked
+from backend.inference_buffer import InferenceBuffer
+from backend.propagation import build_propagation_arrays, propagate_bias
+
 try:
     from neo4j import GraphDatabase
 except Exception:  # pragma: no cover - handled gracefully at runtime
@@ -67,8 +77,56 @@ GRAPH_SCHEMA_QUERIES = [
     "CREATE CONSTRAINT organization_key IF NOT EXISTS FOR (n:Organization) REQUIRE n.key IS UNIQUE",
     "CREATE CONSTRAINT think_tank_key IF NOT EXISTS FOR (n:ThinkTank) REQUIRE n.key IS UNIQUE",
     "CREATE CONSTRAINT topic_key IF NOT EXISTS FOR (n:Topic) REQUIRE n.key IS UNIQUE",
+    "CREATE CONSTRAINT graph_meta_name IF NOT EXISTS FOR (n:GraphMeta) REQUIRE n.name IS UNIQUE",
+    'MERGE (v:GraphMeta {name: "graph_version"}) ON CREATE SET v.value = 0, v.updated_at = datetime()',
 ]
 
+GRAPH_VERSION_READ_QUERY = """
+MATCH (v:GraphMeta {name: "graph_version"})
+RETURN v.value AS value
+"""
+
+GRAPH_VERSION_BUMP_QUERY = """
+MERGE (v:GraphMeta {name: "graph_version"})
+ON CREATE SET v.value = 0
+SET v.value = v.value + 1, v.updated_at = datetime()
+RETURN v.value AS value
+"""
+
+GRAPH_TRAVERSAL_EXPAND_QUERY = """
+UNWIND $frontier AS f
+MATCH (a) WHERE elementId(a) = f.node_id
+CALL {
+  WITH a, f
+  MATCH (a)-[r]-(b)
+  WHERE NOT elementId(r) IN f.rel_ids
+  WITH r, b
+  ORDER BY coalesce(r.weight, 0.75) DESC
+  LIMIT $fanout
+  RETURN collect({
+    rel_id: elementId(r),
+    node: elementId(b),
+    weight: r.weight,
+    props: {
+      name: b.name,
+      label: head(labels(b)),
+      bias_score: b.bias_score,
+      bias_confidence: b.bias_confidence,
+      importance_weight: b.importance_weight
+    }
+  }) AS expansions
+}
+RETURN f.index AS index,
+       expansions,
+       COUNT { MATCH (a)-[r]-() WHERE NOT elementId(r) IN f.rel_ids } AS available
+"""
+
+INFERENCE_FALLBACK_WEIGHT = 0.05
+
+EVIDENCE_TOP_K = 15
+
+GRAPH_OK_STATUSES = {"ok", "ok_fast_path"}
+
 LEFT_LEAN_TERMS = {
     "progressive",
     "equity",
@@ -135,6 +193,108 @@ def clamp(value: float, min_value: float, max_value: float) -> float:
     return max(min_value, min(max_value, value))
 
 
+def float_column(values: List[Any]) -> np.ndarray:
+    try:
+        column = np.array(values, dtype=np.float64)
+    except (TypeError, ValueError):
+        column = None
+    if column is None or column.ndim != 1 or int(np.isnan(column).sum()) != values.count(None):
+        parsed = [parse_float(value) for value in values]
+        column = np.array([np.nan if value is None else value for value in parsed], dtype=np.float64)
+    return column
+
+
+def defaulted_column(values: List[Any], default: float) -> np.ndarray:
+    column = float_column(values)
+    return np.where(np.isnan(column) | (column == 0), default, column)
+
+
+def sequential_sum(parts: List[np.ndarray]) -> float:
+    if not parts:
+        return 0.0
+    values = np.concatenate(parts)
+    if not len(values):
+        return 0.0
+    return float(np.add.accumulate(values)[-1])
+
+
+def related_columns(related: List[Dict[str, Any]], base_weight: float) -> Optional[Dict[str, Any]]:
+    if not related:
+        return None
+    scores = float_column([item.get("bias_score") for item in related])
+    confidence = np.clip(defaulted_column([item.get("bias_confidence") for item in related], 0.55), 0.0, 1.0)
+    importance = np.maximum(0.0, defaulted_column([item.get("importance_weight") for item in related], 0.35))
+    relationship_weight = np.maximum(
+        0.0, defaulted_column([item.get("relationship_weight") for item in related], 0.75)
+    )
+    hops = np.trunc(defaulted_column([item.get("hops") for item in related], 1.0)).astype(np.int64)
+    decay = np.where(hops <= 1, hop_decay(1), hop_decay(2))
+
+    contribution_weight = base_weight * importance * relationship_weight * decay
+    keep = ~np.isnan(scores) & (contribution_weight > 0)
+    if not keep.any():
+        return None
+    rows = keep.nonzero()[0]
+    contribution_weight = contribution_weight[rows]
+    weighted_score = scores[rows] * contribution_weight
+    return {
+        "rows": related,
+        "index": rows,
+        "hops": hops[rows],
+        "bias_score": scores[rows],
+        "confidence": confidence[rows],
+        "relationship_weight": relationship_weight[rows],
+        "contribution_weight": contribution_weight,
+        "weighted_score": weighted_score,
+        "confidence_weighted": confidence[rows] * contribution_weight,
+        "labels": {related[row].get("node_type") for row in rows} - {None},
+    }
+
+
+def evidence_item(candidate: Dict[str, Any], block: Dict[str, Any], row: int) -> Dict[str, Any]:
+    source = block["rows"][int(block["index"][row])]
+    item = {
+        "source_entity": candidate["name"],
+        "source_type": candidate["entity_type"],
+        "matched_node": source.get("node_name"),
+        "matched_type": source.get("node_type"),
+        "path_hops": int(block["hops"][row]),
+        "bias_score": float(block["bias_score"][row]),
+        "confidence": float(block["confidence"][row]),
+    }
+    if block["relationship_weight"] is not None:
+        item["relationship_weight"] = round(float(block["relationship_weight"][row]), 6)
+    item["contribution_weight"] = round(float(block["contribution_weight"][row]), 6)
+    item["weighted_contribution"] = round(float(block["weighted_score"][row]), 6)
+    return item
+
+
+def top_evidence_items(
+    blocks: List[Tuple[Dict[str, Any], Dict[str, Any]]], limit: int
+) -> List[Dict[str, Any]]:
+    if not blocks or limit <= 0:
+        return []
+    magnitudes = np.abs(np.concatenate([block["weighted_score"] for _, block in blocks]))
+    offsets = np.cumsum([0] + [len(block["weighted_score"]) for _, block in blocks])
+
+    if len(magnitudes) > limit:
+        threshold = np.partition(magnitudes, len(magnitudes) - limit)[len(magnitudes) - limit]
+        shortlist = (magnitudes >= threshold - 1e-6).nonzero()[0]
+    else:
+        shortlist = np.arange(len(magnitudes))
+
+    def locate(position: int) -> Tuple[Dict[str, Any], Dict[str, Any], int]:
+        block_index = int(np.searchsorted(offsets, position, side="right")) - 1
+        candidate, block = blocks[block_index]
+        return candidate, block, position - int(offsets[block_index])
+
+    ranked = sorted(
+        (int(position) for position in shortlist),
+        key=lambda position: (-abs(round(float(magnitudes[position]), 6)), position),
+    )
+    return [evidence_item(*locate(position)) for position in ranked[:limit]]
+
+
 def bias_label_to_score(label: Optional[str]) -> Optional[float]:
     if not label:
         return None
@@ -200,8 +360,55 @@ class KnowledgeGraphScorer:
             self.graph_weight = self.graph_weight / total
 
         self.ml_model_version = os.getenv("INTERNAL_ML_MODEL_VERSION", "internal-lexical-v1")
+        self.graph_version_refresh_seconds = max(
+            0.0,
+            parse_float(os.getenv("GRAPH_VERSION_REFRESH_SECONDS"), 5.0) or 0.0,
+        )
         self._driver = None
         self._schema_ready = False
+        self._graph_version: Optional[int] = None
+        self._graph_version_read_at = 0.0
+        self._graph_version_lock = threading.Lock()
+        self._pending_version_labels: Set[str] = set()
+        self._graph_version_worker: Optional[PeriodicWorker] = None
+        self.graph_version_bump_seconds = parse_float(os.getenv("GRAPH_VERSION_BUMP_SECONDS"), 1.0) or 1.0
+        self.graph_snapshot_path = (os.getenv("GRAPH_SNAPSHOT_PATH") or "").strip() or None
+        self._snapshot: Optional[GraphSnapshot] = None
+        self.graph_backend = os.getenv("GRAPH_BACKEND", "neo4j").strip().lower() or "neo4j"
+        self._memory_graph = None
+        self.graph_traversal_mode = os.getenv("GRAPH_TRAVERSAL_MODE", "full").strip().lower() or "full"
+        self.graph_traversal_max_hops = max(
+            1, int(parse_float(os.getenv("GRAPH_TRAVERSAL_MAX_HOPS"), 2) or 2)
+        )
+        self.graph_traversal_fanout = max(
+            1, int(parse_float(os.getenv("GRAPH_TRAVERSAL_FANOUT"), 25) or 25)
+        )
+        self.graph_traversal_min_path_weight = max(
+            0.0, parse_float(os.getenv("GRAPH_TRAVERSAL_MIN_PATH_WEIGHT"), 0.05) or 0.0
+        )
+        self.graph_write_mode = os.getenv("GRAPH_WRITE_MODE", "direct").strip().lower() or "direct"
+        self.graph_write_queue = GraphWriteQueue(
+            flush_interval_seconds=parse_float(os.getenv("GRAPH_WRITE_FLUSH_SECONDS"), 1.0) or 1.0,
+            max_pending_writes=int(parse_float(os.getenv("GRAPH_WRITE_MAX_PENDING"), 5000) or 5000),
+            batch_size=int(parse_float(os.getenv("GRAPH_WRITE_BATCH_SIZE"), 500) or 500),
+            max_queued_writes=int(parse_float(os.getenv("GRAPH_WRITE_MAX_QUEUED"), 20000) or 20000),
+        )
+        self.graph_inference_mode = os.getenv("GRAPH_INFERENCE_MODE", "immediate").strip().lower() or "immediate"
+        self.inference_buffer = InferenceBuffer(
+            flush_interval_seconds=parse_float(os.getenv("GRAPH_INFERENCE_FLUSH_SECONDS"), 30.0) or 30.0,
+            max_pending_nodes=int(parse_float(os.getenv("GRAPH_INFERENCE_MAX_PENDING"), 5000) or 5000),
+            batch_size=int(parse_float(os.getenv("GRAPH_WRITE_BATCH_SIZE"), 500) or 500),
+        )
+        self.graph_scoring_mode = os.getenv("GRAPH_SCORING_MODE", "full").strip().lower() or "full"
+        self.graph_fast_path_min_weight = clamp(
+            parse_float(os.getenv("GRAPH_FAST_PATH_MIN_WEIGHT"), 0.6) or 0.0, 0.0, 1.0
+        )
+        self.graph_fast_path_min_confidence = clamp(
+            parse_float(os.getenv("GRAPH_FAST_PATH_MIN_CONFIDENCE"), 0.8) or 0.0, 0.0, 1.0
+        )
+        self._scoring_metrics: Dict[str, Dict[str, float]] = {}
+        self._scoring_metrics_lock = threading.Lock()
+        self._alias_index = None
 
     @staticmethod
     def _read_weight(env_name: str, fallback: float) -> float:
@@ -214,6 +421,16 @@ class KnowledgeGraphScorer:
         if self._driver is not None:
             return self._driver
 
+        if self.graph_backend == "memory":
+            if self._memory_graph is None:
+                from backend.memory_graph import MemoryGraph
+
+                snapshot = self.get_snapshot()
+                self._memory_graph = MemoryGraph.from_snapshot(snapshot) if snapshot else MemoryGraph()
+            self._driver = self._memory_graph
+            self._connection_error = None
+            return self._driver
+
         if GraphDatabase is None:
             self._connection_error = "neo4j package is not installed."
             return None
@@ -288,6 +505,14 @@ class KnowledgeGraphScorer:
         configured = (self.neo4j_database or "").strip()
         return configured or None
 
+    def use_memory_graph(self, graph=None):
+        from backend.memory_graph import MemoryGraph
+
+        self.close()
+        self.graph_backend = "memory"
+        self._memory_graph = graph if graph is not None else MemoryGraph()
+        return self._memory_graph
+
     def get_connection_error(self) -> Optional[str]:
         return self._connection_error
 
@@ -300,6 +525,7 @@ class KnowledgeGraphScorer:
             self._driver = None
             self._schema_ready = False
             self._active_database = None
+            self._graph_version = None
 
     def ensure_schema(self):
         if self._schema_ready:
@@ -350,16 +576,125 @@ class KnowledgeGraphScorer:
                     stats["rows_skipped"] += result.get("rows_skipped", 0)
                     stats["nodes_upserted"] += result.get("nodes_upserted", 0)
                     stats["relationships_upserted"] += result.get("relationships_upserted", 0)
+                stats["graph_version"] = self._bump_graph_version(session, ENTITY_TYPE_TO_LABEL.values())
 
         return stats
 
+    @staticmethod
+    def _run_graph_version_query(tx, query: str) -> int:
+        record = tx.run(query).single()
+        return int(record.get("value") or 0) if record else 0
+
+    def _set_graph_version(self, value: int) -> int:
+        with self._graph_version_lock:
+            if self._graph_version is None or value > self._graph_version:
+                self._graph_version = value
+            self._graph_version_read_at = time.monotonic()
+            return self._graph_version
+
+    @staticmethod
+    def _write_graph_version_bump(tx, labels: List[str]) -> int:
+        record = tx.run(GRAPH_VERSION_BUMP_QUERY).single()
+        value = int(record.get("value") or 0) if record else 0
+        if labels:
+            query = """
+            UNWIND $labels AS label
+            MERGE (v:GraphMeta {name: "label_version:" + label})
+            SET v.label = label, v.value = $value, v.updated_at = datetime()
+            """
+            tx.run(query, labels=labels, value=value)
+        return value
+
+    @staticmethod
+    def _read_label_versions(tx) -> Dict[str, int]:
+        query = """
+        MATCH (v:GraphMeta)
+        WHERE v.name STARTS WITH "label_version:"
+        RETURN v.label AS label, v.value AS value
+        """
+        return {row["label"]: int(row["value"] or 0) for row in tx.run(query).data()}
+
+    def _bump_graph_version(self, session, labels: Optional[Iterable[str]] = None) -> int:
+        with self._graph_version_lock:
+            pending = self._pending_version_labels
+            self._pending_version_labels = set()
+        try:
+            value = session.execute_write(self._write_graph_version_bump, sorted(pending.union(labels or ())))
+        except Exception:
+            self._defer_graph_version_bump(pending)
+            raise
+        return self._set_graph_version(value)
+
+    def _defer_graph_version_bump(self, labels: Iterable[str]) -> None:
+        with self._graph_version_lock:
+            self._pending_version_labels.update(labels)
+
+    def flush_graph_version(self) -> Optional[int]:
+        with self._graph_version_lock:
+            if not self._pending_version_labels:
+                return None
+        driver = self._get_driver()
+        if driver is None:
+            return None
+        with driver.session(database=self._session_database()) as session:
+            return self._bump_graph_version(session)
+
+    def get_graph_version(self) -> Optional[int]:
+        with self._graph_version_lock:
+            fresh = (
+                self._graph_version is not None
+                and time.monotonic() - self._graph_version_read_at < self.graph_version_refresh_seconds
+            )
+            if fresh:
+                return self._graph_version
+
+        driver = self._get_driver()
+        if driver is None:
+            return None
+        try:
+            with driver.session(database=self._session_database()) as session:
+                value = session.execute_read(self._run_graph_version_query, GRAPH_VERSION_READ_QUERY)
+        except Exception:
+            return None
+        return self._set_graph_version(value)
+
+    def get_label_versions(self) -> Dict[str, int]:
+        driver = self._get_driver()
+        if driver is None:
+            return {}
+        with driver.session(database=self._session_database()) as session:
+            return session.execute_read(self._read_label_versions)
+
+    def get_graph_versions(self) -> Dict[str, Any]:
+        return {
+            "graph_version": self.get_graph_version(),
+            "label_versions": self.get_label_versions(),
+        }
+
+    @staticmethod
+    def is_signal_stale(
+        graph_signal: Dict[str, Any], graph_version: Optional[int], label_versions: Dict[str, int]
+    ) -> bool:
+        stamped = graph_signal.get("graph_version")
+        if stamped is None or graph_version is None:
+            return True
+        if stamped >= graph_version:
+            return False
+        labels = graph_signal.get("graph_labels")
+        if labels is None:
+            return True
+        return any(label_versions.get(label, 0) > stamped for label in labels)
+
     @staticmethod
     def _read_graph_stats(tx) -> Dict[str, Any]:
-        node_count_record = tx.run("MATCH (n) RETURN count(n) AS total").single()
+        node_count_record = tx.run(
+            "MATCH (n) WHERE NOT n:GraphMeta RETURN count(n) AS total"
+        ).single()
         rel_count_record = tx.run("MATCH ()-[r]->() RETURN count(r) AS total").single()
         node_type_records = tx.run(
             """
             MATCH (n)
+            WHERE NOT n:GraphMeta
             RETURN head(labels(n)) AS node_type, count(*) AS count
             ORDER BY count DESC, node_type ASC
             """
@@ -375,7 +710,7 @@ class KnowledgeGraphScorer:
             "MATCH (n {inferred_from_articles: true}) RETURN count(n) AS total"
         ).single()
         unknown_bias_record = tx.run(
-            "MATCH (n) WHERE n.bias_score IS NULL RETURN count(n) AS total"
+            "MATCH (n) WHERE n.bias_score IS NULL AND NOT n:GraphMeta RETURN count(n) AS total"
         ).single()
 
         node_count = int(node_count_record.get("total") or 0) if node_count_record else 0
@@ -422,21 +757,298 @@ class KnowledgeGraphScorer:
             stats = session.execute_read(self._read_graph_stats)
 
         return {
+            "backend": self.graph_backend,
             "database": self._session_database(),
             "uri": self.neo4j_uri,
             "stats": stats,
         }
 
     @staticmethod
-    def _seed_row(tx, row: Dict[str, Any]) -> Dict[str, int]:
+    def _read_entity_names(tx, updated_since: Optional[datetime]) -> List[Dict[str, Any]]:
+        query = """
+        MATCH (n)
+        WHERE n.key IS NOT NULL
+          AND ($updated_since IS NULL OR n.updated_at >= $updated_since)
+        RETURN
+            head(labels(n)) AS label,
+            n.key AS key,
+            coalesce(n.name, n.key) AS name,
+            coalesce(n.aliases, []) AS aliases
+        """
+        return tx.run(query, updated_since=updated_since).data()
+
+    def list_entity_names(self, updated_since: Optional[datetime] = None) -> List[Dict[str, Any]]:
+        driver = self._get_driver()
+        if driver is None:
+            return []
+
+        with driver.session(database=self._session_database()) as session:
+            return session.execute_read(self._read_entity_names, updated_since)
+
+    @staticmethod
+    def _read_snapshot_nodes(tx) -> List[Dict[str, Any]]:
+        query = """
+        MATCH (n)
+        WHERE n.key IS NOT NULL AND NOT n:GraphMeta
+        RETURN
+            head(labels(n)) AS label,
+            n.key AS key,
+            n.name AS name,
+            n.bias_score AS bias_score,
+            n.bias_confidence AS bias_confidence,
+            n.importance_weight AS importance_weight,
+            coalesce(n.inferred_from_articles, false) AS inferred
+        """
+        return tx.run(query).data()
+
+    @staticmethod
+    def _read_snapshot_relationships(tx) -> List[Dict[str, Any]]:
+        query = """
+        MATCH (a)-[r]->(b)
+        WHERE a.key IS NOT NULL AND b.key IS NOT NULL
+        RETURN
+            head(labels(a)) AS from_label,
+            a.key AS from_key,
+            head(labels(b)) AS to_label,
+            b.key AS to_key,
+            type(r) AS type,
+            r.weight AS weight
+        """
+        return tx.run(query).data()
+
+    def export_snapshot(self, path: str) -> Dict[str, Any]:
+        driver = self._get_driver()
+        if driver is None:
+            raise RuntimeError(
+                "Neo4j is not reachable. "
+                f"{self._connection_error or 'Check Neo4j URI/credentials in .env.'}"
+            )
+
+        with driver.session(database=self._session_database()) as session:
+            nodes = session.execute_read(self._read_snapshot_nodes)
+            relationships = session.execute_read(self._read_snapshot_relationships)
+
+        return write_snapshot(
+            path,
+            nodes,
+            relationships,
+            metadata={
+                "graph_version": self.get_graph_version(),
+                "database": self._session_database(),
+                "uri": self.neo4j_uri,
+            },
+        )
+
+    @staticmethod
+    def _write_propagated_biases_batch(tx, label: str, rows: List[Dict[str, Any]]) -> int:
+        query = f"""
+        UNWIND $rows AS row
+        MATCH (n:{label} {{key: row.key}})
+        WHERE n.bias_score IS NULL OR n.inferred_from_articles = true
+        SET
+            n.bias_score = row.score,
+            n.bias_confidence = row.confidence,
+            n.bias_label = row.bias_label,
+            n.inferred_from_articles = true,
+            n.inference_model = "graph-propagation-v1",
+            n.source = coalesce(n.source, "graph_propagation"),
+            n.propagated_at = datetime(),
+            n.updated_at = datetime()
+        RETURN count(n) AS updated_count
+        """
+        record = tx.run(query, rows=rows).single()
+        return int(record.get("updated_count") or 0) if record else 0
+
+    def use_alias_index(self, alias_index) -> None:
+        self._alias_index = alias_index
+
+    @staticmethod
+    def _read_relationship_types(tx) -> List[str]:
+        return [row["relationshipType"] for row in tx.run("CALL db.relationshipTypes()").data()]
+
+    @staticmethod
+    def _merge_duplicate_nodes_batch(
+        tx, label: str, relationship_types: List[str], rows: List[Dict[str, Any]]
+    ) -> int:
+        for relationship_type in relationship_types:
+            rel = sanitize_relationship_type(relationship_type)
+            for pattern, merge in (
+                ("(dup)-[r:{rel}]->(other)", "(canonical)-[merged:{rel}]->(other)"),
+                ("(other)-[r:{rel}]->(dup)", "(other)-[merged:{rel}]->(canonical)"),
+            ):
+                query = f"""
+                UNWIND $rows AS row
+                MATCH (dup:{label} {{key: row.duplicate}})
+                MATCH (canonical:{label} {{key: row.canonical}})
+                MATCH {pattern.format(rel=rel)}
+                WHERE other <> canonical AND other <> dup
+                MERGE {merge.format(rel=rel)}
+                ON CREATE SET merged.source = r.source
+                SET
+                    merged.weight = CASE
+                        WHEN merged.weight IS NULL OR r.weight > merged.weight THEN r.weight
+                        ELSE merged.weight
+                    END,
+                    merged.updated_at = datetime()
+                """
+                tx.run(query, rows=rows)
+
+        query = f"""
+        UNWIND $rows AS row
+        MATCH (dup:{label} {{key: row.duplicate}})
+        MATCH (canonical:{label} {{key: row.canonical}})
+        WITH dup, canonical,
+             canonical.bias_score IS NULL
+               OR (coalesce(canonical.inferred_from_articles, false)
+                   AND dup.bias_score IS NOT NULL
+                   AND NOT coalesce(dup.inferred_from_articles, false)) AS take_bias,
+             [alias IN coalesce(canonical.aliases, []) + [dup.name] + coalesce(dup.aliases, [])
+              WHERE alias IS NOT NULL AND alias <> canonical.name] AS aliases
+        SET
+            canonical.aliases = reduce(
+                acc = [], alias IN aliases | CASE WHEN alias IN acc THEN acc ELSE acc + alias END
+            ),
+            canonical.bias_score = CASE WHEN take_bias THEN dup.bias_score ELSE canonical.bias_score END,
+            canonical.bias_confidence = CASE WHEN take_bias THEN dup.bias_confidence ELSE canonical.bias_confidence END,
+            canonical.bias_label = CASE WHEN take_bias THEN dup.bias_label ELSE canonical.bias_label END,
+            canonical.inferred_from_articles = CASE
+                WHEN take_bias THEN dup.inferred_from_articles
+                ELSE canonical.inferred_from_articles
+            END,
+            canonical.importance_weight = CASE
+                WHEN dup.importance_weight > coalesce(canonical.importance_weight, 0.0) THEN dup.importance_weight
+                ELSE canonical.importance_weight
+            END,
+            canonical.updated_at = datetime()
+        DETACH DELETE dup
+        RETURN count(*) AS merged
+        """
+        record = tx.run(query, rows=rows).single()
+        return int(record.get("merged") or 0) if record else 0
+
+    def merge_duplicate_nodes(
+        self, pairs: List[Dict[str, Any]], batch_size: int = 500, dry_run: bool = False
+    ) -> Dict[str, Any]:
+        driver = self._get_driver()
+        if driver is None:
+            raise RuntimeError(
+                "Neo4j is not reachable. "
+                f"{self._connection_error or 'Check Neo4j URI/credentials in .env.'}"
+            )
+
+        rows_by_label: Dict[str, List[Dict[str, Any]]] = {}
+        for pair in pairs:
+            rows_by_label.setdefault(pair["label"], []).append(
+                {"duplicate": pair["duplicate"], "canonical": pair["canonical"]}
+            )
+
+        merged = 0
+        if not dry_run and rows_by_label:
+            self.ensure_schema()
+            with driver.session(database=self._session_database()) as session:
+                relationship_types = session.execute_read(self._read_relationship_types)
+                for label, rows in rows_by_label.items():
+                    for batch in chunked(rows, max(1, batch_size)):
+                        merged += session.execute_write(
+                            self._merge_duplicate_nodes_batch, label, relationship_types, batch
+                        )
+                if merged:
+                    self._bump_graph_version(session, rows_by_label)
+
+        return {
+            "duplicates_found": len(pairs),
+            "by_label": {label: len(rows) for label, rows in sorted(rows_by_label.items())},
+            "nodes_merged": merged,
+            "dry_run": dry_run,
+            "graph_version": self.get_graph_version(),
+        }
+
+    def propagate_graph_bias(
+        self,
+        max_iterations: int = 100,
+        tolerance: float = 1e-4,
+        decay: float = 0.85,
+        batch_size: int = 1000,
+        dry_run: bool = False,
+    ) -> Dict[str, Any]:
+        driver = self._get_driver()
+        if driver is None:
+            raise RuntimeError(
+                "Neo4j is not reachable. "
+                f"{self._connection_error or 'Check Neo4j URI/credentials in .env.'}"
+            )
+
+        self.ensure_schema()
+        with driver.session(database=self._session_database()) as session:
+            started = time.perf_counter()
+            nodes = session.execute_read(self._read_snapshot_nodes)
+            relationships = session.execute_read(self._read_snapshot_relationships)
+            load_seconds = time.perf_counter() - started
+
+            result = propagate_bias(
+                build_propagation_arrays(nodes, relationships),
+                max_iterations=max_iterations,
+                tolerance=tolerance,
+                decay=decay,
+            )
+            rows_by_label: Dict[str, List[Dict[str, Any]]] = {}
+            for position in result["informed"].nonzero()[0]:
+                node = nodes[int(position)]
+                score = round(float(result["scores"][position]), 6)
+                rows_by_label.setdefault(node["label"], []).append(
+                    {
+                        "key": node["key"],
+                        "score": score,
+                        "confidence": round(clamp(float(result["confidence"][position]), 0.15, 0.85), 6),
+                        "bias_label": score_to_allsides_label(score),
+                    }
+                )
+
+            updated = 0
+            if not dry_run:
+                for label, rows in rows_by_label.items():
+                    for start in range(0, len(rows), max(1, batch_size)):
+                        updated += session.execute_write(
+                            self._write_propagated_biases_batch, label, rows[start:start + max(1, batch_size)]
+                        )
+                if updated:
+                    self._bump_graph_version(session, rows_by_label)
+
+        stats = dict(result["stats"])
+        stats.update(
+            {
+                "load_seconds": round(load_seconds, 4),
+                "nodes_updated": updated,
+                "labels_updated": sorted(rows_by_label) if updated else [],
+                "dry_run": dry_run,
+                "graph_version": self.get_graph_version(),
+            }
+        )
+        return stats
+
+    def load_snapshot(self, path: str) -> GraphSnapshot:
+        self._snapshot = GraphSnapshot.load(path)
+        self.graph_snapshot_path = path
+        return self._snapshot
+
+    def get_snapshot(self) -> Optional[GraphSnapshot]:
+        if self._snapshot is None and self.graph_snapshot_path:
+            try:
+                self.load_snapshot(self.graph_snapshot_path)
+            except (OSError, ValueError):
+                self.graph_snapshot_path = None
+        return self._snapshot
+
+    @staticmethod
+    def _parse_seed_row(row: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         entity_type = normalize_text(row.get("entity_type", ""))
         name = str(row.get("name", "")).strip()
         if not entity_type or not name:
-            return {"rows_skipped": 1, "nodes_upserted": 0, "relationships_upserted": 0}
+            return None
 
         label = ENTITY_TYPE_TO_LABEL.get(entity_type)
         if not label:
-            return {"rows_skipped": 1, "nodes_upserted": 0, "relationships_upserted": 0}
+            return None
 
         bias_score = parse_float(row.get("bias_score"))
         if bias_score is None:
@@ -452,8 +1064,43 @@ class KnowledgeGraphScorer:
 
         source = str(row.get("source", "allsides.com")).strip() or "allsides.com"
         source_url = str(row.get("source_url", "")).strip() or None
-        key = normalize_text(name)
 
+        parsed = {
+            "label": label,
+            "key": normalize_text(name),
+            "name": name,
+            "bias_label": score_to_allsides_label(bias_score),
+            "bias_score": clamp(bias_score, -1.0, 1.0),
+            "bias_confidence": bias_confidence,
+            "importance_weight": importance_weight,
+            "source": source,
+            "source_url": source_url,
+            "relationship": None,
+        }
+
+        target_type = normalize_text(row.get("target_type", ""))
+        target_name = str(row.get("target_name", "")).strip()
+        if target_type and target_name and target_type in ENTITY_TYPE_TO_LABEL:
+            parsed["relationship"] = {
+                "target_label": ENTITY_TYPE_TO_LABEL[target_type],
+                "target_key": normalize_text(target_name),
+                "target_name": target_name,
+                "type": sanitize_relationship_type(str(row.get("relationship_type", "ASSOCIATED_WITH"))),
+                "weight": clamp(
+                    parse_float(row.get("relationship_weight"), 0.8) or 0.8,
+                    0.0,
+                    2.0,
+                ),
+            }
+        return parsed
+
+    @staticmethod
+    def _seed_row(tx, row: Dict[str, Any]) -> Dict[str, int]:
+        parsed = KnowledgeGraphScorer._parse_seed_row(row)
+        if parsed is None:
+            return {"rows_skipped": 1, "nodes_upserted": 0, "relationships_upserted": 0}
+
+        label = parsed["label"]
         merge_node_query = f"""
         MERGE (n:{label} {{key: $key}})
         ON CREATE SET n.created_at = datetime()
@@ -469,54 +1116,42 @@ class KnowledgeGraphScorer:
         """
         tx.run(
             merge_node_query,
-            key=key,
-            name=name,
-            bias_label=score_to_allsides_label(bias_score),
-            bias_score=clamp(bias_score, -1.0, 1.0),
-            bias_confidence=bias_confidence,
-            importance_weight=importance_weight,
-            source=source,
-            source_url=source_url,
+            key=parsed["key"],
+            name=parsed["name"],
+            bias_label=parsed["bias_label"],
+            bias_score=parsed["bias_score"],
+            bias_confidence=parsed["bias_confidence"],
+            importance_weight=parsed["importance_weight"],
+            source=parsed["source"],
+            source_url=parsed["source_url"],
         )
 
-        relationships_upserted = 0
-        target_type = normalize_text(row.get("target_type", ""))
-        target_name = str(row.get("target_name", "")).strip()
-        if target_type and target_name and target_type in ENTITY_TYPE_TO_LABEL:
-            target_label = ENTITY_TYPE_TO_LABEL[target_type]
-            relationship_type = sanitize_relationship_type(
-                str(row.get("relationship_type", "ASSOCIATED_WITH"))
-            )
-            relationship_weight = clamp(
-                parse_float(row.get("relationship_weight"), 0.8) or 0.8,
-                0.0,
-                2.0,
-            )
+        relationship = parsed["relationship"]
+        if relationship is None:
+            return {"rows_skipped": 0, "nodes_upserted": 1, "relationships_upserted": 0}
 
-            merge_rel_query = f"""
-            MERGE (target:{target_label} {{key: $target_key}})
-            ON CREATE SET target.name = $target_name, target.created_at = datetime()
-            SET target.updated_at = datetime()
-
-            WITH target
-            MATCH (source:{label} {{key: $source_key}})
-            MERGE (source)-[r:{relationship_type}]->(target)
-            SET
-                r.weight = $relationship_weight,
-                r.source = $source,
-                r.updated_at = datetime()
-            """
-            tx.run(
-                merge_rel_query,
-                source_key=key,
-                target_key=normalize_text(target_name),
-                target_name=target_name,
-                relationship_weight=relationship_weight,
-                source=source,
-            )
-            relationships_upserted = 1
+        merge_rel_query = f"""
+        MERGE (target:{relationship["target_label"]} {{key: $target_key}})
+        ON CREATE SET target.name = $target_name, target.created_at = datetime()
+        SET target.updated_at = datetime()
 
-        return {"rows_skipped": 0, "nodes_upserted": 1, "relationships_upserted": relationships_upserted}
+        WITH target
+        MATCH (source:{label} {{key: $source_key}})
+        MERGE (source)-[r:{relationship["type"]}]->(target)
+        SET
+            r.weight = $relationship_weight,
+            r.source = $source,
+            r.updated_at = datetime()
+        """
+        tx.run(
+            merge_rel_query,
+            source_key=parsed["key"],
+            target_key=relationship["target_key"],
+            target_name=relationship["target_name"],
+            relationship_weight=relationship["weight"],
+            source=parsed["source"],
+        )
+        return {"rows_skipped": 0, "nodes_upserted": 1, "relationships_upserted": 1}
 
     def _fetch_node_with_neighbors(self, tx, label: str, key: str, default_importance: float):
         if label not in set(ENTITY_TYPE_TO_LABEL.values()):
@@ -550,6 +1185,195 @@ class KnowledgeGraphScorer:
             return None
         return record.get("node_data")
 
+    @staticmethod
+    def _fetch_direct_nodes(tx, rows_by_label: Dict[str, List[Dict[str, Any]]]) -> List[Dict[str, Any]]:
+        found: List[Dict[str, Any]] = []
+        for label, rows in rows_by_label.items():
+            if label not in set(ENTITY_TYPE_TO_LABEL.values()):
+                continue
+            query = f"""
+            UNWIND $rows AS row
+            MATCH (n:{label} {{key: row.key}})
+            RETURN row.key AS key, {{
+              node_name: n.name,
+              node_type: head(labels(n)),
+              bias_score: n.bias_score,
+              bias_confidence: coalesce(n.bias_confidence, 0.65),
+              importance_weight: coalesce(n.importance_weight, row.default_importance),
+              inferred: coalesce(n.inferred_from_articles, false)
+            }} AS node_data
+            """
+            found.extend({"label": label, **record} for record in tx.run(query, rows=rows).data())
+        return found
+
+    def _fetch_node_with_pruned_neighbors(
+        self,
+        tx,
+        label: str,
+        key: str,
+        default_importance: float,
+        max_hops: int,
+        fanout: int,
+        min_path_weight: float,
+    ):
+        if label not in set(ENTITY_TYPE_TO_LABEL.values()):
+            return None
+
+        query = f"""
+        MATCH (n:{label} {{key: $key}})
+        RETURN elementId(n) AS node_id, {{
+          node_name: n.name,
+          node_type: head(labels(n)),
+          bias_score: n.bias_score,
+          bias_confidence: coalesce(n.bias_confidence, 0.65),
+          importance_weight: coalesce(n.importance_weight, $default_importance)
+        }} AS node_data
+        """
+        record = tx.run(query, key=key, default_importance=default_importance).single()
+        if not record:
+            return None
+
+        def expand(frontier: List[Dict[str, Any]], limit: int):
+            rows = tx.run(
+                GRAPH_TRAVERSAL_EXPAND_QUERY,
+                frontier=[
+                    {"index": index, "node_id": path["node"], "rel_ids": path["rel_ids"]}
+                    for index, path in enumerate(frontier)
+                ],
+                fanout=limit,
+            ).data()
+            expansions = [([], 0) for _ in frontier]
+            for row in rows:
+                expansions[row["index"]] = (row["expansions"], row["available"])
+            return expansions
+
+        node_data = dict(record.get("node_data"))
+        node_data["related"], node_data["traversal"] = beam_traverse(
+            record.get("node_id"), expand, max_hops, fanout, min_path_weight
+        )
+        return node_data
+
+    def _traversal_settings(self) -> Optional[Dict[str, Any]]:
+        if self.graph_traversal_mode != "pruned":
+            return None
+        return {
+            "max_hops": self.graph_traversal_max_hops,
+            "fanout": self.graph_traversal_fanout,
+            "min_path_weight": self.graph_traversal_min_path_weight,
+        }
+
+    def _fetch_candidate_nodes(
+        self, session, candidates: List[Dict[str, Any]]
+    ) -> List[Optional[Dict[str, Any]]]:
+        traversal = self._traversal_settings()
+        node_data_list = []
+        for candidate in candidates:
+            default_importance = DEFAULT_NODE_IMPORTANCE.get(candidate["label"], 0.5)
+            if traversal is None:
+                node_data = session.execute_read(
+                    self._fetch_node_with_neighbors,
+                    candidate["label"],
+                    candidate["key"],
+                    default_importance,
+                )
+            else:
+                node_data = session.execute_read(
+                    self._fetch_node_with_pruned_neighbors,
+                    candidate["label"],
+                    candidate["key"],
+                    default_importance,
+                    traversal["max_hops"],
+                    traversal["fanout"],
+                    traversal["min_path_weight"],
+                )
+            node_data_list.append(node_data)
+        return node_data_list
+
+    def _probe_fast_path(
+        self, session, candidates: List[Dict[str, Any]], requested_weight: float
+    ) -> Optional[List[Optional[Dict[str, Any]]]]:
+        min_weight = self.graph_fast_path_min_weight * requested_weight
+        remaining_weight = requested_weight
+        direct_weight = 0.0
+        confidence_sum = 0.0
+        direct_nodes: Dict[Tuple[str, str], Dict[str, Any]] = {}
+
+        rows_by_label: Dict[str, List[Dict[str, Any]]] = {}
+        for candidate in candidates:
+            rows_by_label.setdefault(candidate["label"], []).append(
+                {"key": candidate["key"], "default_importance": DEFAULT_NODE_IMPORTANCE.get(candidate["label"], 0.5)}
+            )
+        fetched = {
+            (row["label"], row["key"]): row["node_data"]
+            for row in session.execute_read(self._fetch_direct_nodes, rows_by_label)
+        }
+
+        for candidate in sorted(candidates, key=lambda item: -item["base_weight"]):
+            if direct_weight + remaining_weight < min_weight:
+                return None
+            remaining_weight -= candidate["base_weight"]
+            node_data = fetched.get((candidate["label"], candidate["key"]))
+            if not node_data or node_data.get("inferred") or parse_float(node_data.get("bias_score")) is None:
+                continue
+
+            node_data["related"] = []
+            direct_nodes[(candidate["label"], candidate["key"])] = node_data
+            direct_weight += candidate["base_weight"]
+            confidence_sum += candidate["base_weight"] * clamp(
+                parse_float(node_data.get("bias_confidence"), 0.65) or 0.0, 0.0, 1.0
+            )
+            if (
+                direct_weight >= min_weight
+                and confidence_sum >= self.graph_fast_path_min_confidence * direct_weight
+            ):
+                return [direct_nodes.get((candidate["label"], candidate["key"])) for candidate in candidates]
+        return None
+
+    def _record_scoring_path(self, path: str, seconds: float) -> None:
+        with self._scoring_metrics_lock:
+            metrics = self._scoring_metrics.setdefault(path, {"articles": 0, "seconds": 0.0})
+            metrics["articles"] += 1
+            metrics["seconds"] += seconds
+
+    def scoring_settings(self) -> Dict[str, Any]:
+        return {
+            "enable_ml_model": self.enable_ml_model,
+            "ml_model_version": self.ml_model_version,
+            "ml_weight": self.ml_weight,
+            "graph_weight": self.graph_weight,
+            "traversal_mode": self.graph_traversal_mode,
+            "traversal_max_hops": self.graph_traversal_max_hops,
+            "traversal_fanout": self.graph_traversal_fanout,
+            "traversal_min_path_weight": self.graph_traversal_min_path_weight,
+            "inference_mode": self.graph_inference_mode,
+            "scoring_mode": self.graph_scoring_mode,
+            "fast_path_min_weight": self.graph_fast_path_min_weight,
+            "fast_path_min_confidence": self.graph_fast_path_min_confidence,
+        }
+
+    def get_scoring_metrics(self) -> Dict[str, Any]:
+        with self._scoring_metrics_lock:
+            paths = {path: dict(metrics) for path, metrics in self._scoring_metrics.items()}
+        articles = sum(metrics["articles"] for metrics in paths.values())
+        probed = paths.get("fast_path", {}).get("articles", 0) + paths.get("fast_path_miss", {}).get("articles", 0)
+        return {
+            "scoring_mode": self.graph_scoring_mode,
+            "fast_path_min_weight": self.graph_fast_path_min_weight,
+            "fast_path_min_confidence": self.graph_fast_path_min_confidence,
+            "articles_scored": articles,
+            "fast_path_hit_rate": (
+                round(paths.get("fast_path", {}).get("articles", 0) / probed, 4) if probed else None
+            ),
+            "paths": {
+                path: {
+                    "articles": metrics["articles"],
+                    "mean_ms": round(1000.0 * metrics["seconds"] / metrics["articles"], 4),
+                }
+                for path, metrics in sorted(paths.items())
+            },
+            "write_queue": self.graph_write_queue.stats(),
+        }
+
     def _build_candidate_entities(self, metadata: Dict[str, Any]) -> List[Dict[str, Any]]:
         author_name = str(metadata.get("author", "")).strip()
         publisher_name = str(metadata.get("publisher", "")).strip()
@@ -636,8 +1460,33 @@ class KnowledgeGraphScorer:
                     }
                 )
 
+        if self._alias_index is not None:
+            entities = self._resolve_candidate_aliases(entities)
         return entities
 
+    def _resolve_candidate_aliases(self, entities: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        resolved_entities: List[Dict[str, Any]] = []
+        positions: Dict[Tuple[str, str], int] = {}
+        for entity in entities:
+            resolved = self._alias_index.resolve(entity["label"], entity["name"])
+            if resolved is not None and resolved["key"] != entity["key"]:
+                entity = dict(entity, key=resolved["key"], name=resolved["name"], resolved_from=entity["name"])
+            position = positions.get((entity["label"], entity["key"]))
+            if position is None:
+                positions[(entity["label"], entity["key"])] = len(resolved_entities)
+                resolved_entities.append(entity)
+            else:
+                merged = resolved_entities[position]
+                resolved_entities[position] = dict(merged, base_weight=merged["base_weight"] + entity["base_weight"])
+        return resolved_entities
+
+    def candidate_entity_weights(self, metadata: Dict[str, Any]) -> Dict[str, float]:
+        weights: Dict[str, float] = {}
+        for candidate in self._build_candidate_entities(metadata):
+            entity_key = f"{candidate['entity_type']}:{candidate['key']}"
+            weights[entity_key] = weights.get(entity_key, 0.0) + candidate["base_weight"]
+        return weights
+
     @staticmethod
     def _merge_candidate_node(tx, candidate: Dict[str, Any]) -> Dict[str, Any]:
         label = candidate["label"]
@@ -645,13 +1494,18 @@ class KnowledgeGraphScorer:
         MERGE (n:{label} {{key: $key}})
         ON CREATE SET
             n.created_at = datetime(),
-            n.source = "article_metadata"
+            n.source = "article_metadata",
+            n._created = true
         SET
             n.name = $name,
             n.source = coalesce(n.source, "article_metadata"),
             n.importance_weight = coalesce(n.importance_weight, $importance_weight),
             n.updated_at = datetime()
-        RETURN n.bias_score IS NOT NULL AS has_bias
+        WITH n, coalesce(n._created, false) AS created
+        REMOVE n._created
+        RETURN n.bias_score IS NOT NULL AS has_bias,
+               coalesce(n.inferred_from_articles, false) AS inferred,
+               created
         """
         record = tx.run(
             query,
@@ -659,7 +1513,11 @@ class KnowledgeGraphScorer:
             name=candidate["name"],
             importance_weight=DEFAULT_NODE_IMPORTANCE.get(label, 0.5),
         ).single()
-        return {"has_bias": bool(record and record.get("has_bias"))}
+        return {
+            "has_bias": bool(record and record.get("has_bias")),
+            "inferred": bool(record and record.get("inferred")),
+            "created": bool(record and record.get("created")),
+        }
 
     @staticmethod
     def _merge_relationship(
@@ -670,23 +1528,92 @@ class KnowledgeGraphScorer:
         to_key: str,
         relationship_type: str,
         weight: float,
-    ) -> None:
+    ) -> bool:
         rel = sanitize_relationship_type(relationship_type)
         query = f"""
         MATCH (a:{from_label} {{key: $from_key}})
         MATCH (b:{to_label} {{key: $to_key}})
         MERGE (a)-[r:{rel}]->(b)
+        ON CREATE SET r._created = true
         SET
             r.weight = coalesce(r.weight, $weight),
             r.source = coalesce(r.source, "article_metadata"),
             r.updated_at = datetime()
+        WITH r, coalesce(r._created, false) AS created
+        REMOVE r._created
+        RETURN created
         """
-        tx.run(
+        record = tx.run(
             query,
             from_key=from_key,
             to_key=to_key,
             weight=weight,
-        )
+        ).single()
+        return bool(record and record.get("created"))
+
+    @staticmethod
+    def _merge_candidate_nodes_batch(tx, label: str, rows: List[Dict[str, Any]]) -> Dict[str, int]:
+        query = f"""
+        UNWIND $rows AS row
+        MERGE (n:{label} {{key: row.key}})
+        ON CREATE SET
+            n.created_at = datetime(),
+            n.source = "article_metadata",
+            n._created = true
+        SET
+            n.name = row.name,
+            n.source = coalesce(n.source, "article_metadata"),
+            n.importance_weight = coalesce(n.importance_weight, $importance_weight),
+            n.updated_at = datetime()
+        WITH n, coalesce(n._created, false) AS created
+        REMOVE n._created
+        RETURN count(n) AS merged, sum(CASE WHEN created THEN 1 ELSE 0 END) AS created
+        """
+        record = tx.run(
+            query,
+            rows=rows,
+            importance_weight=DEFAULT_NODE_IMPORTANCE.get(label, 0.5),
+        ).single()
+        if not record:
+            return {"merged": 0, "created": 0}
+        return {"merged": int(record.get("merged") or 0), "created": int(record.get("created") or 0)}
+
+    @staticmethod
+    def _merge_relationships_batch(
+        tx,
+        from_label: str,
+        relationship_type: str,
+        to_label: str,
+        rows: List[Dict[str, Any]],
+    ) -> Dict[str, int]:
+        rel = sanitize_relationship_type(relationship_type)
+        query = f"""
+        UNWIND $rows AS row
+        MATCH (a:{from_label} {{key: row.from_key}})
+        MATCH (b:{to_label} {{key: row.to_key}})
+        MERGE (a)-[r:{rel}]->(b)
+        ON CREATE SET r._created = true
+        SET
+            r.weight = coalesce(r.weight, row.weight),
+            r.source = coalesce(r.source, "article_metadata"),
+            r.updated_at = datetime()
+        WITH r, coalesce(r._created, false) AS created
+        REMOVE r._created
+        RETURN count(r) AS merged, sum(CASE WHEN created THEN 1 ELSE 0 END) AS created
+        """
+        record = tx.run(query, rows=rows).single()
+        if not record:
+            return {"merged": 0, "created": 0}
+        return {"merged": int(record.get("merged") or 0), "created": int(record.get("created") or 0)}
+
+    @staticmethod
+    def _read_candidate_bias_state(tx, label: str, keys: List[str]) -> List[Dict[str, Any]]:
+        query = f"""
+        MATCH (n:{label})
+        WHERE n.key IN $keys AND n.bias_score IS NOT NULL
+        RETURN n.key AS key, coalesce(n.inferred_from_articles, false) AS inferred
+        """
+        return tx.run(query, keys=keys).data()
 
     def _build_article_relationships(self, candidates: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         by_type: Dict[str, List[Dict[str, Any]]] = {}
@@ -755,16 +1682,22 @@ class KnowledgeGraphScorer:
     ) -> Dict[str, Any]:
         known_bias_keys = set()
         unknown_candidates: List[Dict[str, Any]] = []
+        inferred_candidates: List[Dict[str, Any]] = []
+        created_labels = set()
 
         for candidate in candidates:
             result = session.execute_write(self._merge_candidate_node, candidate)
+            if result.get("created"):
+                created_labels.add(candidate["label"])
             if result.get("has_bias"):
                 known_bias_keys.add(candidate["key"])
+                if result.get("inferred"):
+                    inferred_candidates.append(candidate)
             else:
                 unknown_candidates.append(candidate)
 
         for rel in self._build_article_relationships(candidates):
-            session.execute_write(
+            created = session.execute_write(
                 self._merge_relationship,
                 rel["from"]["label"],
                 rel["from"]["key"],
@@ -773,12 +1706,97 @@ class KnowledgeGraphScorer:
                 rel["type"],
                 rel["weight"],
             )
+            if created:
+                created_labels.update((rel["from"]["label"], rel["to"]["label"]))
 
         return {
             "known_bias_keys": known_bias_keys,
             "unknown_candidates": unknown_candidates,
+            "inferred_candidates": inferred_candidates,
+            "created_labels": created_labels,
         }
 
+    def _queue_article_context(
+        self, session, candidates: List[Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        keys_by_label: Dict[str, List[str]] = {}
+        for candidate in candidates:
+            keys_by_label.setdefault(candidate["label"], []).append(candidate["key"])
+
+        known: Dict[tuple, bool] = {}
+        for label, keys in keys_by_label.items():
+            for row in session.execute_read(self._read_candidate_bias_state, label, keys):
+                known[(label, row["key"])] = bool(row.get("inferred"))
+
+        if self.graph_write_queue.is_full():
+            self._flush_write_queue(session, inline=True)
+        self.graph_write_queue.add(candidates, self._build_article_relationships(candidates))
+        return {
+            "known_bias_keys": {key for _, key in known},
+            "unknown_candidates": [
+                candidate for candidate in candidates if (candidate["label"], candidate["key"]) not in known
+            ],
+            "inferred_candidates": [
+                candidate for candidate in candidates if known.get((candidate["label"], candidate["key"]))
+            ],
+            "created_labels": set(),
+        }
+
+    def start_graph_writer(self) -> None:
+        if self._graph_version_worker is None:
+            self._graph_version_worker = PeriodicWorker(
+                "graph-version", self.graph_version_bump_seconds, self.flush_graph_version
+            )
+        self._graph_version_worker.start()
+        if self.graph_write_mode == "coalesced":
+            self.graph_write_queue.start(self.flush_graph_writes)
+        if self.graph_inference_mode == "deferred":
+            self.inference_buffer.start(self.flush_inference)
+
+    def stop_graph_writer(self) -> None:
+        self.graph_write_queue.stop()
+        self.inference_buffer.stop()
+        if self.graph_write_queue.pending_count():
+            self.flush_graph_writes()
+        if self.inference_buffer.pending_count():
+            self.flush_inference()
+        if self._graph_version_worker is not None:
+            self._graph_version_worker.stop()
+        self.flush_graph_version()
+
+    def _flush_write_queue(
+        self, session, queue: Optional[GraphWriteQueue] = None, inline: bool = False
+    ) -> Dict[str, Any]:
+        counts = (queue or self.graph_write_queue).flush(session, self, inline=inline)
+        if counts["labels"]:
+            counts["graph_version"] = self._bump_graph_version(session, counts["labels"])
+        return counts
+
+    def flush_graph_writes(self, queue: Optional[GraphWriteQueue] = None) -> Dict[str, Any]:
+        driver = self._get_driver()
+        if driver is None:
+            return {"nodes_merged": 0, "relationships_merged": 0, "nodes_inferred": 0}
+
+        self.ensure_schema()
+        with driver.session(database=self._session_database()) as session:
+            return self._flush_write_queue(session, queue)
+
+    def flush_inference(self) -> int:
+        driver = self._get_driver()
+        if driver is None:
+            return 0
+
+        self.ensure_schema()
+        with driver.session(database=self._session_database()) as session:
+            if self.graph_write_queue.pending_count():
+                self._flush_write_queue(session)
+            result = self.inference_buffer.flush(session, self)
+            if result["nodes_updated"]:
+                self._bump_graph_version(session, result["labels"])
+        if result["error"] is not None:
+            raise result["error"]
+        return result["nodes_updated"]
+
     @staticmethod
     def _update_inferred_node_bias(
         tx,
@@ -810,6 +1828,92 @@ class KnowledgeGraphScorer:
         ).single()
         return int(record.get("updated_count") or 0) if record else 0
 
+    @staticmethod
+    def _update_inferred_nodes_batch(tx, label: str, rows: List[Dict[str, Any]]) -> int:
+        query = f"""
+        UNWIND $rows AS row
+        MATCH (n:{label} {{key: row.key}})
+        WHERE n.bias_score IS NULL
+        SET
+            n.bias_score = row.score,
+            n.bias_confidence = row.confidence,
+            n.bias_label = row.bias_label,
+            n.inferred_from_articles = true,
+            n.inference_model = "graph-inference-v1",
+            n.source = coalesce(n.source, "article_inference"),
+            n.updated_at = datetime()
+        RETURN count(n) AS updated_count
+        """
+        record = tx.run(query, rows=rows).single()
+        return int(record.get("updated_count") or 0) if record else 0
+
+    @staticmethod
+    def _apply_inference_observations_batch(tx, label: str, rows: List[Dict[str, Any]]) -> int:
+        query = f"""
+        UNWIND $rows AS row
+        MATCH (n:{label} {{key: row.key}})
+        WHERE n.bias_score IS NULL OR n.inferred_from_articles = true
+        SET
+            n.inference_weight_sum = coalesce(n.inference_weight_sum, 0.0) + row.weight_sum,
+            n.inference_weighted_sum = coalesce(n.inference_weighted_sum, 0.0) + row.weighted_sum,
+            n.inference_confidence_sum = coalesce(n.inference_confidence_sum, 0.0) + row.confidence_weighted_sum,
+            n.inference_observations = coalesce(n.inference_observations, 0) + toInteger(row.observations)
+        WITH n,
+             n.inference_weighted_sum / n.inference_weight_sum AS raw_score,
+             n.inference_confidence_sum / n.inference_weight_sum AS mean_confidence
+        WITH n,
+             CASE WHEN raw_score < -1.0 THEN -1.0 WHEN raw_score > 1.0 THEN 1.0 ELSE raw_score END AS score,
+             CASE
+               WHEN 0.20 + 0.55 * mean_confidence < 0.15 THEN 0.15
+               WHEN 0.20 + 0.55 * mean_confidence > 0.85 THEN 0.85
+               ELSE 0.20 + 0.55 * mean_confidence
+             END AS confidence
+        SET
+            n.bias_score = score,
+            n.bias_confidence = confidence,
+            n.bias_label = CASE
+              WHEN score <= -0.75 THEN "Left"
+              WHEN score <= -0.25 THEN "Lean Left"
+              WHEN score < 0.25 THEN "Center"
+              WHEN score < 0.75 THEN "Lean Right"
+              ELSE "Right"
+            END,
+            n.inferred_from_articles = true,
+            n.inference_model = "graph-inference-v2",
+            n.source = coalesce(n.source, "article_inference"),
+            n.updated_at = datetime()
+        RETURN count(n) AS updated_count
+        """
+        record = tx.run(query, rows=rows).single()
+        return int(record.get("updated_count") or 0) if record else 0
+
+    def _record_inference_observations(
+        self,
+        candidates: List[Dict[str, Any]],
+        per_candidate_rollup: Dict[str, Dict[str, float]],
+        default_score: float,
+        default_confidence: float,
+    ) -> int:
+        for candidate in candidates:
+            rollup = per_candidate_rollup.get(candidate["key"], {})
+            weight_sum = float(rollup.get("weight_sum", 0.0))
+            if weight_sum > 0:
+                observation = {
+                    "weight_sum": weight_sum,
+                    "weighted_sum": float(rollup.get("weighted_sum", 0.0)),
+                    "confidence_weighted_sum": float(rollup.get("confidence_weighted_sum", 0.0)),
+                }
+            else:
+                fallback_confidence = clamp(default_confidence * 0.7, 0.0, 1.0)
+                observation = {
+                    "weight_sum": INFERENCE_FALLBACK_WEIGHT,
+                    "weighted_sum": clamp(default_score, -1.0, 1.0) * INFERENCE_FALLBACK_WEIGHT,
+                    "confidence_weighted_sum": fallback_confidence * INFERENCE_FALLBACK_WEIGHT,
+                }
+            observation["observations"] = 1
+            self.inference_buffer.add(candidate["label"], candidate["key"], observation)
+        return len(candidates)
+
     def _persist_unknown_inference(
         self,
         session,
@@ -836,6 +1940,19 @@ class KnowledgeGraphScorer:
                 inferred_score = clamp(default_score, -1.0, 1.0)
                 inferred_confidence = clamp(default_confidence * 0.7, 0.12, 0.65)
 
+            if self.graph_write_mode == "coalesced":
+                self.graph_write_queue.add_inference(
+                    candidate["label"],
+                    candidate["key"],
+                    {
+                        "score": inferred_score,
+                        "confidence": inferred_confidence,
+                        "bias_label": score_to_allsides_label(inferred_score),
+                    },
+                )
+                updates += 1
+                continue
+
             updates += session.execute_write(
                 self._update_inferred_node_bias,
                 candidate["label"],
@@ -846,6 +1963,226 @@ class KnowledgeGraphScorer:
             )
         return updates
 
+    def _aggregate_graph_evidence(
+        self,
+        candidates: List[Dict[str, Any]],
+        node_data_list: List[Optional[Dict[str, Any]]],
+        known_bias_keys: set,
+    ) -> Dict[str, Any]:
+        available_weight = 0.0
+        weighted_parts: List[np.ndarray] = []
+        confidence_parts: List[np.ndarray] = []
+        contribution_parts: List[np.ndarray] = []
+        rollup_parts: Dict[str, List[Dict[str, Any]]] = {}
+        evidence_blocks: List[Tuple[Dict[str, Any], Dict[str, Any]]] = []
+        labels = set()
+        traversal: Optional[Dict[str, Any]] = None
+
+        for candidate, node_data in zip(candidates, node_data_list):
+            if not node_data:
+                continue
+
+            candidate_key = candidate["key"]
+            labels.add(candidate["label"])
+            traversal_stats = node_data.get("traversal")
+            if traversal_stats is not None:
+                if traversal is None:
+                    traversal = {
+                        "paths_explored": 0,
+                        "fanout_truncated": 0,
+                        "beam_truncated": 0,
+                        "weight_pruned": 0,
+                        "truncated": False,
+                        "truncated_sources": [],
+                    }
+                for field in ("paths_explored", "fanout_truncated", "beam_truncated", "weight_pruned"):
+                    traversal[field] += int(traversal_stats.get(field) or 0)
+                if traversal_stats.get("truncated"):
+                    traversal["truncated"] = True
+                    traversal["truncated_sources"].append(candidate["name"])
+            has_related_evidence = False
+
+            node_score = parse_float(node_data.get("bias_score"))
+            node_confidence = clamp(
+                parse_float(node_data.get("bias_confidence"), 0.65) or 0.65,
+                0.0,
+                1.0,
+            )
+            node_importance = max(
+                0.0,
+                parse_float(
+                    node_data.get("importance_weight"),
+                    DEFAULT_NODE_IMPORTANCE.get(candidate["label"], 0.5),
+                )
+                or DEFAULT_NODE_IMPORTANCE.get(candidate["label"], 0.5),
+            )
+
+            if node_score is not None:
+                available_weight += candidate["base_weight"]
+                contribution_weight = candidate["base_weight"] * node_importance
+                weighted_score = float(node_score) * contribution_weight
+                weighted_parts.append(np.array([weighted_score]))
+                confidence_parts.append(np.array([node_confidence * contribution_weight]))
+                contribution_parts.append(np.array([contribution_weight]))
+                has_related_evidence = True
+
+                evidence_blocks.append(
+                    (
+                        candidate,
+                        {
+                            "rows": [node_data],
+                            "index": np.array([0]),
+                            "hops": np.array([0]),
+                            "bias_score": np.array([float(node_score)]),
+                            "confidence": np.array([node_confidence]),
+                            "relationship_weight": None,
+                            "contribution_weight": np.array([contribution_weight]),
+                            "weighted_score": np.array([weighted_score]),
+                        },
+                    )
+                )
+
+            related = related_columns(node_data.get("related") or [], candidate["base_weight"])
+            if related is not None:
+                weighted_parts.append(related["weighted_score"])
+                confidence_parts.append(related["confidence_weighted"])
+                contribution_parts.append(related["contribution_weight"])
+                rollup_parts.setdefault(candidate_key, []).append(related)
+                labels.update(related["labels"])
+                evidence_blocks.append((candidate, related))
+                has_related_evidence = True
+
+            if candidate_key not in known_bias_keys and has_related_evidence:
+                available_weight += candidate["base_weight"] * 0.6
+
+        per_candidate_rollup: Dict[str, Dict[str, float]] = {}
+        for candidate_key, parts in rollup_parts.items():
+            per_candidate_rollup[candidate_key] = {
+                "weight_sum": sequential_sum([part["contribution_weight"] for part in parts]),
+                "weighted_sum": sequential_sum([part["weighted_score"] for part in parts]),
+                "confidence_weighted_sum": sequential_sum([part["confidence_weighted"] for part in parts]),
+            }
+
+        return {
+            "available_weight": available_weight,
+            "total_contribution_weight": sequential_sum(contribution_parts),
+            "weighted_score_sum": sequential_sum(weighted_parts),
+            "weighted_confidence_sum": sequential_sum(confidence_parts),
+            "evidence": evidence_blocks,
+            "per_candidate_rollup": per_candidate_rollup,
+            "labels": labels,
+            "traversal": traversal,
+        }
+
+    @staticmethod
+    def _summarize_graph_evidence(aggregate: Dict[str, Any], requested_weight: float) -> Dict[str, Any]:
+        total_contribution_weight = aggregate["total_contribution_weight"]
+        coverage_ratio = clamp(
+            aggregate["available_weight"] / requested_weight if requested_weight > 0 else 0.0,
+            0.0,
+            1.0,
+        )
+
+        if total_contribution_weight <= 0:
+            return {
+                "status": "no_graph_match",
+                "score": 0.0,
+                "confidence": clamp(0.2 + 0.3 * coverage_ratio, 0.1, 0.5),
+                "coverage_ratio": coverage_ratio,
+            }
+
+        graph_score = clamp(aggregate["weighted_score_sum"] / total_contribution_weight, -1.0, 1.0)
+        mean_confidence = clamp(aggregate["weighted_confidence_sum"] / total_contribution_weight, 0.0, 1.0)
+        return {
+            "status": "ok",
+            "score": graph_score,
+            "confidence": clamp(
+                0.15 + (0.45 * coverage_ratio) + (0.40 * mean_confidence),
+                0.05,
+                0.95,
+            ),
+            "coverage_ratio": coverage_ratio,
+        }
+
+    @staticmethod
+    def _build_graph_signal(
+        aggregate: Dict[str, Any],
+        summary: Dict[str, Any],
+        requested_weight: float,
+        inferred_unknown_nodes: int,
+    ) -> Dict[str, Any]:
+        if summary["status"] == "no_graph_match":
+            return {
+                "label": "Center",
+                "score": 0.0,
+                "confidence": summary["confidence"],
+                "coverage_ratio": round(summary["coverage_ratio"], 4),
+                "available_weight": round(aggregate["available_weight"], 6),
+                "requested_weight": round(requested_weight, 6),
+                "status": "no_graph_match",
+                "model_version": "neo4j-knowledge-graph-v1",
+                "predicted_at": utc_now(),
+                "evidence": [],
+                "inferred_unknown_nodes": inferred_unknown_nodes,
+            }
+
+        top_evidence = top_evidence_items(aggregate["evidence"], EVIDENCE_TOP_K)
+
+        return {
+            "label": score_to_three_class_label(summary["score"]),
+            "score": round(summary["score"], 6),
+            "confidence": round(summary["confidence"], 6),
+            "coverage_ratio": round(summary["coverage_ratio"], 4),
+            "available_weight": round(aggregate["available_weight"], 6),
+            "requested_weight": round(requested_weight, 6),
+            "status": summary["status"],
+            "model_version": "neo4j-knowledge-graph-v1",
+            "predicted_at": utc_now(),
+            "evidence": top_evidence,
+            "inferred_unknown_nodes": inferred_unknown_nodes,
+        }
+
+    def _attach_traversal(self, graph_signal: Dict[str, Any], aggregate: Dict[str, Any]) -> Dict[str, Any]:
+        traversal = self._traversal_settings()
+        if traversal is not None:
+            graph_signal["traversal"] = {"mode": "pruned", **traversal, **(aggregate.get("traversal") or {})}
+        return graph_signal
+
+    @staticmethod
+    def _signal_labels(aggregate: Dict[str, Any], candidates: List[Dict[str, Any]]) -> List[str]:
+        return sorted(set(aggregate["labels"]).union(candidate["label"] for candidate in candidates))
+
+    def _evaluate_snapshot_signal(
+        self, snapshot: GraphSnapshot, candidates: List[Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        relationships = self._build_article_relationships(candidates)
+        known_bias_keys = set()
+        for candidate in candidates:
+            index = snapshot.find_node(candidate["label"], candidate["key"])
+            if index is not None and snapshot.node_properties(index).get("bias_score") is not None:
+                known_bias_keys.add(candidate["key"])
+
+        traversal = self._traversal_settings()
+        node_data_list = [
+            snapshot.fetch_node_with_neighbors(
+                candidate["label"],
+                candidate["key"],
+                DEFAULT_NODE_IMPORTANCE.get(candidate["label"], 0.5),
+                candidates=candidates,
+                relationships=relationships,
+                traversal=traversal,
+            )
+            for candidate in candidates
+        ]
+        requested_weight = sum(item["base_weight"] for item in candidates)
+        aggregate = self._aggregate_graph_evidence(candidates, node_data_list, known_bias_keys)
+        summary = self._summarize_graph_evidence(aggregate, requested_weight)
+        graph_signal = self._build_graph_signal(aggregate, summary, requested_weight, 0)
+        graph_signal["graph_source"] = "snapshot"
+        graph_signal["graph_version"] = snapshot.graph_version
+        graph_signal["graph_labels"] = self._signal_labels(aggregate, candidates)
+        return self._attach_traversal(graph_signal, aggregate)
+
     def evaluate_graph_signal(self, metadata: Dict[str, Any]) -> Dict[str, Any]:
         candidates = self._build_candidate_entities(metadata)
         if not candidates:
@@ -865,6 +2202,9 @@ class KnowledgeGraphScorer:
 
         driver = self._get_driver()
         if driver is None:
+            snapshot = self.get_snapshot()
+            if snapshot is not None:
+                return self._evaluate_snapshot_signal(snapshot, candidates)
             return {
                 "label": "Center",
                 "score": 0.0,
@@ -882,216 +2222,59 @@ class KnowledgeGraphScorer:
         self.ensure_schema()
 
         requested_weight = sum(item["base_weight"] for item in candidates)
-        available_weight = 0.0
-        total_contribution_weight = 0.0
-        weighted_score_sum = 0.0
-        weighted_confidence_sum = 0.0
-        evidence: List[Dict[str, Any]] = []
-        per_candidate_rollup: Dict[str, Dict[str, float]] = {}
-        graph_status = "ok"
-        graph_score = 0.0
-        graph_confidence = 0.2
-        coverage_ratio = 0.0
-        inferred_unknown_nodes = 0
+        started = time.perf_counter()
+        scoring_path = "full"
 
+        graph_version = self.get_graph_version()
         with driver.session(database=self._session_database()) as session:
-            context = self._ensure_article_context(session, candidates)
-            known_bias_keys = context["known_bias_keys"]
-            unknown_candidates = context["unknown_candidates"]
-
-            for candidate in candidates:
-                node_data = session.execute_read(
-                    self._fetch_node_with_neighbors,
-                    candidate["label"],
-                    candidate["key"],
-                    DEFAULT_NODE_IMPORTANCE.get(candidate["label"], 0.5),
-                )
-                if not node_data:
-                    continue
-
-                candidate_key = candidate["key"]
-                has_related_evidence = False
-
-                node_score = parse_float(node_data.get("bias_score"))
-                node_confidence = clamp(
-                    parse_float(node_data.get("bias_confidence"), 0.65) or 0.65,
-                    0.0,
-                    1.0,
-                )
-                node_importance = max(
-                    0.0,
-                    parse_float(
-                        node_data.get("importance_weight"),
-                        DEFAULT_NODE_IMPORTANCE.get(candidate["label"], 0.5),
-                    )
-                    or DEFAULT_NODE_IMPORTANCE.get(candidate["label"], 0.5),
-                )
-
-                if node_score is not None:
-                    available_weight += candidate["base_weight"]
-                    contribution_weight = candidate["base_weight"] * node_importance
-                    weighted_score = float(node_score) * contribution_weight
-                    weighted_score_sum += weighted_score
-                    weighted_confidence_sum += node_confidence * contribution_weight
-                    total_contribution_weight += contribution_weight
-                    has_related_evidence = True
-
-                    rollup = per_candidate_rollup.setdefault(
-                        candidate_key,
-                        {"weight_sum": 0.0, "weighted_sum": 0.0, "confidence_weighted_sum": 0.0},
-                    )
-                    rollup["weight_sum"] += contribution_weight
-                    rollup["weighted_sum"] += weighted_score
-                    rollup["confidence_weighted_sum"] += node_confidence * contribution_weight
-
-                    evidence.append(
-                        {
-                            "source_key": candidate_key,
-                            "source_entity": candidate["name"],
-                            "source_type": candidate["entity_type"],
-                            "matched_node": node_data.get("node_name"),
-                            "matched_type": node_data.get("node_type"),
-                            "path_hops": 0,
-                            "bias_score": float(node_score),
-                            "confidence": node_confidence,
-                            "contribution_weight": round(contribution_weight, 6),
-                            "weighted_contribution": round(weighted_score, 6),
-                        }
-                    )
-
-                for related in node_data.get("related", []):
-                    related_score = parse_float(related.get("bias_score"))
-                    if related_score is None:
-                        continue
-
-                    related_confidence = clamp(
-                        parse_float(related.get("bias_confidence"), 0.55) or 0.55,
-                        0.0,
-                        1.0,
-                    )
-                    related_importance = max(
-                        0.0,
-                        parse_float(related.get("importance_weight"), 0.35) or 0.35,
-                    )
-                    relationship_weight = max(
-                        0.0,
-                        parse_float(related.get("relationship_weight"), 0.75) or 0.75,
-                    )
-                    hops = int(related.get("hops") or 1)
-                    hop_decay = 0.55 if hops <= 1 else 0.35
-
-                    contribution_weight = (
-                        candidate["base_weight"]
-                        * related_importance
-                        * relationship_weight
-                        * hop_decay
-                    )
-                    if contribution_weight <= 0:
-                        continue
-
-                    weighted_score = float(related_score) * contribution_weight
-                    weighted_score_sum += weighted_score
-                    weighted_confidence_sum += related_confidence * contribution_weight
-                    total_contribution_weight += contribution_weight
-                    has_related_evidence = True
-
-                    rollup = per_candidate_rollup.setdefault(
-                        candidate_key,
-                        {"weight_sum": 0.0, "weighted_sum": 0.0, "confidence_weighted_sum": 0.0},
-                    )
-                    rollup["weight_sum"] += contribution_weight
-                    rollup["weighted_sum"] += weighted_score
-                    rollup["confidence_weighted_sum"] += related_confidence * contribution_weight
-
-                    evidence.append(
-                        {
-                            "source_key": candidate_key,
-                            "source_entity": candidate["name"],
-                            "source_type": candidate["entity_type"],
-                            "matched_node": related.get("node_name"),
-                            "matched_type": related.get("node_type"),
-                            "path_hops": hops,
-                            "bias_score": float(related_score),
-                            "confidence": related_confidence,
-                            "relationship_weight": round(relationship_weight, 6),
-                            "contribution_weight": round(contribution_weight, 6),
-                            "weighted_contribution": round(weighted_score, 6),
-                        }
-                    )
-
-                if candidate_key in known_bias_keys:
-                    available_weight += 0.0
-                elif has_related_evidence:
-                    available_weight += candidate["base_weight"] * 0.6
-
-            coverage_ratio = clamp(
-                available_weight / requested_weight if requested_weight > 0 else 0.0,
-                0.0,
-                1.0,
+            if self.graph_write_mode == "coalesced":
+                context = self._queue_article_context(session, candidates)
+            else:
+                context = self._ensure_article_context(session, candidates)
+
+            changed_labels = set(context["created_labels"])
+            node_data_list = None
+            if self.graph_scoring_mode == "adaptive":
+                node_data_list = self._probe_fast_path(session, candidates, requested_weight)
+                scoring_path = "fast_path" if node_data_list is not None else "fast_path_miss"
+            if node_data_list is None:
+                node_data_list = self._fetch_candidate_nodes(session, candidates)
+            aggregate = self._aggregate_graph_evidence(
+                candidates, node_data_list, context["known_bias_keys"]
             )
-
-            if total_contribution_weight <= 0:
-                graph_status = "no_graph_match"
-                graph_score = 0.0
-                graph_confidence = clamp(0.2 + 0.3 * coverage_ratio, 0.1, 0.5)
+            summary = self._summarize_graph_evidence(aggregate, requested_weight)
+            if scoring_path == "fast_path" and summary["status"] == "ok":
+                summary["status"] = "ok_fast_path"
+
+            if scoring_path == "fast_path":
+                inferred_unknown_nodes = 0
+            elif self.graph_inference_mode == "deferred":
+                inferred_unknown_nodes = self._record_inference_observations(
+                    candidates=context["unknown_candidates"] + context["inferred_candidates"],
+                    per_candidate_rollup=aggregate["per_candidate_rollup"],
+                    default_score=summary["score"],
+                    default_confidence=summary["confidence"],
+                )
             else:
-                graph_score = clamp(weighted_score_sum / total_contribution_weight, -1.0, 1.0)
-                mean_confidence = clamp(weighted_confidence_sum / total_contribution_weight, 0.0, 1.0)
-                graph_confidence = clamp(
-                    0.15 + (0.45 * coverage_ratio) + (0.40 * mean_confidence),
-                    0.05,
-                    0.95,
+                inferred_unknown_nodes = self._persist_unknown_inference(
+                    session=session,
+                    unknown_candidates=context["unknown_candidates"],
+                    per_candidate_rollup=aggregate["per_candidate_rollup"],
+                    default_score=summary["score"],
+                    default_confidence=summary["confidence"],
                 )
-
-            inferred_unknown_nodes = self._persist_unknown_inference(
-                session=session,
-                unknown_candidates=unknown_candidates,
-                per_candidate_rollup=per_candidate_rollup,
-                default_score=graph_score,
-                default_confidence=graph_confidence,
-            )
-
-        if total_contribution_weight <= 0:
-            coverage_ratio = clamp(
-                available_weight / requested_weight if requested_weight > 0 else 0.0,
-                0.0,
-                1.0,
-            )
-            return {
-                "label": "Center",
-                "score": 0.0,
-                "confidence": clamp(0.2 + 0.3 * coverage_ratio, 0.1, 0.5),
-                "coverage_ratio": round(coverage_ratio, 4),
-                "available_weight": round(available_weight, 6),
-                "requested_weight": round(requested_weight, 6),
-                "status": "no_graph_match",
-                "model_version": "neo4j-knowledge-graph-v1",
-                "predicted_at": utc_now(),
-                "evidence": [],
-                "inferred_unknown_nodes": inferred_unknown_nodes,
-            }
-
-        top_evidence = sorted(
-            evidence,
-            key=lambda item: abs(item.get("weighted_contribution", 0.0)),
-            reverse=True,
-        )[:15]
-        for item in top_evidence:
-            item.pop("source_key", None)
-
-        return {
-            "label": score_to_three_class_label(graph_score),
-            "score": round(graph_score, 6),
-            "confidence": round(graph_confidence, 6),
-            "coverage_ratio": round(coverage_ratio, 4),
-            "available_weight": round(available_weight, 6),
-            "requested_weight": round(requested_weight, 6),
-            "status": graph_status,
-            "model_version": "neo4j-knowledge-graph-v1",
-            "predicted_at": utc_now(),
-            "evidence": top_evidence,
-            "inferred_unknown_nodes": inferred_unknown_nodes,
-        }
+                if inferred_unknown_nodes and self.graph_write_mode != "coalesced":
+                    changed_labels.update(candidate["label"] for candidate in context["unknown_candidates"])
+            if changed_labels:
+                self._defer_graph_version_bump(changed_labels)
+
+        graph_signal = self._build_graph_signal(aggregate, summary, requested_weight, inferred_unknown_nodes)
+        graph_signal["graph_version"] = graph_version
+        graph_signal["graph_labels"] = self._signal_labels(aggregate, candidates)
+        self._record_scoring_path(scoring_path, time.perf_counter() - started)
+        if scoring_path == "fast_path":
+            return graph_signal
+        return self._attach_traversal(graph_signal, aggregate)
 
     def estimate_ml_signal(self, metadata: Dict[str, Any]) -> Dict[str, Any]:
         content = str(metadata.get("content", ""))
@@ -1142,7 +2325,7 @@ class KnowledgeGraphScorer:
             * graph_confidence
         )
         graph_weight = self.graph_weight
-        if graph_status != "ok":
+        if graph_status not in GRAPH_OK_STATUSES:
             graph_weight = 0.0
         else:
             graph_weight = graph_weight * clamp(graph_quality + 0.2, 0.2, 1.0)
@@ -1222,10 +2405,17 @@ class KnowledgeGraphScorer:
             "predicted_at": utc_now(),
         }
 
-    def compute_article_bias(self, metadata: Dict[str, Any]) -> Dict[str, Any]:
+    def compute_article_bias(
+        self,
+        metadata: Dict[str, Any],
+        ml_signal: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
         graph_signal = self.evaluate_graph_signal(metadata)
+        if "graph_version" not in graph_signal:
+            graph_signal["graph_version"] = self.get_graph_version()
         if self.enable_ml_model:
-            ml_signal = self.estimate_ml_signal(metadata)
+            if ml_signal is None:
+                ml_signal = self.estimate_ml_signal(metadata)
             classification = self.combine_signals(ml_signal, graph_signal)
         else:
             ml_signal = self.ml_disabled_signal()
@@ -1,22 +1,96 @@
 from datetime import datetime, timezone
+import hashlib
+import json
 import os
+import re
 from typing import Any, Dict, List, Optional
 
 from bson import ObjectId
 from dotenv import load_dotenv
-from fastapi import FastAPI, HTTPException, Query
+from fastapi import FastAPI, Header, HTTPException, Query, Response
 from pydantic import BaseModel, ConfigDict, Field
-from pymongo import ASCENDING, MongoClient, ReturnDocument, TEXT
-
-from backend.knowledge_graph import KnowledgeGraphScorer, normalize_text, unique_non_empty
+from pymongo import ASCENDING, MongoClient, ReturnDocument, TEXT, UpdateOne
+
+from backend.background import PeriodicWorker
+from backend.bias_rollups import ROLLUP_ENTITY_TYPES, ROLLUP_INDEX_KEYS, apply_rollup_changes, query_bias_trends
+from backend.cold_storage import ColdStorage, search_text_fields
+from backend.knowledge_graph import (
+    KnowledgeGraphScorer,
+    normalize_text,
+    parse_float,
+    unique_non_empty,
+)
+from backend.engagement import EngagementBuffer
+from backend.entity_extraction import TOPIC_STOPWORDS, EntityExtractor
+from backend.entity_resolution import AliasIndex
+from backend.entity_index import SUGGESTION_ENTITY_TYPES, SuggestionIndex
+from backend.near_duplicates import build_fingerprint, find_near_duplicates
+from backend.query_cache import QueryResultCache, build_cache_key, etag_matches
+from backend.scoring_cache import ScoringCache
+from backend.similar_articles import EntityInvertedIndex
 
 app = FastAPI(title="Political News Bias API")
 
 load_dotenv()
 MONGO_URI = os.getenv("MONGO_URI")
 _INDEXES_READY = False
+ARTICLE_TEXT_INDEX_KEYS = [("title", TEXT), ("search_text", TEXT), ("keywords", TEXT)]
 
 kg_scorer = KnowledgeGraphScorer()
+query_cache = QueryResultCache(
+    max_entries=int(parse_float(os.getenv("QUERY_CACHE_MAX_ENTRIES"), 256) or 0),
+    ttl_seconds=parse_float(os.getenv("QUERY_CACHE_TTL_SECONDS"), 30.0) or 0.0,
+)
+engagement_buffer = EngagementBuffer(
+    flush_interval_seconds=parse_float(os.getenv("ENGAGEMENT_FLUSH_SECONDS"), 5.0) or 5.0,
+    max_pending_articles=int(parse_float(os.getenv("ENGAGEMENT_MAX_PENDING_ARTICLES"), 5000) or 5000),
+    max_buffered_articles=int(parse_float(os.getenv("ENGAGEMENT_MAX_BUFFERED_ARTICLES"), 100000) or 100000),
+    max_retries=int(parse_float(os.getenv("ENGAGEMENT_MAX_RETRIES"), 3) or 0),
+)
+scoring_cache = ScoringCache(
+    max_entries=int(parse_float(os.getenv("SCORING_CACHE_MAX_ENTRIES"), 2048) or 0),
+    persist=os.getenv("SCORING_CACHE_PERSIST", "false").strip().lower() in {"1", "true", "yes", "on"},
+)
+NEAR_DUPLICATE_THRESHOLD = parse_float(os.getenv("NEAR_DUPLICATE_THRESHOLD"), 0.8) or 0.8
+REUSE_DUPLICATE_ML_SIGNAL = (
+    os.getenv("REUSE_DUPLICATE_ML_SIGNAL", "false").strip().lower() in {"1", "true", "yes", "on"}
+)
+SCORING_CACHE_TTL_SECONDS = int(parse_float(os.getenv("SCORING_CACHE_TTL_SECONDS"), 604800) or 604800)
+similar_index = EntityInvertedIndex(
+    max_postings_scanned=int(parse_float(os.getenv("SIMILAR_MAX_POSTINGS_SCANNED"), 2000) or 2000),
+    refresh_seconds=parse_float(os.getenv("SIMILAR_REFRESH_SECONDS"), 60.0) or 60.0,
+)
+suggestion_index = SuggestionIndex(
+    refresh_seconds=parse_float(os.getenv("SUGGEST_REFRESH_SECONDS"), 60.0) or 60.0,
+    rebuild_seconds=parse_float(os.getenv("SUGGEST_REBUILD_SECONDS"), 3600.0) or 3600.0,
+)
+cold_storage = ColdStorage(
+    age_days=parse_float(os.getenv("COLD_STORAGE_AGE_DAYS"), 180.0) or 0.0,
+    gridfs_min_bytes=int(parse_float(os.getenv("COLD_STORAGE_GRIDFS_MIN_BYTES"), 4194304) or 4194304),
+    batch_size=int(parse_float(os.getenv("COLD_STORAGE_BATCH_SIZE"), 200) or 200),
+)
+COLD_STORAGE_INTERVAL_SECONDS = parse_float(os.getenv("COLD_STORAGE_INTERVAL_SECONDS"), 3600.0) or 3600.0
+ENABLE_ENTITY_EXTRACTION = (
+    os.getenv("ENABLE_ENTITY_EXTRACTION", "false").strip().lower() in {"1", "true", "yes", "on"}
+)
+entity_extractor = EntityExtractor(
+    refresh_seconds=parse_float(os.getenv("ENTITY_EXTRACTION_REFRESH_SECONDS"), 300.0) or 300.0,
+    max_per_field=int(parse_float(os.getenv("ENTITY_EXTRACTION_MAX_PER_FIELD"), 25) or 25),
+    min_topic_length=int(parse_float(os.getenv("ENTITY_EXTRACTION_MIN_TOPIC_LENGTH"), 4) or 4),
+    topic_stopwords=TOPIC_STOPWORDS.union(
+        item.strip().lower() for item in os.getenv("ENTITY_EXTRACTION_TOPIC_STOPWORDS", "").split(",") if item.strip()
+    ),
+)
+ENABLE_ENTITY_RESOLUTION = (
+    os.getenv("ENABLE_ENTITY_RESOLUTION", "false").strip().lower() in {"1", "true", "yes", "on"}
+)
+alias_index = AliasIndex(
+    fuzzy=os.getenv("ENTITY_RESOLUTION_FUZZY", "false").strip().lower() in {"1", "true", "yes", "on"},
+    fuzzy_threshold=parse_float(os.getenv("ENTITY_RESOLUTION_FUZZY_THRESHOLD"), 0.8) or 0.8,
+    refresh_seconds=parse_float(os.getenv("ENTITY_RESOLUTION_REFRESH_SECONDS"), 300.0) or 0.0,
+)
+if ENABLE_ENTITY_RESOLUTION:
+    kg_scorer.use_alias_index(alias_index)
 
 
 def utc_now() -> datetime:
@@ -32,6 +106,53 @@ def normalize_list(values: List[str]) -> List[str]:
     return unique_non_empty([item.strip() for item in values if item and item.strip()])
 
 
+def build_search_tokens(name: str, aliases: List[str]) -> List[str]:
+    tokens: List[str] = []
+    for value in [name] + list(aliases or []):
+        words = normalize_text(value or "").split()
+        for index in range(len(words)):
+            token = " ".join(words[index:])
+            if token not in tokens:
+                tokens.append(token)
+    return tokens
+
+
+def normalize_query_params(**params: Any) -> Dict[str, Any]:
+    normalized: Dict[str, Any] = {}
+    for name, value in params.items():
+        if isinstance(value, str):
+            value = value.strip()
+            if name in {"author", "publisher", "source", "q"}:
+                value = value.lower()
+        normalized[name] = value
+    if normalized.get("keyword"):
+        normalized["keyword"] = ",".join(normalize_keywords(normalized["keyword"].split(",")))
+    return normalized
+
+
+def cached_response(
+    namespace: str,
+    params: Dict[str, Any],
+    response: Optional[Response],
+    if_none_match: Optional[str],
+    compute,
+):
+    cache_key = build_cache_key(namespace, params)
+    cached = query_cache.get(cache_key)
+    if cached is not None:
+        payload, etag = cached
+    else:
+        generation = query_cache.generation
+        payload = compute()
+        etag = query_cache.put(cache_key, payload, generation)
+
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers={"ETag": etag})
+    if response is not None:
+        response.headers["ETag"] = etag
+    return payload
+
+
 def to_jsonable(value: Any) -> Any:
     if isinstance(value, ObjectId):
         return str(value)
@@ -91,6 +212,12 @@ class EngagementUpdateModel(BaseModel):
     views: Optional[int] = None
 
 
+class EngagementIncrementModel(BaseModel):
+    likes: int = Field(0, ge=0)
+    shares: int = Field(0, ge=0)
+    views: int = Field(0, ge=0)
+
+
 class CommentModel(BaseModel):
     user: str
     comment: str
@@ -153,11 +280,22 @@ def get_collections():
         "articles": db["articles"],
         "authors": db["authors"],
         "publishers": db["publishers"],
+        "comments": db["comments"],
+        "scoring_cache": db["scoring_cache"],
+        "article_fingerprints": db["article_fingerprints"],
+        "article_contents": db["article_contents"],
+        "bias_rollups": db["bias_rollups"],
     }
     ensure_indexes(collections)
     return collections, client
 
 
+def has_legacy_text_index(articles_collection) -> bool:
+    text_index = articles_collection.index_information().get("article_text_index") or {}
+    fields = set(text_index.get("weights") or {}) | {field for field, _ in text_index.get("key") or []}
+    return "content" in fields
+
+
 def ensure_indexes(collections):
     global _INDEXES_READY
     if _INDEXES_READY:
@@ -165,9 +303,11 @@ def ensure_indexes(collections):
 
     collections["authors"].create_index([("author_key", ASCENDING)], unique=True)
     collections["authors"].create_index([("name", ASCENDING)])
+    collections["authors"].create_index([("search_tokens", ASCENDING)])
 
     collections["publishers"].create_index([("publisher_key", ASCENDING)], unique=True)
     collections["publishers"].create_index([("name", ASCENDING)])
+    collections["publishers"].create_index([("search_tokens", ASCENDING)])
 
     collections["articles"].create_index([("author_id", ASCENDING)])
     collections["articles"].create_index([("publisher_id", ASCENDING)])
@@ -176,16 +316,50 @@ def ensure_indexes(collections):
     collections["articles"].create_index([("organizations", ASCENDING)])
     collections["articles"].create_index([("think_tanks", ASCENDING)])
     collections["articles"].create_index([("keywords", ASCENDING)])
-    collections["articles"].create_index(
-        [("title", TEXT), ("content", TEXT), ("keywords", TEXT)],
-        name="article_text_index",
+    collections["articles"].create_index([("created_at", ASCENDING), ("storage_tier", ASCENDING)])
+    if not has_legacy_text_index(collections["articles"]):
+        collections["articles"].create_index(ARTICLE_TEXT_INDEX_KEYS, name="article_text_index")
+
+    collections["comments"].create_index([("article_id", ASCENDING), ("_id", ASCENDING)])
+
+    collections["article_fingerprints"].create_index([("lsh_buckets", ASCENDING)])
+    collections["article_fingerprints"].create_index([("cluster_id", ASCENDING)])
+
+    collections["bias_rollups"].create_index(ROLLUP_INDEX_KEYS, unique=True)
+
+    collections["scoring_cache"].create_index(
+        [("created_at", ASCENDING)],
+        expireAfterSeconds=SCORING_CACHE_TTL_SECONDS,
     )
 
+    backfill_search_tokens(collections["authors"])
+    backfill_search_tokens(collections["publishers"])
+
     _INDEXES_READY = True
 
 
+def backfill_search_tokens(collection, batch_size: int = 500):
+    operations = []
+    for doc in collection.find({"search_tokens": {"$exists": False}}, {"name": 1, "aliases": 1}):
+        tokens = build_search_tokens(doc.get("name") or "", doc.get("aliases") or [])
+        operations.append(UpdateOne({"_id": doc["_id"]}, {"$set": {"search_tokens": tokens}}))
+        if len(operations) >= batch_size:
+            collection.bulk_write(operations, ordered=False)
+            operations = []
+    if operations:
+        collection.bulk_write(operations, ordered=False)
+
+
+def refresh_alias_index(collections) -> None:
+    if ENABLE_ENTITY_RESOLUTION and alias_index.needs_refresh():
+        alias_index.refresh(collections, kg_scorer)
+
+
 def resolve_author(authors_collection, author: AuthorModel) -> ObjectId:
     key = f"{normalize_text(author.name)}::{normalize_text(author.affiliation or '')}"
+    aliases = normalize_list(author.aliases)
+    if ENABLE_ENTITY_RESOLUTION:
+        alias_index.add("Author", author.name, author.name, aliases)
     now = utc_now()
     author_doc = authors_collection.find_one_and_update(
         {"author_key": key},
@@ -193,7 +367,8 @@ def resolve_author(authors_collection, author: AuthorModel) -> ObjectId:
             "$set": {
                 "name": author.name.strip(),
                 "affiliation": author.affiliation,
-                "aliases": normalize_list(author.aliases),
+                "aliases": aliases,
+                "search_tokens": build_search_tokens(author.name, aliases),
                 "updated_at": now,
             },
             "$setOnInsert": {
@@ -227,6 +402,26 @@ def resolve_publisher(
 
     key = normalize_text(name)
     now = utc_now()
+    if ENABLE_ENTITY_RESOLUTION:
+        resolved = alias_index.resolve("Publisher", name)
+        if resolved is not None and resolved["key"] != key:
+            canonical_doc = publishers_collection.find_one({"publisher_key": resolved["key"]})
+            if canonical_doc:
+                merged_aliases = normalize_list(list(canonical_doc.get("aliases") or []) + [name] + aliases)
+                merged_fields = {
+                    "aliases": merged_aliases,
+                    "search_tokens": build_search_tokens(canonical_doc["name"], merged_aliases),
+                    "updated_at": now,
+                }
+                if website and not canonical_doc.get("website"):
+                    merged_fields["website"] = website
+                if country and not canonical_doc.get("country"):
+                    merged_fields["country"] = country
+                publishers_collection.update_one({"_id": canonical_doc["_id"]}, {"$set": merged_fields})
+                alias_index.add("Publisher", resolved["key"], canonical_doc["name"], merged_aliases)
+                return canonical_doc["_id"]
+        alias_index.add("Publisher", key, name, aliases)
+
     publisher_doc = publishers_collection.find_one_and_update(
         {"publisher_key": key},
         {
@@ -235,6 +430,7 @@ def resolve_publisher(
                 "website": website,
                 "country": country,
                 "aliases": aliases,
+                "search_tokens": build_search_tokens(name, aliases),
                 "updated_at": now,
             },
             "$setOnInsert": {
@@ -248,7 +444,30 @@ def resolve_publisher(
     return publisher_doc["_id"]
 
 
+def build_comment_docs(article_id: ObjectId, comments: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    now = utc_now()
+    return [
+        {
+            "article_id": article_id,
+            "user": comment["user"],
+            "comment": comment["comment"],
+            "likes": comment.get("likes", 0),
+            "timestamp": comment["timestamp"],
+            "flags": comment.get("flags") or [],
+            "created_at": now,
+        }
+        for comment in comments
+    ]
+
+
+def detect_article_entities(title: str, content: str) -> Optional[Dict[str, List[str]]]:
+    if not ENABLE_ENTITY_EXTRACTION:
+        return None
+    return entity_extractor.extract(title or "", content or "")
+
+
 def build_scoring_context(article_data: Dict[str, Any], author_doc: Dict[str, Any], publisher_doc: Dict[str, Any]):
+    detected = article_data.get("detected_entities") or {}
     return {
         "title": article_data.get("title", ""),
         "content": article_data.get("content", ""),
@@ -256,15 +475,154 @@ def build_scoring_context(article_data: Dict[str, Any], author_doc: Dict[str, An
         "author": (author_doc or {}).get("name", ""),
         "publisher": (publisher_doc or {}).get("name", ""),
         "publisher_house": article_data.get("publisher_house") or "",
-        "organizations": article_data.get("organizations") or [],
-        "think_tanks": article_data.get("think_tanks") or [],
-        "keywords": article_data.get("keywords") or [],
+        "organizations": unique_non_empty(
+            list(article_data.get("organizations") or []) + list(detected.get("organizations") or [])
+        ),
+        "think_tanks": unique_non_empty(
+            list(article_data.get("think_tanks") or []) + list(detected.get("think_tanks") or [])
+        ),
+        "keywords": unique_non_empty(
+            list(article_data.get("keywords") or []) + list(detected.get("keywords") or [])
+        ),
         "topic_scores": article_data.get("topic_scores") or {},
     }
 
 
+SCORING_UPDATE_FIELDS = {
+    "title",
+    "content",
+    "category",
+    "author",
+    "publisher",
+    "source",
+    "publisher_house",
+    "organizations",
+    "think_tanks",
+    "keywords",
+    "topic_scores",
+}
+
+
+def scoring_fingerprint(scoring_context: Dict[str, Any]) -> str:
+    material = {"context": scoring_context, "settings": kg_scorer.scoring_settings()}
+    body = json.dumps(material, sort_keys=True, default=str).encode("utf-8")
+    return hashlib.sha256(body).hexdigest()
+
+
+def score_article(
+    scoring_context: Dict[str, Any],
+    collections,
+    fingerprint: Optional[str] = None,
+    ml_signal: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Any]:
+    fingerprint = fingerprint or scoring_fingerprint(scoring_context)
+    graph_version = kg_scorer.get_graph_version()
+    if graph_version is not None:
+        cached = scoring_cache.get(fingerprint, graph_version, collections["scoring_cache"])
+        if cached is not None:
+            return cached
+
+    bias_bundle = kg_scorer.compute_article_bias(scoring_context, ml_signal=ml_signal)
+    if graph_version is not None and bias_bundle["graph_signal"].get("status") != "neo4j_unavailable":
+        scoring_cache.put(fingerprint, graph_version, bias_bundle, collections["scoring_cache"])
+    return bias_bundle
+
+
+def detect_near_duplicates(collections, article_id: ObjectId, content: str):
+    content_fingerprint = build_fingerprint(article_id, content)
+    if not content_fingerprint:
+        return None, [], {"duplicate_cluster_id": None, "near_duplicate_of": None, "near_duplicate_similarity": None}
+
+    duplicates = find_near_duplicates(collections["article_fingerprints"], content_fingerprint, NEAR_DUPLICATE_THRESHOLD)
+    content_fingerprint["cluster_id"] = duplicates[0]["cluster_id"] if duplicates else article_id
+    return content_fingerprint, duplicates, {
+        "duplicate_cluster_id": content_fingerprint["cluster_id"],
+        "near_duplicate_of": duplicates[0]["article_id"] if duplicates else None,
+        "near_duplicate_similarity": duplicates[0]["similarity"] if duplicates else None,
+    }
+
+
+def reusable_duplicate_ml_signal(collections, duplicates: List[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    if not (REUSE_DUPLICATE_ML_SIGNAL and kg_scorer.enable_ml_model and duplicates):
+        return None
+    sibling = collections["articles"].find_one({"_id": duplicates[0]["article_id"]}, {"ml_signal": 1})
+    ml_signal = (sibling or {}).get("ml_signal") or {}
+    if ml_signal.get("status") == "disabled" or ml_signal.get("score") is None:
+        return None
+    if ml_signal.get("model_version") != kg_scorer.ml_model_version:
+        return None
+    return ml_signal
+
+
+def article_graph_entities(scoring_context: Dict[str, Any]) -> List[Dict[str, Any]]:
+    return [
+        {"key": entity_key, "weight": round(weight, 6)}
+        for entity_key, weight in kg_scorer.candidate_entity_weights(scoring_context).items()
+    ]
+
+
+def load_graph_entities(collections, article_id: ObjectId) -> Optional[List[Dict[str, Any]]]:
+    article = collections["articles"].find_one({"_id": article_id})
+    if not article:
+        return None
+    if article.get("graph_entities") is not None:
+        return article["graph_entities"]
+
+    author_doc = None
+    if article.get("author_id"):
+        author_doc = collections["authors"].find_one({"_id": article["author_id"]})
+    publisher_doc = None
+    if article.get("publisher_id"):
+        publisher_doc = collections["publishers"].find_one({"_id": article["publisher_id"]})
+
+    entities = article_graph_entities(
+        build_scoring_context(article, author_doc or {}, publisher_doc or {})
+    )
+    collections["articles"].update_one({"_id": article_id}, {"$set": {"graph_entities": entities}})
+    return entities
+
+
+def load_graph_entities_many(collections, article_ids: List[ObjectId]) -> Dict[ObjectId, List[Dict[str, Any]]]:
+    articles = list(collections["articles"].find({"_id": {"$in": article_ids}}))
+    author_ids = list({article["author_id"] for article in articles if article.get("author_id")})
+    publisher_ids = list({article["publisher_id"] for article in articles if article.get("publisher_id")})
+    authors = {doc["_id"]: doc for doc in collections["authors"].find({"_id": {"$in": author_ids}})}
+    publishers = {doc["_id"]: doc for doc in collections["publishers"].find({"_id": {"$in": publisher_ids}})}
+
+    loaded = {}
+    operations = []
+    for article in articles:
+        entities = article.get("graph_entities")
+        if entities is None:
+            entities = article_graph_entities(
+                build_scoring_context(
+                    article,
+                    authors.get(article.get("author_id")) or {},
+                    publishers.get(article.get("publisher_id")) or {},
+                )
+            )
+            operations.append(UpdateOne({"_id": article["_id"]}, {"$set": {"graph_entities": entities}}))
+        loaded[article["_id"]] = entities
+    if operations:
+        collections["articles"].bulk_write(operations, ordered=False)
+    return loaded
+
+
+def index_article_suggestions(
+    article: Dict[str, Any],
+    author_doc: Optional[Dict[str, Any]],
+    publisher_doc: Optional[Dict[str, Any]],
+):
+    if author_doc:
+        suggestion_index.add("author", author_doc.get("name"), author_doc.get("aliases") or [])
+    if publisher_doc:
+        suggestion_index.add("publisher", publisher_doc.get("name"), publisher_doc.get("aliases") or [])
+    suggestion_index.add_article(article)
+
+
 def hydrate_article(doc: Dict[str, Any], collections) -> Dict[str, Any]:
     article = dict(doc)
+    cold_storage.rehydrate(collections, [article])
     author = None
     publisher = None
 
@@ -280,6 +638,26 @@ def hydrate_article(doc: Dict[str, Any], collections) -> Dict[str, Any]:
     return to_jsonable(article)
 
 
+def match_entity_ids(collection, entity_type: str, value: str) -> List[ObjectId]:
+    normalized = normalize_text(value)
+    if not normalized:
+        return []
+
+    if entity_type == "author":
+        exact_query = {"author_key": {"$regex": f"^{re.escape(normalized)}::"}}
+    else:
+        exact_query = {"publisher_key": normalized}
+
+    lookup = {
+        "$or": [
+            exact_query,
+            {"search_tokens": normalized},
+            {"search_tokens": {"$regex": f"^{re.escape(normalized)}"}},
+        ]
+    }
+    return [item["_id"] for item in collection.find(lookup, {"_id": 1})]
+
+
 def get_search_query(
     collections,
     bias: Optional[str],
@@ -305,36 +683,14 @@ def get_search_query(
             query["keywords"] = {"$all": requested}
 
     if author:
-        author_match = list(
-            collections["authors"].find(
-                {
-                    "$or": [
-                        {"name": {"$regex": author, "$options": "i"}},
-                        {"aliases": {"$regex": author, "$options": "i"}},
-                    ]
-                },
-                {"_id": 1},
-            )
-        )
-        author_ids = [item["_id"] for item in author_match]
+        author_ids = match_entity_ids(collections["authors"], "author", author)
         if not author_ids:
             return {"_id": {"$exists": False}}
         query["author_id"] = {"$in": author_ids}
 
     publisher_name = publisher or source
     if publisher_name:
-        publisher_match = list(
-            collections["publishers"].find(
-                {
-                    "$or": [
-                        {"name": {"$regex": publisher_name, "$options": "i"}},
-                        {"aliases": {"$regex": publisher_name, "$options": "i"}},
-                    ]
-                },
-                {"_id": 1},
-            )
-        )
-        publisher_ids = [item["_id"] for item in publisher_match]
+        publisher_ids = match_entity_ids(collections["publishers"], "publisher", publisher_name)
         if not publisher_ids:
             return {"_id": {"$exists": False}}
         query["publisher_id"] = {"$in": publisher_ids}
@@ -342,8 +698,91 @@ def get_search_query(
     return query
 
 
+def archive_cold_articles():
+    collections, client = get_collections()
+    try:
+        archived = 0
+        while True:
+            batch = cold_storage.archive_due(collections)
+            archived += batch
+            if batch < cold_storage.batch_size:
+                break
+    finally:
+        client.close()
+    return archived
+
+
+cold_storage_worker = PeriodicWorker("cold-storage", COLD_STORAGE_INTERVAL_SECONDS, archive_cold_articles)
+
+
+def refresh_suggestions():
+    collections, client = get_collections()
+    try:
+        return suggestion_index.refresh(collections, kg_scorer, full=suggestion_index.needs_rebuild())
+    finally:
+        client.close()
+
+
+suggestion_worker = PeriodicWorker("suggestion-refresh", suggestion_index.refresh_seconds, refresh_suggestions)
+
+
+def refresh_similar_index():
+    collections, client = get_collections()
+    try:
+        return similar_index.refresh(
+            collections["articles"],
+            lambda article_ids: load_graph_entities_many(collections, article_ids),
+        )
+    finally:
+        client.close()
+
+
+similar_worker = PeriodicWorker("similar-refresh", similar_index.refresh_seconds, refresh_similar_index)
+
+
+def refresh_entity_extractor():
+    return entity_extractor.refresh(kg_scorer)
+
+
+entity_extraction_worker = PeriodicWorker(
+    "entity-extraction-refresh", entity_extractor.refresh_seconds, refresh_entity_extractor
+)
+
+
+def flush_engagement():
+    collections, client = get_collections()
+    try:
+        return engagement_buffer.flush(collections["articles"])
+    finally:
+        client.close()
+
+
+@app.on_event("startup")
+def startup_event():
+    kg_scorer.start_graph_writer()
+    if ENABLE_ENTITY_EXTRACTION:
+        entity_extraction_worker.start()
+        entity_extraction_worker.wake()
+    if MONGO_URI:
+        engagement_buffer.start(flush_engagement)
+        if cold_storage.enabled:
+            cold_storage_worker.start()
+        suggestion_worker.start()
+        suggestion_worker.wake()
+        similar_worker.start()
+        similar_worker.wake()
+
+
 @app.on_event("shutdown")
 def shutdown_event():
+    engagement_buffer.stop()
+    cold_storage_worker.stop()
+    suggestion_worker.stop()
+    similar_worker.stop()
+    entity_extraction_worker.stop()
+    if MONGO_URI and engagement_buffer.pending_count():
+        flush_engagement()
+    kg_scorer.stop_graph_writer()
     kg_scorer.close()
 
 
@@ -378,8 +817,55 @@ def graph_stats():
         raise HTTPException(status_code=500, detail=f"Failed to fetch graph stats: {exc}")
 
 
+@app.get("/graph/version")
+def graph_version():
+    try:
+        return kg_scorer.get_graph_versions()
+    except RuntimeError as exc:
+        raise HTTPException(status_code=503, detail=str(exc))
+    except Exception as exc:
+        raise HTTPException(status_code=500, detail=f"Failed to fetch graph version: {exc}")
+
+
+@app.get("/graph/metrics")
+def graph_metrics():
+    return kg_scorer.get_scoring_metrics()
+
+
+@app.get("/workers")
+def worker_stats():
+    return {
+        "workers": [
+            worker.stats()
+            for worker in (cold_storage_worker, suggestion_worker, similar_worker, entity_extraction_worker)
+        ],
+        "engagement": engagement_buffer.stats(),
+    }
+
+
+@app.get("/suggest/{entity_type}")
+def suggest_entities(
+    entity_type: str,
+    prefix: str = Query(..., min_length=1),
+    limit: int = Query(10, ge=1, le=50),
+):
+    if entity_type not in SUGGESTION_ENTITY_TYPES:
+        raise HTTPException(
+            status_code=400,
+            detail=f"entity_type must be one of: {', '.join(SUGGESTION_ENTITY_TYPES)}",
+        )
+
+    return {
+        "entity_type": entity_type,
+        "prefix": prefix,
+        "suggestions": suggestion_index.suggest(entity_type, prefix, limit),
+        "index_ready": suggestion_index.ready,
+    }
+
+
 @app.get("/search")
 def search_articles(
+    response: Response,
     bias: Optional[str] = Query(None),
     source: Optional[str] = Query(None),
     keyword: Optional[str] = Query(None),
@@ -388,8 +874,10 @@ def search_articles(
     category: Optional[str] = Query(None),
     q: Optional[str] = Query(None, description="Full text query on title/content"),
     skip: int = Query(0, ge=0),
+    if_none_match: Optional[str] = Header(None),
 ):
     return read_articles(
+        response=response,
         bias=bias,
         source=source,
         keyword=keyword,
@@ -399,21 +887,21 @@ def search_articles(
         q=q,
         skip=skip,
         limit=50,
+        if_none_match=if_none_match,
     )
 
 
-@app.get("/articles")
-def read_articles(
-    bias: Optional[str] = Query(None),
-    source: Optional[str] = Query(None),
-    keyword: Optional[str] = Query(None),
-    author: Optional[str] = Query(None),
-    publisher: Optional[str] = Query(None),
-    category: Optional[str] = Query(None),
-    q: Optional[str] = Query(None, description="Full text query on title/content"),
-    skip: int = Query(0, ge=0),
-    limit: int = Query(100, ge=1, le=200),
-):
+def query_articles(
+    bias: Optional[str],
+    source: Optional[str],
+    keyword: Optional[str],
+    author: Optional[str],
+    publisher: Optional[str],
+    category: Optional[str],
+    q: Optional[str],
+    skip: int,
+    limit: int,
+) -> List[Dict[str, Any]]:
     collections, client = get_collections()
     query = get_search_query(
         collections=collections,
@@ -463,15 +951,152 @@ def read_articles(
         },
     ]
 
-    results = list(collections["articles"].aggregate(pipeline))
+    results = cold_storage.rehydrate(collections, list(collections["articles"].aggregate(pipeline)))
     hydrated = [to_jsonable(doc) for doc in results]
     client.close()
     return hydrated
 
 
+@app.get("/articles")
+def read_articles(
+    response: Response,
+    bias: Optional[str] = Query(None),
+    source: Optional[str] = Query(None),
+    keyword: Optional[str] = Query(None),
+    author: Optional[str] = Query(None),
+    publisher: Optional[str] = Query(None),
+    category: Optional[str] = Query(None),
+    q: Optional[str] = Query(None, description="Full text query on title/content"),
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=200),
+    if_none_match: Optional[str] = Header(None),
+):
+    params = normalize_query_params(
+        bias=bias,
+        source=source,
+        keyword=keyword,
+        author=author,
+        publisher=publisher,
+        category=category,
+        q=q,
+        skip=skip,
+        limit=limit,
+    )
+    return cached_response(
+        "articles",
+        params,
+        response,
+        if_none_match,
+        lambda: query_articles(**params),
+    )
+
+
+def facet_counts(field: str, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+    stages: List[Dict[str, Any]] = []
+    if field == "keywords":
+        stages.append({"$unwind": "$keywords"})
+    stages.extend(
+        [
+            {"$group": {"_id": f"${field}", "count": {"$sum": 1}}},
+            {"$sort": {"count": -1, "_id": 1}},
+        ]
+    )
+    if limit:
+        stages.append({"$limit": limit})
+    stages.append({"$project": {"_id": 0, "value": "$_id", "count": 1}})
+    return stages
+
+
+def query_facets(
+    bias: Optional[str],
+    source: Optional[str],
+    keyword: Optional[str],
+    author: Optional[str],
+    publisher: Optional[str],
+    category: Optional[str],
+    q: Optional[str],
+    keyword_limit: int,
+    estimated_total: bool,
+) -> Dict[str, Any]:
+    collections, client = get_collections()
+    query = get_search_query(
+        collections=collections,
+        bias=bias,
+        keyword=keyword,
+        author=author,
+        publisher=publisher,
+        source=source,
+        category=category,
+        q=q,
+    )
+
+    use_estimate = estimated_total and not query
+    facets: Dict[str, Any] = {
+        "label": facet_counts("classification.label"),
+        "category": facet_counts("category"),
+        "publisher_house": facet_counts("publisher_house"),
+        "keywords": facet_counts("keywords", limit=keyword_limit),
+    }
+    if not use_estimate:
+        facets["total"] = [{"$count": "count"}]
+
+    results = list(collections["articles"].aggregate([{"$match": query}, {"$facet": facets}]))
+    facet_doc = results[0] if results else {}
+
+    if use_estimate:
+        total = collections["articles"].estimated_document_count()
+    else:
+        total_rows = facet_doc.pop("total", [])
+        total = int(total_rows[0]["count"]) if total_rows else 0
+    client.close()
+
+    return {
+        "total": total,
+        "total_is_estimate": use_estimate,
+        "facets": to_jsonable(facet_doc),
+    }
+
+
+@app.get("/articles/facets")
+def article_facets(
+    response: Response,
+    bias: Optional[str] = Query(None),
+    source: Optional[str] = Query(None),
+    keyword: Optional[str] = Query(None),
+    author: Optional[str] = Query(None),
+    publisher: Optional[str] = Query(None),
+    category: Optional[str] = Query(None),
+    q: Optional[str] = Query(None, description="Full text query on title/content"),
+    keyword_limit: int = Query(20, ge=1, le=100),
+    estimated_total: bool = Query(
+        False, description="Use estimated_document_count for the total when no filter is set"
+    ),
+    if_none_match: Optional[str] = Header(None),
+):
+    params = normalize_query_params(
+        bias=bias,
+        source=source,
+        keyword=keyword,
+        author=author,
+        publisher=publisher,
+        category=category,
+        q=q,
+        keyword_limit=keyword_limit,
+        estimated_total=estimated_total,
+    )
+    return cached_response(
+        "facets",
+        params,
+        response,
+        if_none_match,
+        lambda: query_facets(**params),
+    )
+
+
 @app.post("/articles", status_code=201)
 def create_article(payload: ArticleCreate):
     collections, client = get_collections()
+    refresh_alias_index(collections)
 
     author_id = resolve_author(collections["authors"], payload.author)
     publisher_id = resolve_publisher(
@@ -489,9 +1114,11 @@ def create_article(payload: ArticleCreate):
 
     now = utc_now()
     article_doc = {
+        "_id": ObjectId(),
         "title": payload.title.strip(),
         "content": payload.content.strip(),
         "published_date": payload.published_date,
+        "storage_tier": "hot",
         "category": payload.category,
         "author_id": author_id,
         "publisher_id": publisher_id,
@@ -501,22 +1128,57 @@ def create_article(payload: ArticleCreate):
         "think_tanks": normalize_list(payload.think_tanks),
         "keywords": normalize_keywords(payload.keywords),
         "engagement": payload.engagement.model_dump(),
-        "comments": [comment.model_dump() for comment in payload.comments],
+        "comment_count": len(payload.comments),
         "topic_scores": payload.topic_scores,
         "created_at": now,
         "updated_at": now,
     }
 
+    article_doc.update(search_text_fields(article_doc["content"]))
+    detected_entities = detect_article_entities(article_doc["title"], article_doc["content"])
+    if detected_entities is not None:
+        article_doc["detected_entities"] = detected_entities
+
+    content_fingerprint, duplicates, duplicate_fields = detect_near_duplicates(
+        collections, article_doc["_id"], article_doc["content"]
+    )
+    article_doc.update({field: value for field, value in duplicate_fields.items() if value is not None})
+
     scoring_context = build_scoring_context(article_doc, author_doc or {}, publisher_doc or {})
-    bias_bundle = kg_scorer.compute_article_bias(scoring_context)
+    fingerprint = scoring_fingerprint(scoring_context)
+    bias_bundle = score_article(
+        scoring_context,
+        collections,
+        fingerprint,
+        ml_signal=reusable_duplicate_ml_signal(collections, duplicates),
+    )
 
     article_doc["classification"] = bias_bundle["classification"]
     article_doc["ml_signal"] = bias_bundle["ml_signal"]
     article_doc["graph_signal"] = bias_bundle["graph_signal"]
+    article_doc["scoring_fingerprint"] = fingerprint
+    article_doc["graph_entities"] = article_graph_entities(scoring_context)
 
     result = collections["articles"].insert_one(article_doc)
+    apply_rollup_changes(collections["bias_rollups"], None, article_doc)
+    if content_fingerprint:
+        collections["article_fingerprints"].insert_one(content_fingerprint)
+    if payload.comments:
+        collections["comments"].insert_many(
+            build_comment_docs(
+                result.inserted_id,
+                [comment.model_dump() for comment in payload.comments],
+            )
+        )
     article = collections["articles"].find_one({"_id": result.inserted_id})
 
+    query_cache.bump_generation()
+    index_article_suggestions(article, author_doc, publisher_doc)
+    similar_index.set_article(
+        article["_id"],
+        {item["key"]: item["weight"] for item in article["graph_entities"]},
+    )
+
     hydrated = hydrate_article(article, collections)
     client.close()
     return hydrated
@@ -532,16 +1194,27 @@ def update_article(article_id: str, payload: ArticleUpdate):
         client.close()
         raise HTTPException(status_code=400, detail="Invalid article_id")
 
-    article = collections["articles"].find_one({"_id": object_id})
-    if not article:
-        client.close()
-        raise HTTPException(status_code=404, detail="Article not found")
-
     update_data = payload.model_dump(exclude_unset=True, exclude_none=True)
+    rescore_requested = bool(SCORING_UPDATE_FIELDS.intersection(update_data))
+
+    article = None
+    if rescore_requested:
+        article = collections["articles"].find_one({"_id": object_id})
+        if not article:
+            client.close()
+            raise HTTPException(status_code=404, detail="Article not found")
+
     if not update_data:
         client.close()
         raise HTTPException(status_code=400, detail="No fields provided for update")
 
+    if "comments" in update_data:
+        client.close()
+        raise HTTPException(
+            status_code=400,
+            detail="comments cannot be replaced; append them with POST /articles/{article_id}/comments",
+        )
+
     set_fields: Dict[str, Any] = {"updated_at": utc_now()}
 
     direct_fields = [
@@ -557,6 +1230,9 @@ def update_article(article_id: str, payload: ArticleUpdate):
         if field in update_data:
             set_fields[field] = update_data[field]
 
+    if "content" in update_data:
+        set_fields.update(search_text_fields(update_data["content"]))
+
     if "organizations" in update_data:
         set_fields["organizations"] = normalize_list(update_data["organizations"])
 
@@ -569,8 +1245,8 @@ def update_article(article_id: str, payload: ArticleUpdate):
     if "engagement" in update_data:
         set_fields["engagement"] = update_data["engagement"]
 
-    if "comments" in update_data:
-        set_fields["comments"] = update_data["comments"]
+    if rescore_requested:
+        refresh_alias_index(collections)
 
     if payload.author:
         if not payload.author.name:
@@ -605,26 +1281,84 @@ def update_article(article_id: str, payload: ArticleUpdate):
             collections["publishers"], publisher=publisher_doc, source=payload.source
         )
 
-    projected = dict(article)
-    projected.update(set_fields)
-
     author_doc = None
-    if projected.get("author_id"):
-        author_doc = collections["authors"].find_one({"_id": projected["author_id"]})
-
     publisher_doc = None
-    if projected.get("publisher_id"):
-        publisher_doc = collections["publishers"].find_one({"_id": projected["publisher_id"]})
-
-    scoring_context = build_scoring_context(projected, author_doc or {}, publisher_doc or {})
-    bias_bundle = kg_scorer.compute_article_bias(scoring_context)
-    set_fields["classification"] = bias_bundle["classification"]
-    set_fields["ml_signal"] = bias_bundle["ml_signal"]
-    set_fields["graph_signal"] = bias_bundle["graph_signal"]
-
-    collections["articles"].update_one({"_id": object_id}, {"$set": set_fields})
+    if rescore_requested:
+        if article.get("storage_tier") == "cold" and "content" not in set_fields:
+            cold_storage.rehydrate(collections, [article])
+        projected = dict(article)
+        projected.update(set_fields)
+        if "title" in set_fields or "content" in set_fields:
+            detected_entities = detect_article_entities(projected.get("title"), projected.get("content"))
+            if detected_entities is not None:
+                set_fields["detected_entities"] = detected_entities
+                projected["detected_entities"] = detected_entities
+
+        if projected.get("author_id"):
+            author_doc = collections["authors"].find_one({"_id": projected["author_id"]})
+        if projected.get("publisher_id"):
+            publisher_doc = collections["publishers"].find_one({"_id": projected["publisher_id"]})
+
+        scoring_context = build_scoring_context(projected, author_doc or {}, publisher_doc or {})
+        set_fields["graph_entities"] = article_graph_entities(scoring_context)
+        fingerprint = scoring_fingerprint(scoring_context)
+        if fingerprint != article.get("scoring_fingerprint"):
+            bias_bundle = score_article(scoring_context, collections, fingerprint)
+            set_fields["classification"] = bias_bundle["classification"]
+            set_fields["ml_signal"] = bias_bundle["ml_signal"]
+            set_fields["graph_signal"] = bias_bundle["graph_signal"]
+            set_fields["scoring_fingerprint"] = fingerprint
+
+    updated = collections["articles"].find_one_and_update(
+        {"_id": object_id},
+        {"$set": set_fields},
+        return_document=ReturnDocument.AFTER,
+    )
+    if not updated:
+        client.close()
+        raise HTTPException(status_code=404, detail="Article not found")
 
-    updated = collections["articles"].find_one({"_id": object_id})
+    if rescore_requested:
+        apply_rollup_changes(collections["bias_rollups"], article, updated)
+
+    if updated.get("storage_tier") == "cold":
+        released = [
+            field
+            for field, replaced in (("content", "content"), ("evidence", "graph_signal"))
+            if replaced in set_fields
+        ]
+        if released and cold_storage.release(collections, object_id, released):
+            collections["articles"].update_one({"_id": object_id}, {"$set": {"storage_tier": "hot"}})
+            updated["storage_tier"] = "hot"
+
+    if "content" in update_data:
+        content_fingerprint, _, duplicate_fields = detect_near_duplicates(
+            collections, object_id, updated.get("content") or ""
+        )
+        if content_fingerprint:
+            collections["article_fingerprints"].replace_one({"_id": object_id}, content_fingerprint, upsert=True)
+        else:
+            collections["article_fingerprints"].delete_one({"_id": object_id})
+        set_duplicate = {field: value for field, value in duplicate_fields.items() if value is not None}
+        unset_duplicate = {field: "" for field, value in duplicate_fields.items() if value is None}
+        duplicate_update: Dict[str, Any] = {}
+        if set_duplicate:
+            duplicate_update["$set"] = set_duplicate
+        if unset_duplicate:
+            duplicate_update["$unset"] = unset_duplicate
+        collections["articles"].update_one({"_id": object_id}, duplicate_update)
+        updated.update(set_duplicate)
+        for field in unset_duplicate:
+            updated.pop(field, None)
+
+    query_cache.bump_generation()
+
+    if rescore_requested:
+        index_article_suggestions(updated, author_doc, publisher_doc)
+        similar_index.set_article(
+            object_id,
+            {item["key"]: item["weight"] for item in updated.get("graph_entities") or []},
+        )
     hydrated = hydrate_article(updated, collections)
     client.close()
     return hydrated
@@ -640,13 +1374,219 @@ def delete_article(article_id: str):
         client.close()
         raise HTTPException(status_code=400, detail="Invalid article_id")
 
-    result = collections["articles"].delete_one({"_id": object_id})
+    deleted = collections["articles"].find_one_and_delete(
+        {"_id": object_id},
+        projection={"classification": 1, "created_at": 1, "author_id": 1, "publisher_id": 1, "category": 1},
+    )
+    if deleted:
+        apply_rollup_changes(collections["bias_rollups"], deleted, None)
+        collections["comments"].delete_many({"article_id": object_id})
+        collections["article_fingerprints"].delete_one({"_id": object_id})
+        cold_storage.release(collections, object_id, ("content", "evidence"))
     client.close()
+    similar_index.remove_article(object_id)
 
-    if result.deleted_count == 0:
+    if not deleted:
         raise HTTPException(status_code=404, detail="Article not found")
 
+    query_cache.bump_generation()
+
     return {
         "message": "Article deleted successfully",
         "article_id": article_id,
     }
+
+
+@app.post("/articles/{article_id}/comments", status_code=201)
+def add_comment(article_id: str, payload: CommentModel):
+    collections, client = get_collections()
+
+    try:
+        object_id = ObjectId(article_id)
+    except Exception:
+        client.close()
+        raise HTTPException(status_code=400, detail="Invalid article_id")
+
+    result = collections["articles"].update_one(
+        {"_id": object_id},
+        {"$inc": {"comment_count": 1}, "$set": {"updated_at": utc_now()}},
+    )
+    if result.matched_count == 0:
+        client.close()
+        raise HTTPException(status_code=404, detail="Article not found")
+
+    comment_doc = build_comment_docs(object_id, [payload.model_dump()])[0]
+    collections["comments"].insert_one(comment_doc)
+    client.close()
+
+    query_cache.bump_generation()
+    return to_jsonable(comment_doc)
+
+
+@app.get("/articles/{article_id}/comments")
+def list_comments(
+    article_id: str,
+    after: Optional[str] = Query(None, description="Cursor returned as next_cursor by the previous page"),
+    limit: int = Query(50, ge=1, le=200),
+):
+    try:
+        object_id = ObjectId(article_id)
+        after_id = ObjectId(after) if after else None
+    except Exception:
+        raise HTTPException(status_code=400, detail="Invalid article_id or cursor")
+
+    collections, client = get_collections()
+    query: Dict[str, Any] = {"article_id": object_id}
+    if after_id is not None:
+        query["_id"] = {"$gt": after_id}
+
+    docs = list(collections["comments"].find(query).sort("_id", ASCENDING).limit(limit + 1))
+    client.close()
+
+    has_more = len(docs) > limit
+    docs = docs[:limit]
+    return {
+        "comments": [to_jsonable(doc) for doc in docs],
+        "next_cursor": str(docs[-1]["_id"]) if has_more else None,
+    }
+
+
+@app.post("/articles/{article_id}/engagement", status_code=202)
+def record_engagement(article_id: str, payload: EngagementIncrementModel):
+    try:
+        object_id = ObjectId(article_id)
+    except Exception:
+        raise HTTPException(status_code=400, detail="Invalid article_id")
+
+    increments = payload.model_dump()
+    if not any(increments.values()):
+        raise HTTPException(status_code=400, detail="Provide at least one non-zero increment")
+
+    pending = engagement_buffer.add(object_id, increments)
+    if pending is None:
+        raise HTTPException(status_code=503, detail="Engagement buffer is full, retry later")
+    return {
+        "article_id": article_id,
+        "pending": pending,
+    }
+
+
+@app.get("/articles/{article_id}/duplicates")
+def article_duplicates(
+    article_id: str,
+    threshold: Optional[float] = Query(None, ge=0.0, le=1.0),
+    limit: int = Query(20, ge=1, le=200),
+):
+    try:
+        object_id = ObjectId(article_id)
+    except Exception:
+        raise HTTPException(status_code=400, detail="Invalid article_id")
+
+    collections, client = get_collections()
+    content_fingerprint = collections["article_fingerprints"].find_one({"_id": object_id})
+    if not content_fingerprint:
+        exists = collections["articles"].count_documents({"_id": object_id}, limit=1)
+        client.close()
+        if not exists:
+            raise HTTPException(status_code=404, detail="Article not found")
+        return {"article_id": article_id, "cluster_id": None, "duplicates": []}
+
+    matches = find_near_duplicates(
+        collections["article_fingerprints"],
+        content_fingerprint,
+        NEAR_DUPLICATE_THRESHOLD if threshold is None else threshold,
+    )[:limit]
+    titles = {
+        doc["_id"]: doc.get("title")
+        for doc in collections["articles"].find(
+            {"_id": {"$in": [match["article_id"] for match in matches]}},
+            {"title": 1},
+        )
+    }
+    client.close()
+
+    for match in matches:
+        match["title"] = titles.get(match["article_id"])
+    return to_jsonable(
+        {
+            "article_id": article_id,
+            "cluster_id": content_fingerprint.get("cluster_id"),
+            "duplicates": matches,
+        }
+    )
+
+
+@app.get("/articles/{article_id}/similar")
+def similar_articles(article_id: str, k: int = Query(10, ge=1, le=100)):
+    try:
+        object_id = ObjectId(article_id)
+    except Exception:
+        raise HTTPException(status_code=400, detail="Invalid article_id")
+
+    collections, client = get_collections()
+    if similar_index.entities_for(object_id) is None:
+        entities = load_graph_entities(collections, object_id)
+        if entities is None:
+            client.close()
+            raise HTTPException(status_code=404, detail="Article not found")
+        similar_index.set_article(object_id, {item["key"]: item["weight"] for item in entities})
+
+    matches = similar_index.similar(object_id, k)
+    titles = {
+        str(doc["_id"]): doc.get("title")
+        for doc in collections["articles"].find(
+            {"_id": {"$in": [ObjectId(match["article_id"]) for match in matches]}},
+            {"title": 1},
+        )
+    }
+    client.close()
+
+    results = []
+    for match in matches:
+        if match["article_id"] not in titles:
+            similar_index.remove_article(match["article_id"])
+            continue
+        match["title"] = titles[match["article_id"]]
+        results.append(match)
+    return {"article_id": article_id, "similar": results, "index_ready": similar_index.ready}
+
+
+@app.get("/analytics/bias-trends")
+def bias_trends(
+    entity_type: str = Query("all"),
+    entity: Optional[str] = Query(None, description="Publisher/author id or name, or a category"),
+    start: Optional[str] = Query(None, pattern=r"^\d{4}-\d{2}-\d{2}$"),
+    end: Optional[str] = Query(None, pattern=r"^\d{4}-\d{2}-\d{2}$"),
+):
+    if entity_type not in ROLLUP_ENTITY_TYPES:
+        raise HTTPException(
+            status_code=400,
+            detail=f"entity_type must be one of: {', '.join(ROLLUP_ENTITY_TYPES)}",
+        )
+    if entity_type != "all" and not (entity and entity.strip()):
+        raise HTTPException(status_code=400, detail="entity is required for this entity_type")
+
+    collections, client = get_collections()
+    if entity_type == "all":
+        entity_keys = ["all"]
+    elif entity_type == "category":
+        entity_keys = [entity.strip()]
+    elif ObjectId.is_valid(entity.strip()):
+        entity_keys = [entity.strip()]
+    else:
+        entity_keys = [
+            str(entity_id)
+            for entity_id in match_entity_ids(collections[f"{entity_type}s"], entity_type, entity)
+        ]
+
+    series = []
+    if entity_keys:
+        series = query_bias_trends(collections["bias_rollups"], entity_type, entity_keys, start, end)
+    client.close()
+    return {
+        "entity_type": entity_type,
+        "entity_keys": entity_keys,
+        "start": start,
+        "end": end,
+        "series": series,
+    }
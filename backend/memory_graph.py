@@ -0,0 +1,553 @@
+import threading
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from backend.graph_snapshot import GraphSnapshot
+from backend.graph_traversal import beam_traverse, collect_related_nodes, neighbor_expander
+from backend.knowledge_graph import (
+    DEFAULT_NODE_IMPORTANCE,
+    ENTITY_TYPE_TO_LABEL,
+    KnowledgeGraphScorer,
+    clamp,
+    sanitize_relationship_type,
+    score_to_allsides_label,
+    utc_now,
+)
+
+NodeRef = Tuple[str, str]
+RelationshipRef = Tuple[NodeRef, str, NodeRef]
+
+
+class MemoryResult:
+    def __init__(self, records: Optional[List[Dict[str, Any]]] = None):
+        self._records = records or []
+
+    def single(self) -> Optional[Dict[str, Any]]:
+        return self._records[0] if self._records else None
+
+    def data(self) -> List[Dict[str, Any]]:
+        return list(self._records)
+
+
+class MemoryGraph:
+    def __init__(self):
+        self.nodes: Dict[NodeRef, Dict[str, Any]] = {}
+        self.relationships: Dict[RelationshipRef, Dict[str, Any]] = {}
+        self.version = 0
+        self.label_versions: Dict[str, int] = {}
+        self._adjacency: Dict[NodeRef, List[Tuple[int, NodeRef]]] = {}
+        self._relationship_weights: List[Optional[float]] = []
+        self._lock = threading.RLock()
+
+    @classmethod
+    def from_snapshot(cls, snapshot: GraphSnapshot) -> "MemoryGraph":
+        graph = cls()
+        now = utc_now()
+        for node in snapshot.iter_nodes():
+            graph.nodes[(node["label"], node["key"])] = {
+                "name": node["name"],
+                "bias_score": node["bias_score"],
+                "bias_confidence": node["bias_confidence"],
+                "importance_weight": node["importance_weight"],
+                "created_at": now,
+                "updated_at": now,
+            }
+        for rel in snapshot.iter_relationships():
+            graph._create_relationship(
+                (rel["from_label"], rel["from_key"]),
+                rel["type"],
+                (rel["to_label"], rel["to_key"]),
+                {"weight": rel["weight"], "updated_at": now},
+            )
+        graph.version = int(snapshot.graph_version or 0)
+        return graph
+
+    def session(self, database: Optional[str] = None) -> "MemoryGraphSession":
+        return MemoryGraphSession(self)
+
+    def close(self) -> None:
+        return None
+
+    def _create_relationship(
+        self,
+        source: NodeRef,
+        relationship_type: str,
+        target: NodeRef,
+        properties: Dict[str, Any],
+    ) -> Dict[str, Any]:
+        rel_id = len(self._relationship_weights)
+        properties["id"] = rel_id
+        self.relationships[(source, relationship_type, target)] = properties
+        self._relationship_weights.append(properties.get("weight"))
+        self._adjacency.setdefault(source, []).append((rel_id, target))
+        if source != target:
+            self._adjacency.setdefault(target, []).append((rel_id, source))
+        return properties
+
+    def _delete_relationship(self, ref: RelationshipRef) -> Dict[str, Any]:
+        properties = self.relationships.pop(ref)
+        source, _, target = ref
+        for node, neighbor in ((source, target), (target, source)):
+            adjacency = self._adjacency.get(node)
+            if adjacency is not None:
+                adjacency.remove((properties["id"], neighbor))
+        return properties
+
+    def _set_relationship_weight(self, properties: Dict[str, Any], weight: Optional[float]) -> None:
+        properties["weight"] = weight
+        self._relationship_weights[properties["id"]] = weight
+
+    def _merge_node(self, label: str, key: str) -> Tuple[Dict[str, Any], bool]:
+        node = self.nodes.get((label, key))
+        if node is not None:
+            return node, False
+        node = {"created_at": utc_now()}
+        self.nodes[(label, key)] = node
+        return node, True
+
+    def seed_row(self, row: Dict[str, Any]) -> Dict[str, int]:
+        parsed = KnowledgeGraphScorer._parse_seed_row(row)
+        if parsed is None:
+            return {"rows_skipped": 1, "nodes_upserted": 0, "relationships_upserted": 0}
+
+        now = utc_now()
+        node, _ = self._merge_node(parsed["label"], parsed["key"])
+        node.update(
+            {
+                "name": parsed["name"],
+                "bias_label": parsed["bias_label"],
+                "bias_score": parsed["bias_score"],
+                "bias_confidence": parsed["bias_confidence"],
+                "importance_weight": parsed["importance_weight"],
+                "source": parsed["source"],
+                "source_url": parsed["source_url"],
+                "updated_at": now,
+            }
+        )
+
+        relationship = parsed["relationship"]
+        if relationship is None:
+            return {"rows_skipped": 0, "nodes_upserted": 1, "relationships_upserted": 0}
+
+        target, created = self._merge_node(relationship["target_label"], relationship["target_key"])
+        if created:
+            target["name"] = relationship["target_name"]
+        target["updated_at"] = now
+
+        source_ref = (parsed["label"], parsed["key"])
+        target_ref = (relationship["target_label"], relationship["target_key"])
+        properties = self.relationships.get((source_ref, relationship["type"], target_ref))
+        if properties is None:
+            properties = self._create_relationship(source_ref, relationship["type"], target_ref, {})
+        self._set_relationship_weight(properties, relationship["weight"])
+        properties["source"] = parsed["source"]
+        properties["updated_at"] = now
+        return {"rows_skipped": 0, "nodes_upserted": 1, "relationships_upserted": 1}
+
+    def merge_candidate_node(self, candidate: Dict[str, Any]) -> Dict[str, Any]:
+        node, created = self._merge_node(candidate["label"], candidate["key"])
+        if created:
+            node["source"] = "article_metadata"
+        node["name"] = candidate["name"]
+        if node.get("source") is None:
+            node["source"] = "article_metadata"
+        if node.get("importance_weight") is None:
+            node["importance_weight"] = DEFAULT_NODE_IMPORTANCE.get(candidate["label"], 0.5)
+        node["updated_at"] = utc_now()
+        return {
+            "has_bias": node.get("bias_score") is not None,
+            "inferred": bool(node.get("inferred_from_articles")),
+            "created": created,
+        }
+
+    def merge_relationship(
+        self,
+        from_label: str,
+        from_key: str,
+        to_label: str,
+        to_key: str,
+        relationship_type: str,
+        weight: float,
+    ) -> bool:
+        source = (from_label, from_key)
+        target = (to_label, to_key)
+        if source not in self.nodes or target not in self.nodes:
+            return False
+
+        rel = sanitize_relationship_type(relationship_type)
+        properties = self.relationships.get((source, rel, target))
+        created = properties is None
+        if created:
+            properties = self._create_relationship(source, rel, target, {})
+        if properties.get("weight") is None:
+            self._set_relationship_weight(properties, weight)
+        if properties.get("source") is None:
+            properties["source"] = "article_metadata"
+        properties["updated_at"] = utc_now()
+        return created
+
+    def merge_candidate_nodes_batch(self, label: str, rows: List[Dict[str, Any]]) -> Dict[str, int]:
+        created = 0
+        for row in rows:
+            result = self.merge_candidate_node({"label": label, "key": row["key"], "name": row["name"]})
+            created += int(result["created"])
+        return {"merged": len(rows), "created": created}
+
+    def merge_relationships_batch(
+        self,
+        from_label: str,
+        relationship_type: str,
+        to_label: str,
+        rows: List[Dict[str, Any]],
+    ) -> Dict[str, int]:
+        merged = 0
+        created = 0
+        for row in rows:
+            if (from_label, row["from_key"]) not in self.nodes or (to_label, row["to_key"]) not in self.nodes:
+                continue
+            created += int(
+                self.merge_relationship(
+                    from_label, row["from_key"], to_label, row["to_key"], relationship_type, row["weight"]
+                )
+            )
+            merged += 1
+        return {"merged": merged, "created": created}
+
+    def read_candidate_bias_state(self, label: str, keys: List[str]) -> List[Dict[str, Any]]:
+        rows = []
+        for key in keys:
+            node = self.nodes.get((label, key))
+            if node is not None and node.get("bias_score") is not None:
+                rows.append({"key": key, "inferred": bool(node.get("inferred_from_articles"))})
+        return rows
+
+    def _neighbors(self, ref: NodeRef) -> List[Tuple[int, NodeRef, Optional[float]]]:
+        return [
+            (rel_id, neighbor, self._relationship_weights[rel_id])
+            for rel_id, neighbor in self._adjacency.get(ref, [])
+        ]
+
+    def _node_properties(self, ref: NodeRef) -> Dict[str, Any]:
+        node = self.nodes[ref]
+        return {
+            "label": ref[0],
+            "name": node.get("name"),
+            "bias_score": node.get("bias_score"),
+            "bias_confidence": node.get("bias_confidence"),
+            "importance_weight": node.get("importance_weight"),
+        }
+
+    def _node_data(self, label: str, key: str, default_importance: float) -> Optional[Dict[str, Any]]:
+        if label not in set(ENTITY_TYPE_TO_LABEL.values()):
+            return None
+        node = self.nodes.get((label, key))
+        if node is None:
+            return None
+        return {
+            "node_name": node.get("name"),
+            "node_type": label,
+            "bias_score": node.get("bias_score"),
+            "bias_confidence": 0.65 if node.get("bias_confidence") is None else node["bias_confidence"],
+            "importance_weight": (
+                default_importance if node.get("importance_weight") is None else node["importance_weight"]
+            ),
+        }
+
+    def fetch_node_with_neighbors(
+        self, label: str, key: str, default_importance: float
+    ) -> Optional[Dict[str, Any]]:
+        node_data = self._node_data(label, key, default_importance)
+        if node_data is not None:
+            node_data["related"] = collect_related_nodes((label, key), self._neighbors, self._node_properties)
+        return node_data
+
+    def fetch_direct_nodes(self, rows_by_label: Dict[str, List[Dict[str, Any]]]) -> List[Dict[str, Any]]:
+        found = []
+        for label, rows in rows_by_label.items():
+            for row in rows:
+                node_data = self._node_data(label, row["key"], row["default_importance"])
+                if node_data is not None:
+                    node_data["inferred"] = bool(self.nodes[(label, row["key"])].get("inferred_from_articles"))
+                    found.append({"label": label, "key": row["key"], "node_data": node_data})
+        return found
+
+    def fetch_node_with_pruned_neighbors(
+        self,
+        label: str,
+        key: str,
+        default_importance: float,
+        max_hops: int,
+        fanout: int,
+        min_path_weight: float,
+    ) -> Optional[Dict[str, Any]]:
+        node_data = self._node_data(label, key, default_importance)
+        if node_data is not None:
+            node_data["related"], node_data["traversal"] = beam_traverse(
+                (label, key),
+                neighbor_expander(self._neighbors, self._node_properties),
+                max_hops,
+                fanout,
+                min_path_weight,
+            )
+        return node_data
+
+    def update_inferred_node_bias(
+        self,
+        label: str,
+        key: str,
+        score: float,
+        confidence: float,
+        bias_label: str,
+    ) -> int:
+        node = self.nodes.get((label, key))
+        if node is None or node.get("bias_score") is not None:
+            return 0
+        node.update(
+            {
+                "bias_score": score,
+                "bias_confidence": confidence,
+                "bias_label": bias_label,
+                "inferred_from_articles": True,
+                "inference_model": "graph-inference-v1",
+                "source": node.get("source") or "article_inference",
+                "updated_at": utc_now(),
+            }
+        )
+        return 1
+
+    def update_inferred_nodes_batch(self, label: str, rows: List[Dict[str, Any]]) -> int:
+        return sum(
+            self.update_inferred_node_bias(label, row["key"], row["score"], row["confidence"], row["bias_label"])
+            for row in rows
+        )
+
+    def apply_inference_observations_batch(self, label: str, rows: List[Dict[str, Any]]) -> int:
+        updated = 0
+        for row in rows:
+            node = self.nodes.get((label, row["key"]))
+            if node is None or (node.get("bias_score") is not None and not node.get("inferred_from_articles")):
+                continue
+            node["inference_weight_sum"] = (node.get("inference_weight_sum") or 0.0) + row["weight_sum"]
+            node["inference_weighted_sum"] = (node.get("inference_weighted_sum") or 0.0) + row["weighted_sum"]
+            node["inference_confidence_sum"] = (
+                (node.get("inference_confidence_sum") or 0.0) + row["confidence_weighted_sum"]
+            )
+            node["inference_observations"] = (node.get("inference_observations") or 0) + int(row["observations"])
+            score = clamp(node["inference_weighted_sum"] / node["inference_weight_sum"], -1.0, 1.0)
+            node.update(
+                {
+                    "bias_score": score,
+                    "bias_confidence": clamp(
+                        0.20 + 0.55 * (node["inference_confidence_sum"] / node["inference_weight_sum"]),
+                        0.15,
+                        0.85,
+                    ),
+                    "bias_label": score_to_allsides_label(score),
+                    "inferred_from_articles": True,
+                    "inference_model": "graph-inference-v2",
+                    "source": node.get("source") or "article_inference",
+                    "updated_at": utc_now(),
+                }
+            )
+            updated += 1
+        return updated
+
+    def write_propagated_biases_batch(self, label: str, rows: List[Dict[str, Any]]) -> int:
+        updated = 0
+        now = utc_now()
+        for row in rows:
+            node = self.nodes.get((label, row["key"]))
+            if node is None or (node.get("bias_score") is not None and not node.get("inferred_from_articles")):
+                continue
+            node.update(
+                {
+                    "bias_score": row["score"],
+                    "bias_confidence": row["confidence"],
+                    "bias_label": row["bias_label"],
+                    "inferred_from_articles": True,
+                    "inference_model": "graph-propagation-v1",
+                    "source": node.get("source") or "graph_propagation",
+                    "propagated_at": now,
+                    "updated_at": now,
+                }
+            )
+            updated += 1
+        return updated
+
+    def run_graph_version_query(self, query: str) -> int:
+        return self.version
+
+    def bump_graph_version(self, labels: List[str]) -> int:
+        self.version += 1
+        for label in labels:
+            self.label_versions[label] = self.version
+        return self.version
+
+    def read_relationship_types(self) -> List[str]:
+        return sorted({rel_type for _, rel_type, _ in self.relationships})
+
+    def merge_duplicate_nodes_batch(
+        self, label: str, relationship_types: List[str], rows: List[Dict[str, Any]]
+    ) -> int:
+        mapping: Dict[NodeRef, NodeRef] = {}
+        for row in rows:
+            duplicate = (label, row["duplicate"])
+            canonical = (label, row["canonical"])
+            if duplicate != canonical and duplicate in self.nodes and canonical in self.nodes:
+                mapping[duplicate] = canonical
+
+        now = utc_now()
+        for ref in [ref for ref in self.relationships if ref[0] in mapping or ref[2] in mapping]:
+            properties = self._delete_relationship(ref)
+            source, rel_type, target = ref
+            if rel_type not in relationship_types:
+                continue
+            source = mapping.get(source, source)
+            target = mapping.get(target, target)
+            if source == target or source in mapping or target in mapping:
+                continue
+            merged = self.relationships.get((source, rel_type, target))
+            if merged is None:
+                merged = self._create_relationship(source, rel_type, target, {"source": properties.get("source")})
+            weight = properties.get("weight")
+            if merged.get("weight") is None or (weight is not None and weight > merged["weight"]):
+                self._set_relationship_weight(merged, weight)
+            merged["updated_at"] = now
+
+        for duplicate, canonical in mapping.items():
+            dup = self.nodes.pop(duplicate)
+            self._adjacency.pop(duplicate, None)
+            node = self.nodes[canonical]
+            take_bias = node.get("bias_score") is None or (
+                bool(node.get("inferred_from_articles"))
+                and dup.get("bias_score") is not None
+                and not dup.get("inferred_from_articles")
+            )
+            if take_bias:
+                for field in ("bias_score", "bias_confidence", "bias_label", "inferred_from_articles"):
+                    node[field] = dup.get(field)
+            aliases: List[str] = []
+            for alias in list(node.get("aliases") or []) + [dup.get("name")] + list(dup.get("aliases") or []):
+                if alias is not None and alias != node.get("name") and alias not in aliases:
+                    aliases.append(alias)
+            node["aliases"] = aliases
+            if (dup.get("importance_weight") or 0.0) > (node.get("importance_weight") or 0.0):
+                node["importance_weight"] = dup["importance_weight"]
+            node["updated_at"] = now
+        return len(mapping)
+
+    def read_label_versions(self) -> Dict[str, int]:
+        return dict(self.label_versions)
+
+    def read_graph_stats(self) -> Dict[str, Any]:
+        node_types: Dict[str, int] = {}
+        for label, _ in self.nodes:
+            node_types[label] = node_types.get(label, 0) + 1
+        relationship_types: Dict[str, int] = {}
+        for _, rel_type, _ in self.relationships:
+            relationship_types[rel_type] = relationship_types.get(rel_type, 0) + 1
+
+        return {
+            "node_count": len(self.nodes),
+            "relationship_count": len(self.relationships),
+            "inferred_node_count": sum(1 for node in self.nodes.values() if node.get("inferred_from_articles")),
+            "nodes_without_bias_count": sum(1 for node in self.nodes.values() if node.get("bias_score") is None),
+            "node_types": [
+                {"node_type": node_type, "count": count}
+                for node_type, count in sorted(node_types.items(), key=lambda item: (-item[1], item[0]))
+            ],
+            "relationship_types": [
+                {"relationship_type": rel_type, "count": count}
+                for rel_type, count in sorted(relationship_types.items(), key=lambda item: (-item[1], item[0]))
+            ],
+        }
+
+    def read_entity_names(self, updated_since: Optional[datetime]) -> List[Dict[str, Any]]:
+        return [
+            {"label": label, "key": key, "name": node.get("name") or key, "aliases": node.get("aliases") or []}
+            for (label, key), node in self.nodes.items()
+            if updated_since is None or (node.get("updated_at") and node["updated_at"] >= updated_since)
+        ]
+
+    def read_snapshot_nodes(self) -> List[Dict[str, Any]]:
+        return [
+            {
+                "label": label,
+                "key": key,
+                "name": node.get("name"),
+                "bias_score": node.get("bias_score"),
+                "bias_confidence": node.get("bias_confidence"),
+                "importance_weight": node.get("importance_weight"),
+                "inferred": bool(node.get("inferred_from_articles")),
+            }
+            for (label, key), node in self.nodes.items()
+        ]
+
+    def read_snapshot_relationships(self) -> List[Dict[str, Any]]:
+        return [
+            {
+                "from_label": source[0],
+                "from_key": source[1],
+                "to_label": target[0],
+                "to_key": target[1],
+                "type": rel_type,
+                "weight": properties.get("weight"),
+            }
+            for (source, rel_type, target), properties in self.relationships.items()
+        ]
+
+
+class MemoryGraphSession:
+    def __init__(self, graph: MemoryGraph):
+        self.graph = graph
+        self._operations: Dict[str, Callable[..., Any]] = {
+            "_seed_row": graph.seed_row,
+            "_merge_candidate_node": graph.merge_candidate_node,
+            "_merge_relationship": graph.merge_relationship,
+            "_fetch_node_with_neighbors": graph.fetch_node_with_neighbors,
+            "_fetch_node_with_pruned_neighbors": graph.fetch_node_with_pruned_neighbors,
+            "_fetch_direct_nodes": graph.fetch_direct_nodes,
+            "_update_inferred_node_bias": graph.update_inferred_node_bias,
+            "_merge_candidate_nodes_batch": graph.merge_candidate_nodes_batch,
+            "_merge_relationships_batch": graph.merge_relationships_batch,
+            "_read_candidate_bias_state": graph.read_candidate_bias_state,
+            "_apply_inference_observations_batch": graph.apply_inference_observations_batch,
+            "_write_propagated_biases_batch": graph.write_propagated_biases_batch,
+            "_update_inferred_nodes_batch": graph.update_inferred_nodes_batch,
+            "_run_graph_version_query": graph.run_graph_version_query,
+            "_write_graph_version_bump": graph.bump_graph_version,
+            "_read_label_versions": graph.read_label_versions,
+            "_read_relationship_types": graph.read_relationship_types,
+            "_merge_duplicate_nodes_batch": graph.merge_duplicate_nodes_batch,
+            "_read_graph_stats": graph.read_graph_stats,
+            "_read_entity_names": graph.read_entity_names,
+            "_read_snapshot_nodes": graph.read_snapshot_nodes,
+            "_read_snapshot_relationships": graph.read_snapshot_relationships,
+        }
+
+    def __enter__(self) -> "MemoryGraphSession":
+        return self
+
+    def __exit__(self, exc_type, exc, traceback) -> None:
+        return None
+
+    def close(self) -> None:
+        return None
+
+    def run(self, query: str, **params: Any) -> MemoryResult:
+        return MemoryResult([{"ok": 1}])
+
+    def _execute(self, transaction_function: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        operation = self._operations.get(transaction_function.__name__)
+        if operation is None:
+            raise NotImplementedError(
+                f"In-memory graph backend does not implement {transaction_function.__name__}"
+            )
+        with self.graph._lock:
+            return operation(*args, **kwargs)
+
+    def execute_read(self, transaction_function: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        return self._execute(transaction_function, *args, **kwargs)
+
+    def execute_write(self, transaction_function: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        return self._execute(transaction_function, *args, **kwargs)
@@ -0,0 +1,114 @@
+import hashlib
+import re
+import zlib
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+from bson import ObjectId
+
+MINHASH_PERMUTATIONS = 128
+LSH_BANDS = 16
+LSH_ROWS = MINHASH_PERMUTATIONS // LSH_BANDS
+SHINGLE_WORDS = 5
+MINHASH_PRIME = np.uint64(4294967311)
+
+_rng = np.random.default_rng(20260319)
+_MINHASH_A = _rng.integers(1, 2**31, size=MINHASH_PERMUTATIONS, dtype=np.uint64)
+_MINHASH_B = _rng.integers(0, 2**31, size=MINHASH_PERMUTATIONS, dtype=np.uint64)
+
+WORD_PATTERN = re.compile(r"[a-z0-9]+")
+
+
+def content_shingles(text: str, size: int = SHINGLE_WORDS) -> List[str]:
+    words = WORD_PATTERN.findall((text or "").lower())
+    if not words:
+        return []
+    if len(words) <= size:
+        return [" ".join(words)]
+    return [" ".join(words[index:index + size]) for index in range(len(words) - size + 1)]
+
+
+def minhash_signature(text: str) -> Optional[np.ndarray]:
+    shingles = content_shingles(text)
+    if not shingles:
+        return None
+    hashes = np.fromiter(
+        (zlib.crc32(shingle.encode("utf-8")) for shingle in set(shingles)),
+        dtype=np.uint64,
+    )
+    permuted = (np.outer(_MINHASH_A, hashes) + _MINHASH_B[:, None]) % MINHASH_PRIME
+    return permuted.min(axis=1)
+
+
+def lsh_buckets(signature: np.ndarray) -> List[str]:
+    buckets = []
+    for band in range(LSH_BANDS):
+        rows = signature[band * LSH_ROWS:(band + 1) * LSH_ROWS]
+        digest = hashlib.blake2b(rows.tobytes(), digest_size=8).hexdigest()
+        buckets.append(f"{band}:{digest}")
+    return buckets
+
+
+def estimate_similarity(left: np.ndarray, right: np.ndarray) -> float:
+    return float(np.count_nonzero(left == right)) / float(len(left))
+
+
+def build_fingerprint(article_id: ObjectId, content: str) -> Optional[Dict[str, Any]]:
+    signature = minhash_signature(content)
+    if signature is None:
+        return None
+    return {
+        "_id": article_id,
+        "minhash": [int(value) for value in signature],
+        "lsh_buckets": lsh_buckets(signature),
+    }
+
+
+def find_near_duplicates(
+    fingerprints_collection,
+    fingerprint: Dict[str, Any],
+    threshold: float,
+    max_candidates: int = 200,
+) -> List[Dict[str, Any]]:
+    signature = np.asarray(fingerprint["minhash"], dtype=np.uint64)
+    candidates = fingerprints_collection.aggregate(
+        [
+            {
+                "$match": {
+                    "lsh_buckets": {"$in": fingerprint["lsh_buckets"]},
+                    "_id": {"$ne": fingerprint["_id"]},
+                }
+            },
+            {
+                "$project": {
+                    "minhash": 1,
+                    "cluster_id": 1,
+                    "shared_buckets": {
+                        "$size": {
+                            "$filter": {
+                                "input": "$lsh_buckets",
+                                "as": "bucket",
+                                "cond": {"$in": ["$$bucket", fingerprint["lsh_buckets"]]},
+                            }
+                        }
+                    },
+                }
+            },
+            {"$sort": {"shared_buckets": -1, "_id": 1}},
+            {"$limit": max_candidates},
+        ]
+    )
+
+    matches = []
+    for candidate in candidates:
+        similarity = estimate_similarity(signature, np.asarray(candidate["minhash"], dtype=np.uint64))
+        if similarity >= threshold:
+            matches.append(
+                {
+                    "article_id": candidate["_id"],
+                    "cluster_id": candidate.get("cluster_id") or candidate["_id"],
+                    "similarity": round(similarity, 4),
+                }
+            )
+    matches.sort(key=lambda item: item["similarity"], reverse=True)
+    return matches
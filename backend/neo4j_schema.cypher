@@ -5,6 +5,10 @@ CREATE CONSTRAINT publisher_house_key IF NOT EXISTS FOR (n:PublisherHouse) REQUI
 CREATE CONSTRAINT organization_key IF NOT EXISTS FOR (n:Organization) REQUIRE n.key IS UNIQUE;
 CREATE CONSTRAINT think_tank_key IF NOT EXISTS FOR (n:ThinkTank) REQUIRE n.key IS UNIQUE;
 CREATE CONSTRAINT topic_key IF NOT EXISTS FOR (n:Topic) REQUIRE n.key IS UNIQUE;
+CREATE CONSTRAINT graph_meta_name IF NOT EXISTS FOR (n:GraphMeta) REQUIRE n.name IS UNIQUE;
+
+// Graph version counter used by the scoring cache
+MERGE (v:GraphMeta {name: "graph_version"}) ON CREATE SET v.value = 0, v.updated_at = datetime();
 
 // Recommended properties on each node:
 // name, key, bias_label, bias_score (-1..1), bias_confidence (0..1), importance_weight
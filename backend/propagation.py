@@ -0,0 +1,110 @@
+import time
+from typing import Any, Dict, List
+
+import numpy as np
+
+from backend.graph_traversal import DEFAULT_RELATIONSHIP_WEIGHT
+
+DEFAULT_ANCHOR_CONFIDENCE = 0.75
+
+
+def build_propagation_arrays(
+    nodes: List[Dict[str, Any]], relationships: List[Dict[str, Any]]
+) -> Dict[str, np.ndarray]:
+    index = {(node["label"], node["key"]): position for position, node in enumerate(nodes)}
+    pairs = [
+        (
+            index[(rel["from_label"], rel["from_key"])],
+            index[(rel["to_label"], rel["to_key"])],
+            DEFAULT_RELATIONSHIP_WEIGHT if rel.get("weight") is None else float(rel["weight"]),
+        )
+        for rel in relationships
+        if (rel["from_label"], rel["from_key"]) in index and (rel["to_label"], rel["to_key"]) in index
+    ]
+    pairs = [pair for pair in pairs if pair[0] != pair[1] and pair[2] > 0]
+    source = np.array([pair[0] for pair in pairs], dtype=np.int64)
+    target = np.array([pair[1] for pair in pairs], dtype=np.int64)
+    weight = np.array([pair[2] for pair in pairs], dtype=np.float64)
+
+    anchors = np.array(
+        [node.get("bias_score") is not None and not node.get("inferred") for node in nodes], dtype=bool
+    )
+    scores = np.array(
+        [float(node["bias_score"]) if node.get("bias_score") is not None else 0.0 for node in nodes],
+        dtype=np.float64,
+    )
+    confidence = np.array(
+        [
+            float(node["bias_confidence"]) if node.get("bias_confidence") is not None else DEFAULT_ANCHOR_CONFIDENCE
+            for node in nodes
+        ],
+        dtype=np.float64,
+    )
+    return {
+        "source": np.concatenate([source, target]),
+        "target": np.concatenate([target, source]),
+        "weight": np.concatenate([weight, weight]),
+        "anchors": anchors,
+        "scores": np.where(anchors, np.clip(scores, -1.0, 1.0), 0.0),
+        "confidence": np.where(anchors, np.clip(confidence, 0.0, 1.0), 0.0),
+    }
+
+
+def propagate_bias(
+    arrays: Dict[str, np.ndarray],
+    max_iterations: int = 100,
+    tolerance: float = 1e-4,
+    decay: float = 0.85,
+) -> Dict[str, Any]:
+    source, target, weight = arrays["source"], arrays["target"], arrays["weight"]
+    anchors = arrays["anchors"]
+    free = ~anchors
+    size = len(anchors)
+    scores = arrays["scores"].copy()
+    confidence = arrays["confidence"].copy()
+
+    started = time.perf_counter()
+    iterations = 0
+    max_delta = 0.0
+    converged = False
+    for iterations in range(1, max(1, max_iterations) + 1):
+        mass = weight * confidence[source]
+        informed_weight = np.bincount(target, weights=weight * (confidence[source] > 0), minlength=size)
+        denominator = np.bincount(target, weights=mass, minlength=size)
+        numerator = np.bincount(target, weights=mass * scores[source], minlength=size)
+
+        update = free & (denominator > 0)
+        next_scores = scores.copy()
+        next_confidence = confidence.copy()
+        next_scores[update] = np.clip(numerator[update] / denominator[update], -1.0, 1.0)
+        next_confidence[update] = decay * denominator[update] / informed_weight[update]
+
+        max_delta = float(
+            max(
+                np.abs(next_scores - scores).max(initial=0.0),
+                np.abs(next_confidence - confidence).max(initial=0.0),
+            )
+        )
+        scores, confidence = next_scores, next_confidence
+        if max_delta < tolerance:
+            converged = True
+            break
+
+    informed = free & (confidence > 0)
+    return {
+        "scores": scores,
+        "confidence": confidence,
+        "informed": informed,
+        "stats": {
+            "nodes": size,
+            "edges": len(weight) // 2,
+            "anchors": int(anchors.sum()),
+            "free_nodes": int(free.sum()),
+            "informed_nodes": int(informed.sum()),
+            "unreached_nodes": int((free & ~informed).sum()),
+            "iterations": iterations,
+            "max_delta": round(max_delta, 8),
+            "converged": converged,
+            "seconds": round(time.perf_counter() - started, 4),
+        },
+    }
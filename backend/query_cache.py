@@ -0,0 +1,92 @@
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+
+def build_cache_key(namespace: str, params: Dict[str, Any]) -> str:
+    normalized = {key: params[key] for key in sorted(params) if params[key] not in (None, "", [])}
+    return f"{namespace}:{json.dumps(normalized, sort_keys=True, default=str)}"
+
+
+def compute_etag(payload: Any, generation: int) -> str:
+    body = json.dumps(payload, sort_keys=True, default=str).encode("utf-8")
+    digest = hashlib.sha1(body).hexdigest()
+    return f'W/"{generation}-{digest}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    if not if_none_match:
+        return False
+    candidates = [token.strip() for token in if_none_match.split(",")]
+    return "*" in candidates or etag in candidates
+
+
+class QueryResultCache:
+    def __init__(self, max_entries: int = 256, ttl_seconds: float = 30.0):
+        self.max_entries = max(0, int(max_entries))
+        self.ttl_seconds = max(0.0, float(ttl_seconds))
+        self._entries: "OrderedDict[str, Tuple[int, float, Any, str]]" = OrderedDict()
+        self._generation = 0
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_entries > 0 and self.ttl_seconds > 0
+
+    @property
+    def generation(self) -> int:
+        return self._generation
+
+    def bump_generation(self) -> int:
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+            return self._generation
+
+    def get(self, key: str) -> Optional[Tuple[Any, str]]:
+        if not self.enabled:
+            return None
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+            generation, expires_at, payload, etag = entry
+            if generation != self._generation or expires_at <= now:
+                del self._entries[key]
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return payload, etag
+
+    def put(self, key: str, payload: Any, generation: int) -> str:
+        etag = compute_etag(payload, generation)
+        if not self.enabled:
+            return etag
+        with self._lock:
+            if generation != self._generation:
+                return etag
+            self._entries[key] = (generation, time.monotonic() + self.ttl_seconds, payload, etag)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return etag
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "enabled": self.enabled,
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "ttl_seconds": self.ttl_seconds,
+                "generation": self._generation,
+                "hits": self._hits,
+                "misses": self._misses,
+            }
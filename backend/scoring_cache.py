@@ -0,0 +1,89 @@
+import copy
+import threading
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional
+
+
+class ScoringCache:
+    def __init__(self, max_entries: int = 2048, persist: bool = False):
+        self.max_entries = max(0, int(max_entries))
+        self.persist = persist
+        self._entries: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._persistent_hits = 0
+        self._misses = 0
+
+    @staticmethod
+    def make_key(fingerprint: str, graph_version: int) -> str:
+        return f"{fingerprint}:g{graph_version}"
+
+    def _remember(self, key: str, bundle: Dict[str, Any]) -> None:
+        if self.max_entries <= 0:
+            return
+        with self._lock:
+            self._entries[key] = bundle
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def get(
+        self,
+        fingerprint: str,
+        graph_version: int,
+        collection=None,
+    ) -> Optional[Dict[str, Any]]:
+        key = self.make_key(fingerprint, graph_version)
+        with self._lock:
+            bundle = self._entries.get(key)
+            if bundle is not None:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return copy.deepcopy(bundle)
+
+        if self.persist and collection is not None:
+            doc = collection.find_one({"_id": key}, {"bundle": 1})
+            if doc and doc.get("bundle"):
+                self._remember(key, doc["bundle"])
+                with self._lock:
+                    self._persistent_hits += 1
+                return copy.deepcopy(doc["bundle"])
+
+        with self._lock:
+            self._misses += 1
+        return None
+
+    def put(
+        self,
+        fingerprint: str,
+        graph_version: int,
+        bundle: Dict[str, Any],
+        collection=None,
+    ) -> None:
+        key = self.make_key(fingerprint, graph_version)
+        stored = copy.deepcopy(bundle)
+        self._remember(key, stored)
+        if self.persist and collection is not None:
+            collection.replace_one(
+                {"_id": key},
+                {
+                    "_id": key,
+                    "fingerprint": fingerprint,
+                    "graph_version": graph_version,
+                    "bundle": stored,
+                    "created_at": datetime.now(timezone.utc),
+                },
+                upsert=True,
+            )
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "persist": self.persist,
+                "hits": self._hits,
+                "persistent_hits": self._persistent_hits,
+                "misses": self._misses,
+            }
@@ -0,0 +1,58 @@
+import argparse
+import json
+from pathlib import Path
+
+from dotenv import load_dotenv
+
+
+def main():
+    project_root = Path(__file__).resolve().parents[2]
+    load_dotenv(project_root / ".env")
+
+    from backend.main import cold_storage, get_collections
+
+    parser = argparse.ArgumentParser(
+        description="Move article bodies and graph evidence older than the configured age to compressed cold storage."
+    )
+    parser.add_argument(
+        "--age-days",
+        type=float,
+        default=cold_storage.age_days,
+        help="Archive articles created more than this many days ago.",
+    )
+    parser.add_argument(
+        "--max-articles",
+        type=int,
+        default=0,
+        help="Stop after archiving this many articles (0 means no limit).",
+    )
+    args = parser.parse_args()
+
+    if args.age_days <= 0:
+        parser.error("--age-days must be greater than zero")
+    cold_storage.age_days = args.age_days
+
+    collections, client = get_collections()
+    archived = 0
+    try:
+        while not args.max_articles or archived < args.max_articles:
+            limit = cold_storage.batch_size
+            if args.max_articles:
+                limit = min(limit, args.max_articles - archived)
+            batch = cold_storage.archive_due(collections, limit=limit)
+            archived += batch
+            if batch < limit:
+                break
+
+        print(
+            json.dumps(
+                {"status": "ok", "age_days": args.age_days, "articles_archived": archived},
+                indent=2,
+            )
+        )
+    finally:
+        client.close()
+
+
+if __name__ == "__main__":
+    main()
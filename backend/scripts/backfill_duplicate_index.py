@@ -0,0 +1,60 @@
+import argparse
+import json
+from pathlib import Path
+
+from dotenv import load_dotenv
+
+
+def main():
+    project_root = Path(__file__).resolve().parents[2]
+    load_dotenv(project_root / ".env")
+
+    from backend.main import NEAR_DUPLICATE_THRESHOLD, cold_storage, get_collections
+    from backend.near_duplicates import build_fingerprint, find_near_duplicates
+
+    parser = argparse.ArgumentParser(
+        description="Build near-duplicate fingerprints for articles that do not have one yet."
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=NEAR_DUPLICATE_THRESHOLD,
+        help="Minimum estimated Jaccard similarity for linking an article to a cluster.",
+    )
+    args = parser.parse_args()
+
+    collections, client = get_collections()
+    stats = {"articles_scanned": 0, "fingerprints_created": 0, "linked_duplicates": 0}
+    try:
+        cursor = collections["articles"].find({}, {"content": 1, "storage_tier": 1}).sort("_id", 1)
+        for article in cursor:
+            stats["articles_scanned"] += 1
+            if collections["article_fingerprints"].count_documents({"_id": article["_id"]}, limit=1):
+                continue
+
+            cold_storage.rehydrate(collections, [article])
+            fingerprint = build_fingerprint(article["_id"], article.get("content") or "")
+            if not fingerprint:
+                continue
+
+            duplicates = find_near_duplicates(
+                collections["article_fingerprints"], fingerprint, args.threshold
+            )
+            fingerprint["cluster_id"] = duplicates[0]["cluster_id"] if duplicates else article["_id"]
+            collections["article_fingerprints"].insert_one(fingerprint)
+
+            article_update = {"duplicate_cluster_id": fingerprint["cluster_id"]}
+            if duplicates:
+                article_update["near_duplicate_of"] = duplicates[0]["article_id"]
+                article_update["near_duplicate_similarity"] = duplicates[0]["similarity"]
+                stats["linked_duplicates"] += 1
+            collections["articles"].update_one({"_id": article["_id"]}, {"$set": article_update})
+            stats["fingerprints_created"] += 1
+
+        print(json.dumps({"status": "ok", "stats": stats}, indent=2))
+    finally:
+        client.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,32 @@
+import argparse
+import json
+from pathlib import Path
+
+from dotenv import load_dotenv
+from backend.knowledge_graph import KnowledgeGraphScorer
+
+
+def main():
+    project_root = Path(__file__).resolve().parents[2]
+    load_dotenv(project_root / ".env")
+
+    parser = argparse.ArgumentParser(
+        description="Export the bias-relevant Neo4j graph to a memory-mappable snapshot directory."
+    )
+    parser.add_argument(
+        "--output",
+        default="graph_snapshot",
+        help="Directory to write the snapshot .npy arrays and manifest.json into.",
+    )
+    args = parser.parse_args()
+
+    scorer = KnowledgeGraphScorer()
+    try:
+        manifest = scorer.export_snapshot(args.output)
+        print(json.dumps({"status": "ok", "path": args.output, "manifest": manifest}, indent=2, default=str))
+    finally:
+        scorer.close()
+
+
+if __name__ == "__main__":
+    main()
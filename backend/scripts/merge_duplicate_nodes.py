@@ -0,0 +1,50 @@
+import argparse
+import json
+from pathlib import Path
+
+from dotenv import load_dotenv
+
+
+def main():
+    project_root = Path(__file__).resolve().parents[2]
+    load_dotenv(project_root / ".env")
+
+    from backend.entity_resolution import AliasIndex
+    from backend.knowledge_graph import KnowledgeGraphScorer
+    from backend.main import MONGO_URI, get_collections
+
+    parser = argparse.ArgumentParser(
+        description="Merge graph nodes whose names resolve to another node through aliases or fuzzy matching."
+    )
+    parser.add_argument("--fuzzy", action="store_true", help="Also merge trigram fuzzy matches.")
+    parser.add_argument(
+        "--fuzzy-threshold", type=float, default=0.85, help="Minimum trigram Jaccard similarity for fuzzy merges."
+    )
+    parser.add_argument("--batch-size", type=int, default=500, help="Duplicate nodes per UNWIND write batch.")
+    parser.add_argument("--skip-mongo", action="store_true", help="Only use names and aliases stored in the graph.")
+    parser.add_argument("--dry-run", action="store_true", help="Print the merge plan without writing.")
+    args = parser.parse_args()
+
+    scorer = KnowledgeGraphScorer()
+    client = None
+    try:
+        collections = None
+        if MONGO_URI and not args.skip_mongo:
+            collections, client = get_collections()
+
+        alias_index = AliasIndex(fuzzy=args.fuzzy, fuzzy_threshold=args.fuzzy_threshold)
+        loaded = alias_index.refresh(collections, scorer)
+        pairs = alias_index.duplicate_pairs(scorer.list_entity_names(), fuzzy=args.fuzzy)
+        stats = scorer.merge_duplicate_nodes(pairs, batch_size=args.batch_size, dry_run=args.dry_run)
+        output = {"status": "ok", "loaded": loaded, **stats}
+        if args.dry_run:
+            output["pairs"] = pairs
+        print(json.dumps(output, indent=2, default=str))
+    finally:
+        if client is not None:
+            client.close()
+        scorer.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+import argparse
+import hashlib
+import json
+from datetime import datetime, timezone
+from pathlib import Path
+
+from bson import ObjectId
+from dotenv import load_dotenv
+from pymongo import UpdateOne
+
+
+def comment_created_at(timestamp, fallback: datetime) -> datetime:
+    try:
+        created_at = datetime.fromisoformat(str(timestamp).strip().replace("Z", "+00:00"))
+    except ValueError:
+        return fallback
+    if created_at.tzinfo is None:
+        created_at = created_at.replace(tzinfo=timezone.utc)
+    return created_at.astimezone(timezone.utc)
+
+
+def migrated_comment_id(article_id: ObjectId, index: int, created_at: datetime) -> ObjectId:
+    seconds = max(0, min(int(created_at.timestamp()), 2**32 - 1))
+    article_hash = hashlib.md5(article_id.binary).digest()[:5]
+    return ObjectId(seconds.to_bytes(4, "big") + article_hash + index.to_bytes(3, "big"))
+
+
+def migrate_article_comments(collections, article, build_comment_docs) -> int:
+    operations = []
+    created_at = article["_id"].generation_time
+    for index, comment_doc in enumerate(build_comment_docs(article["_id"], article.get("comments") or [])):
+        comment_doc.pop("article_id")
+        created_at = comment_created_at(comment_doc["timestamp"], created_at)
+        comment_doc["created_at"] = created_at
+        comment_doc["_id"] = migrated_comment_id(article["_id"], index, comment_doc["created_at"])
+        operations.append(
+            UpdateOne(
+                {"article_id": article["_id"], "migration_index": index},
+                {"$setOnInsert": comment_doc},
+                upsert=True,
+            )
+        )
+    if operations:
+        collections["comments"].bulk_write(operations, ordered=True)
+    collections["articles"].update_one(
+        {"_id": article["_id"]},
+        {
+            "$unset": {"comments": ""},
+            "$set": {"comment_count": collections["comments"].count_documents({"article_id": article["_id"]})},
+        },
+    )
+    return len(operations)
+
+
+def main():
+    project_root = Path(__file__).resolve().parents[2]
+    load_dotenv(project_root / ".env")
+
+    from backend.main import build_comment_docs, get_collections
+
+    parser = argparse.ArgumentParser(
+        description="Move comments embedded in article documents into the comments collection."
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=200,
+        help="Number of articles migrated per batch.",
+    )
+    args = parser.parse_args()
+
+    collections, client = get_collections()
+    stats = {"articles_migrated": 0, "comments_migrated": 0}
+    try:
+        cursor = collections["articles"].find(
+            {"comments": {"$exists": True}},
+            {"comments": 1},
+            batch_size=args.batch_size,
+        )
+        for article in cursor:
+            migrated = migrate_article_comments(collections, article, build_comment_docs)
+            stats["articles_migrated"] += 1
+            stats["comments_migrated"] += migrated
+        print(json.dumps({"status": "ok", "stats": stats}, indent=2))
+    finally:
+        client.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+import argparse
+import json
+from pathlib import Path
+
+from dotenv import load_dotenv
+from pymongo import UpdateOne
+
+from backend.cold_storage import SEARCH_TEXT_VERSION, search_text_fields
+
+
+def backfill_search_text(collections, cold_storage, batch_size: int = 500) -> int:
+    collection = collections["articles"]
+    operations = []
+    cold_ids = []
+    updated = 0
+    for doc in collection.find(
+        {"search_text_version": {"$ne": SEARCH_TEXT_VERSION}},
+        {"content": 1, "storage_tier": 1},
+    ):
+        if doc.get("content") is None:
+            if doc.get("storage_tier") == "cold":
+                cold_ids.append(doc["_id"])
+            continue
+        operations.append(UpdateOne({"_id": doc["_id"]}, {"$set": search_text_fields(doc["content"])}))
+        if len(operations) >= batch_size:
+            collection.bulk_write(operations, ordered=False)
+            updated += len(operations)
+            operations = []
+
+    for start in range(0, len(cold_ids), batch_size):
+        for article_id, payload in cold_storage.load(collections, cold_ids[start : start + batch_size]).items():
+            if payload.get("content") is not None:
+                operations.append(UpdateOne({"_id": article_id}, {"$set": search_text_fields(payload["content"])}))
+        if len(operations) >= batch_size:
+            collection.bulk_write(operations, ordered=False)
+            updated += len(operations)
+            operations = []
+    if operations:
+        collection.bulk_write(operations, ordered=False)
+        updated += len(operations)
+    return updated
+
+
+def migrate_text_index(articles_collection, has_legacy_text_index, text_index_keys) -> bool:
+    if not has_legacy_text_index(articles_collection):
+        return False
+    articles_collection.drop_index("article_text_index")
+    articles_collection.create_index(text_index_keys, name="article_text_index")
+    return True
+
+
+def main():
+    project_root = Path(__file__).resolve().parents[2]
+    load_dotenv(project_root / ".env")
+
+    from backend.main import ARTICLE_TEXT_INDEX_KEYS, cold_storage, get_collections, has_legacy_text_index
+
+    parser = argparse.ArgumentParser(
+        description="Rebuild search_text for articles with an older version and migrate the text index."
+    )
+    parser.add_argument("--batch-size", type=int, default=500, help="Articles updated per bulk write.")
+    args = parser.parse_args()
+
+    collections, client = get_collections()
+    try:
+        stats = {
+            "articles_updated": backfill_search_text(collections, cold_storage, max(1, args.batch_size)),
+            "text_index_rebuilt": migrate_text_index(
+                collections["articles"], has_legacy_text_index, ARTICLE_TEXT_INDEX_KEYS
+            ),
+        }
+        print(json.dumps({"status": "ok", "stats": stats}, indent=2))
+    finally:
+        client.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,40 @@
+import argparse
+import json
+from pathlib import Path
+
+from dotenv import load_dotenv
+from backend.knowledge_graph import KnowledgeGraphScorer
+
+
+def main():
+    project_root = Path(__file__).resolve().parents[2]
+    load_dotenv(project_root / ".env")
+
+    parser = argparse.ArgumentParser(
+        description="Propagate bias from seeded nodes across the whole graph and rewrite inferred node scores."
+    )
+    parser.add_argument("--max-iterations", type=int, default=100)
+    parser.add_argument("--tolerance", type=float, default=1e-4, help="Stop once no value moves more than this.")
+    parser.add_argument(
+        "--decay", type=float, default=0.85, help="Confidence kept per hop away from the seeded anchors."
+    )
+    parser.add_argument("--batch-size", type=int, default=1000, help="Nodes per UNWIND write batch.")
+    parser.add_argument("--dry-run", action="store_true", help="Report convergence stats without writing.")
+    args = parser.parse_args()
+
+    scorer = KnowledgeGraphScorer()
+    try:
+        stats = scorer.propagate_graph_bias(
+            max_iterations=args.max_iterations,
+            tolerance=args.tolerance,
+            decay=args.decay,
+            batch_size=args.batch_size,
+            dry_run=args.dry_run,
+        )
+        print(json.dumps({"status": "ok", **stats}, indent=2, default=str))
+    finally:
+        scorer.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,23 @@
+import json
+from pathlib import Path
+
+from dotenv import load_dotenv
+
+
+def main():
+    project_root = Path(__file__).resolve().parents[2]
+    load_dotenv(project_root / ".env")
+
+    from backend.bias_rollups import rebuild_rollups
+    from backend.main import get_collections
+
+    collections, client = get_collections()
+    try:
+        stats = rebuild_rollups(collections["articles"], collections["bias_rollups"])
+        print(json.dumps({"status": "ok", "rollup_documents": stats}, indent=2))
+    finally:
+        client.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+import argparse
+import json
+import time
+from pathlib import Path
+
+from dotenv import load_dotenv
+
+
+def main():
+    project_root = Path(__file__).resolve().parents[2]
+    load_dotenv(project_root / ".env")
+
+    from backend.graph_rebuild import (
+        ArticleGraphLoader,
+        clear_checkpoint,
+        iter_article_pages,
+        read_checkpoint,
+        write_checkpoint,
+    )
+    from backend.knowledge_graph import KnowledgeGraphScorer
+    from backend.main import ENABLE_ENTITY_RESOLUTION, alias_index, build_scoring_context, get_collections
+
+    parser = argparse.ArgumentParser(
+        description="Recreate article-derived graph nodes and relationships from the Mongo articles collection."
+    )
+    parser.add_argument("--page-size", type=int, default=5000, help="Articles read and flushed per page.")
+    parser.add_argument("--batch-size", type=int, default=1000, help="Rows per UNWIND write batch.")
+    parser.add_argument("--checkpoint", default="articles", help="Name of the resume checkpoint document.")
+    parser.add_argument("--restart", action="store_true", help="Ignore any saved checkpoint and start over.")
+    parser.add_argument("--max-pages", type=int, default=0, help="Stop after this many pages (0 for no limit).")
+    args = parser.parse_args()
+
+    scorer = KnowledgeGraphScorer()
+    collections, client = get_collections()
+    try:
+        if scorer.get_graph_version() is None:
+            raise RuntimeError(
+                "Neo4j is not reachable. "
+                f"{scorer.get_connection_error() or 'Check Neo4j URI/credentials in .env.'}"
+            )
+        if ENABLE_ENTITY_RESOLUTION:
+            alias_index.refresh(collections, scorer)
+            scorer.use_alias_index(alias_index)
+
+        if args.restart:
+            clear_checkpoint(collections, args.checkpoint)
+        checkpoint = read_checkpoint(collections, args.checkpoint) or {}
+        if checkpoint.get("completed"):
+            output = {"status": "ok", "completed": True, **checkpoint["stats"]}
+            print(json.dumps(output, indent=2, default=str))
+            return
+
+        stats = {
+            "articles_processed": 0,
+            "pages": 0,
+            "nodes_merged": 0,
+            "nodes_created": 0,
+            "relationships_merged": 0,
+            "relationships_created": 0,
+        }
+        stats.update(checkpoint.get("stats") or {})
+        last_article_id = checkpoint.get("last_article_id")
+        loader = ArticleGraphLoader(scorer, batch_size=max(1, args.batch_size))
+        started = time.perf_counter()
+        processed = 0
+        completed = True
+
+        for page, (last_article_id, contexts) in enumerate(
+            iter_article_pages(collections, build_scoring_context, last_article_id, max(1, args.page_size)),
+            start=1,
+        ):
+            for context in contexts:
+                loader.add(context)
+            counts = loader.flush()
+            for field in ("nodes_merged", "nodes_created", "relationships_merged", "relationships_created"):
+                stats[field] += counts.get(field, 0)
+            stats["articles_processed"] += len(contexts)
+            stats["pages"] += 1
+            processed += len(contexts)
+            write_checkpoint(collections, args.checkpoint, last_article_id, stats)
+            if args.max_pages and page >= args.max_pages:
+                completed = False
+                break
+
+        if completed:
+            write_checkpoint(collections, args.checkpoint, last_article_id, stats, completed=True)
+
+        elapsed = time.perf_counter() - started
+        output = {
+            "status": "ok",
+            **stats,
+            "completed": completed,
+            "last_article_id": last_article_id,
+            "distinct_nodes": loader.seen_counts()["nodes"],
+            "distinct_relationships": loader.seen_counts()["relationships"],
+            "seconds": round(elapsed, 2),
+            "articles_per_second": round(processed / elapsed, 1) if elapsed > 0 else None,
+            "graph_version": scorer.get_graph_version(),
+        }
+        print(json.dumps(output, indent=2, default=str))
+    finally:
+        client.close()
+        scorer.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+import heapq
+import threading
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, List, Optional
+
+
+class EntityInvertedIndex:
+    def __init__(self, max_postings_scanned: int = 2000, refresh_seconds: float = 60.0, batch_size: int = 500):
+        self.max_postings_scanned = max(1, int(max_postings_scanned))
+        self.refresh_seconds = max(0.0, refresh_seconds)
+        self.batch_size = max(1, int(batch_size))
+        self._postings: Dict[str, Dict[str, float]] = {}
+        self._article_entities: Dict[str, Dict[str, float]] = {}
+        self._lock = threading.Lock()
+        self._refresh_lock = threading.Lock()
+        self._watermark: Optional[datetime] = None
+
+    @property
+    def ready(self) -> bool:
+        return self._watermark is not None
+
+    def __len__(self) -> int:
+        return len(self._article_entities)
+
+    def _remove_locked(self, article_id: str) -> None:
+        for entity_key in self._article_entities.pop(article_id, {}):
+            postings = self._postings.get(entity_key)
+            if postings is None:
+                continue
+            postings.pop(article_id, None)
+            if not postings:
+                del self._postings[entity_key]
+
+    def set_article(self, article_id: Any, entity_weights: Dict[str, float]) -> None:
+        article_id = str(article_id)
+        with self._lock:
+            self._remove_locked(article_id)
+            if not entity_weights:
+                return
+            self._article_entities[article_id] = dict(entity_weights)
+            for entity_key, weight in entity_weights.items():
+                self._postings.setdefault(entity_key, {})[article_id] = weight
+
+    def remove_article(self, article_id: Any) -> None:
+        with self._lock:
+            self._remove_locked(str(article_id))
+
+    def entities_for(self, article_id: Any) -> Optional[Dict[str, float]]:
+        with self._lock:
+            entities = self._article_entities.get(str(article_id))
+            return dict(entities) if entities is not None else None
+
+    def similar(self, article_id: Any, k: int = 10) -> List[Dict[str, Any]]:
+        article_id = str(article_id)
+        with self._lock:
+            query = self._article_entities.get(article_id)
+            if not query:
+                return []
+
+            ordered = sorted(query.items(), key=lambda item: item[1], reverse=True)
+            scores: Dict[str, float] = {}
+            shared: Dict[str, List[str]] = {}
+            for entity_key, weight in ordered:
+                postings = self._postings.get(entity_key, {})
+                if len(postings) <= self.max_postings_scanned:
+                    candidates = postings.items()
+                else:
+                    candidates = [
+                        (candidate_id, postings[candidate_id])
+                        for candidate_id in list(scores)
+                        if candidate_id in postings
+                    ]
+                    if len(candidates) < self.max_postings_scanned:
+                        recent = []
+                        for candidate_id in reversed(postings):
+                            if len(recent) >= self.max_postings_scanned:
+                                break
+                            if candidate_id not in scores:
+                                recent.append((candidate_id, postings[candidate_id]))
+                        candidates.extend(recent)
+
+                for candidate_id, candidate_weight in candidates:
+                    if candidate_id == article_id:
+                        continue
+                    scores[candidate_id] = scores.get(candidate_id, 0.0) + min(weight, candidate_weight)
+                    shared.setdefault(candidate_id, []).append(entity_key)
+
+        top = heapq.nlargest(k, scores.items(), key=lambda item: item[1])
+        return [
+            {
+                "article_id": candidate_id,
+                "score": round(score, 6),
+                "shared_entities": shared[candidate_id],
+            }
+            for candidate_id, score in top
+        ]
+
+    def refresh(
+        self,
+        articles_collection,
+        entity_weights_for: Callable[[List[Any]], Dict[Any, List[Dict[str, Any]]]],
+    ) -> int:
+        if not self._refresh_lock.acquire(blocking=False):
+            return 0
+        try:
+            started_at = datetime.now(timezone.utc) - timedelta(seconds=5)
+            query: Dict[str, Any] = {}
+            if self._watermark is not None:
+                query["updated_at"] = {"$gte": self._watermark}
+
+            loaded = 0
+            missing: List[Any] = []
+            for doc in articles_collection.find(query, {"graph_entities": 1}):
+                entities = doc.get("graph_entities")
+                if entities is None:
+                    missing.append(doc["_id"])
+                    if len(missing) >= self.batch_size:
+                        loaded += self._load_missing(missing, entity_weights_for)
+                        missing = []
+                    continue
+                self.set_article(doc["_id"], {item["key"]: item["weight"] for item in entities})
+                loaded += 1
+            if missing:
+                loaded += self._load_missing(missing, entity_weights_for)
+
+            self._watermark = started_at
+            return loaded
+        finally:
+            self._refresh_lock.release()
+
+    def _load_missing(self, article_ids: List[Any], entity_weights_for) -> int:
+        loaded = entity_weights_for(article_ids)
+        for article_id, entities in loaded.items():
+            self.set_article(article_id, {item["key"]: item["weight"] for item in entities or []})
+        return len(loaded)
@@ -126,6 +126,7 @@ def render_article_card(article):
     st.write(f"Organizations: {', '.join(article.get('organizations', []))}")
     st.write(f"Think Tanks: {', '.join(article.get('think_tanks', []))}")
     st.write(f"Keywords: {', '.join(article.get('keywords', []))}")
+    st.write(f"Comments: {article.get('comment_count', 0)}")
     st.write(article.get("content", ""))
 
     evidence = graph_signal.get("evidence") or []
@@ -0,0 +1,128 @@
+import os
+
+os.environ.setdefault("MONGO_URI", "mongodb://mongomock")
+os.environ.setdefault("GRAPH_BACKEND", "memory")
+
+import mongomock
+import pytest
+from pymongo import InsertOne, UpdateOne
+from pymongo.errors import BulkWriteError, PyMongoError
+
+
+def _bulk_write(self, operations, ordered=True, **kwargs):
+    errors = []
+    for index, operation in enumerate(operations):
+        try:
+            if isinstance(operation, UpdateOne):
+                self.update_one(operation._filter, operation._doc, upsert=operation._upsert)
+            elif isinstance(operation, InsertOne):
+                self.insert_one(operation._doc)
+            else:
+                raise NotImplementedError(type(operation))
+        except (TypeError, mongomock.WriteError, PyMongoError) as exc:
+            errors.append({"index": index, "code": getattr(exc, "code", None), "errmsg": str(exc), "op": operation})
+            if ordered:
+                break
+    if errors:
+        raise BulkWriteError({"writeErrors": errors, "writeConcernErrors": []})
+
+
+@pytest.fixture
+def mongo_client(monkeypatch):
+    monkeypatch.setattr(mongomock.collection.Collection, "bulk_write", _bulk_write)
+    return mongomock.MongoClient()
+
+
+@pytest.fixture
+def collections(mongo_client):
+    db = mongo_client["data"]
+    return {
+        name: db[name]
+        for name in (
+            "articles",
+            "authors",
+            "publishers",
+            "comments",
+            "scoring_cache",
+            "article_fingerprints",
+            "article_contents",
+            "bias_rollups",
+        )
+    }
+
+
+@pytest.fixture
+def app_module(monkeypatch, mongo_client):
+    import backend.main as main
+    from backend.entity_index import SuggestionIndex
+    from backend.memory_graph import MemoryGraph
+    from backend.query_cache import QueryResultCache
+    from backend.scoring_cache import ScoringCache
+    from backend.similar_articles import EntityInvertedIndex
+
+    class SharedClient:
+        def __init__(self, *args, **kwargs):
+            pass
+
+        def __getitem__(self, name):
+            return mongo_client[name]
+
+        def close(self):
+            pass
+
+    monkeypatch.setattr(main, "MongoClient", SharedClient)
+    monkeypatch.setattr(main, "_INDEXES_READY", False)
+    monkeypatch.setattr(main, "query_cache", QueryResultCache(max_entries=256, ttl_seconds=30.0))
+    monkeypatch.setattr(main, "scoring_cache", ScoringCache(max_entries=256))
+    monkeypatch.setattr(main, "similar_index", EntityInvertedIndex())
+    monkeypatch.setattr(main, "suggestion_index", SuggestionIndex())
+    main.kg_scorer.use_memory_graph(MemoryGraph())
+    return main
+
+
+@pytest.fixture
+def client(app_module):
+    from fastapi.testclient import TestClient
+
+    return TestClient(app_module.app)
+
+
+def build_article_payload(title="Budget vote", **overrides):
+    payload = {
+        "title": title,
+        "content": "The senate passed the budget after a long debate over spending and taxes.",
+        "category": "politics",
+        "author": {"name": "Jane Doe"},
+        "publisher": {"name": "Daily Ledger"},
+        "keywords": ["budget"],
+    }
+    payload.update(overrides)
+    return payload
+
+
+@pytest.fixture
+def article_payload():
+    return build_article_payload
+
+
+@pytest.fixture
+def synthetic_graph():
+    from backend.benchmarks.synthetic import GraphSpec, generate_graph
+
+    spec = GraphSpec(
+        authors=60,
+        publishers=12,
+        publisher_houses=5,
+        organizations=30,
+        think_tanks=10,
+        topics=25,
+        seed=3,
+    )
+    return generate_graph(spec)
+
+
+@pytest.fixture
+def synthetic_articles(synthetic_graph):
+    from backend.benchmarks.synthetic import generate_articles
+
+    return generate_articles(synthetic_graph, 30, seed=5, new_entity_ratio=0.2)
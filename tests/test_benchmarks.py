@@ -0,0 +1,72 @@
+from collections import Counter
+
+from backend.benchmarks.run import compare_reports, latency_summary, run_macro, run_micro
+from backend.benchmarks.synthetic import GraphSpec, generate_articles, generate_graph
+from backend.knowledge_graph import normalize_text
+
+SMALL_SPEC = dict(authors=40, publishers=8, publisher_houses=4, organizations=20, think_tanks=6, topics=20)
+
+
+def test_generators_are_repeatable():
+    spec = GraphSpec(**SMALL_SPEC, seed=4)
+    first, second = generate_graph(spec), generate_graph(spec)
+    assert first.rows == second.rows
+    assert first.links == second.links
+    assert generate_articles(first, 10, seed=2) == generate_articles(second, 10, seed=2)
+    assert generate_graph(GraphSpec(**SMALL_SPEC, seed=5)).rows != first.rows
+    assert {entity_type: len(names) for entity_type, names in first.names.items()} == spec.counts()
+
+
+def test_hub_degree_follows_popularity():
+    synthetic = generate_graph(GraphSpec(**dict(SMALL_SPEC, authors=400, topics=50), hub_exponent=1.5))
+    degree = Counter(
+        normalize_text(row["target_name"]) for row in synthetic.rows if row.get("target_type") == "publisher"
+    )
+    degree.update(link["to_key"] for link in synthetic.links if link["to_label"] == "Publisher")
+    ranked = [count for _, count in degree.most_common()]
+    assert ranked[0] > 3 * ranked[len(ranked) // 2]
+
+    assert generate_graph(GraphSpec(**SMALL_SPEC, known_bias_ratio=1.0)).unknown == []
+
+
+def test_articles_only_use_known_names_without_new_entities():
+    synthetic = generate_graph(GraphSpec(**SMALL_SPEC))
+    articles = generate_articles(synthetic, 25, new_entity_ratio=0.0)
+    for article in articles:
+        assert article["author"] in synthetic.names["author"]
+        assert article["publisher"] in synthetic.names["publisher"]
+        assert set(article["keywords"]) <= set(synthetic.names["topic"])
+        assert set(article["topic_scores"]) <= set(article["keywords"])
+
+
+def test_micro_and_macro_reports():
+    spec = GraphSpec(**SMALL_SPEC)
+    articles = generate_articles(generate_graph(spec), 12, seed=3)
+
+    micro = run_micro(spec, articles, repeat=1)
+    assert micro["build_candidate_entities"]["calls"] == 12
+    assert micro["fetch_node_with_neighbors"]["calls"] > 12
+
+    direct = run_macro(spec, articles, enable_ml_model=True)
+    assert direct["articles"] == 12
+    assert sum(direct["graph_status"].values()) == 12
+    assert direct["round_trips_by_operation"]["_merge_candidate_node"] > 1
+    assert direct["p50_ms"] <= direct["p99_ms"] <= direct["max_ms"]
+
+    coalesced = run_macro(spec, articles, enable_ml_model=True, write_mode="coalesced", flush_every=6)
+    assert "_merge_candidate_node" not in coalesced["round_trips_by_operation"]
+    assert coalesced["round_trips_per_article"] < direct["round_trips_per_article"]
+    assert coalesced["graph_nodes_after"] == direct["graph_nodes_after"]
+
+
+def test_latency_summary_and_baseline_comparison():
+    summary = latency_summary([0.001, 0.002, 0.003, 0.004])
+    assert summary["mean_ms"] == 2.5
+    assert summary["max_ms"] == 4.0
+
+    current = {"macro": {"articles": {"articles_per_sec": 150.0, "p99_ms": 4.0}}}
+    baseline = {"macro": {"articles": {"articles_per_sec": 100.0, "p99_ms": 8.0}}, "micro": {}}
+    assert compare_reports(current, baseline) == {
+        "macro.articles.articles_per_sec": 1.5,
+        "macro.articles.p99_ms": 0.5,
+    }
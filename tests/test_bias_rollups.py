@@ -0,0 +1,68 @@
+from datetime import datetime, timezone
+
+import pytest
+
+from backend.bias_rollups import apply_rollup_changes, query_bias_trends, rebuild_rollups
+
+
+def make_article(label, score, publisher_id="pub-1", day=1):
+    return {
+        "publisher_id": publisher_id,
+        "author_id": "author-1",
+        "category": "politics",
+        "created_at": datetime(2024, 1, day, 12, tzinfo=timezone.utc),
+        "classification": {"label": label, "score": score, "confidence": 0.5},
+    }
+
+
+def rollup_rows(collection):
+    return sorted(
+        (row["entity_type"], row["entity_key"], row["day"], row["label"], row["count"], round(row["score_sum"], 6))
+        for row in collection.find({"count": {"$gt": 0}})
+    )
+
+
+def test_rebuild_matches_incremental_deltas(collections):
+    articles = [make_article("left", -0.4), make_article("left", -0.2, day=2), make_article("right", 0.6, "pub-2")]
+    for article in articles:
+        collections["articles"].insert_one(article)
+        apply_rollup_changes(collections["bias_rollups"], None, article)
+    moved = dict(articles[0], classification={"label": "center", "score": 0.0, "confidence": 0.9})
+    collections["articles"].replace_one({"_id": articles[0]["_id"]}, moved)
+    apply_rollup_changes(collections["bias_rollups"], articles[0], moved)
+    incremental = rollup_rows(collections["bias_rollups"])
+
+    stats = rebuild_rollups(collections["articles"], collections["bias_rollups"])
+    assert stats["all"] == 3
+    assert rollup_rows(collections["bias_rollups"]) == incremental
+    series = query_bias_trends(collections["bias_rollups"], "publisher", ["pub-1"])
+    assert [(bucket["day"], bucket["total"]) for bucket in series] == [("2024-01-01", 1), ("2024-01-02", 1)]
+
+
+def test_rebuild_swaps_in_a_staging_collection(collections):
+    collections["bias_rollups"].insert_one(
+        {"entity_type": "all", "entity_key": "all", "day": "1999-01-01", "label": "left", "count": 5}
+    )
+    collections["articles"].insert_one(make_article("left", -0.4))
+    rebuild_rollups(collections["articles"], collections["bias_rollups"])
+
+    database = collections["bias_rollups"].database
+    assert [name for name in database.list_collection_names() if "_rebuild_" in name] == []
+    assert collections["bias_rollups"].count_documents({"day": "1999-01-01"}) == 0
+    assert collections["bias_rollups"].count_documents({}) == 4
+
+
+def test_failed_rebuild_keeps_existing_rollups(collections):
+    collections["bias_rollups"].insert_one(
+        {"entity_type": "all", "entity_key": "all", "day": "2024-01-01", "label": "left", "count": 5}
+    )
+
+    class BrokenArticles:
+        def aggregate(self, *args, **kwargs):
+            raise RuntimeError("aggregation failed")
+
+    with pytest.raises(RuntimeError):
+        rebuild_rollups(BrokenArticles(), collections["bias_rollups"])
+    database = collections["bias_rollups"].database
+    assert [name for name in database.list_collection_names() if "_rebuild_" in name] == []
+    assert collections["bias_rollups"].count_documents({}) == 1
@@ -0,0 +1,92 @@
+import sys
+from datetime import datetime, timedelta, timezone
+
+from backend.background import PeriodicWorker
+from backend.cold_storage import SEARCH_TEXT_VERSION, ColdStorage, build_search_text
+from backend.scripts import migrate_search_text
+
+LONG_BODY = " ".join(f"term{index}" for index in range(1000)) + " closingword"
+
+
+def test_search_text_indexes_every_distinct_word():
+    text = build_search_text("The Budget, the budget and THE senate. " + LONG_BODY)
+    words = text.split()
+    assert words[:4] == ["the", "budget", "and", "senate"]
+    assert "closingword" in words
+    assert len(words) == len(set(words)) == 1005
+
+
+def test_archive_round_trip_and_search_text(collections):
+    old = datetime.now(timezone.utc) - timedelta(days=400)
+    article_id = collections["articles"].insert_one(
+        {
+            "content": LONG_BODY,
+            "graph_signal": {"evidence": [{"key": "Topic:budget"}]},
+            "created_at": old,
+            "updated_at": old,
+        }
+    ).inserted_id
+    storage = ColdStorage(age_days=180)
+
+    assert storage.archive_due(collections) == 1
+    archived = collections["articles"].find_one({"_id": article_id})
+    assert archived["storage_tier"] == "cold"
+    assert "content" not in archived
+    assert "closingword" in archived["search_text"]
+    assert archived["search_text_version"] == SEARCH_TEXT_VERSION
+    payload = storage.load(collections, [article_id])[article_id]
+    assert payload["content"] == LONG_BODY
+    assert payload["evidence"] == [{"key": "Topic:budget"}]
+
+
+def test_backfill_rebuilds_truncated_search_text(app_module, collections):
+    hot_id = collections["articles"].insert_one({"content": LONG_BODY, "search_text": "term0 term1"}).inserted_id
+    old = datetime.now(timezone.utc) - timedelta(days=400)
+    cold_id = collections["articles"].insert_one(
+        {"content": LONG_BODY, "created_at": old, "updated_at": old, "search_text_version": SEARCH_TEXT_VERSION}
+    ).inserted_id
+    ColdStorage(age_days=180).archive_due(collections)
+    collections["articles"].update_one(
+        {"_id": cold_id}, {"$set": {"search_text": "term0"}, "$unset": {"search_text_version": ""}}
+    )
+
+    assert migrate_search_text.backfill_search_text(collections, ColdStorage(), batch_size=1) == 2
+    for article_id in (hot_id, cold_id):
+        article = collections["articles"].find_one({"_id": article_id})
+        assert article["search_text_version"] == SEARCH_TEXT_VERSION
+        assert article["search_text"].endswith("closingword")
+
+
+def test_text_index_migration_runs_outside_ensure_indexes(app_module, collections, monkeypatch, capsys):
+    articles = collections["articles"]
+    articles.create_index([("title", "text"), ("content", "text")], name="article_text_index")
+    article_id = articles.insert_one({"title": "t", "content": LONG_BODY}).inserted_id
+
+    app_module.ensure_indexes(collections)
+    assert app_module.has_legacy_text_index(articles)
+    assert "search_text" not in articles.find_one({"_id": article_id})
+
+    monkeypatch.setattr(sys, "argv", ["migrate_search_text"])
+    migrate_search_text.main()
+    output = capsys.readouterr().out
+    assert '"articles_updated": 1' in output and '"text_index_rebuilt": true' in output
+    assert not app_module.has_legacy_text_index(articles)
+    assert articles.find_one({"_id": article_id})["search_text_version"] == SEARCH_TEXT_VERSION
+
+
+def test_periodic_worker_counts_failures():
+    calls = []
+
+    def task():
+        calls.append(1)
+        if len(calls) == 1:
+            raise RuntimeError("mongo down")
+
+    worker = PeriodicWorker("test", 60.0, task)
+    assert worker.run_once() is False
+    assert worker.run_once() is True
+    stats = worker.stats()
+    assert stats["runs"] == 2
+    assert stats["failures"] == 1
+    assert stats["last_error"] == "RuntimeError: mongo down"
+    assert stats["running"] is False
@@ -0,0 +1,96 @@
+import sys
+
+from bson import ObjectId
+
+from backend.main import build_comment_docs
+from backend.scripts import migrate_embedded_comments
+
+
+def embedded_comments(count):
+    return [{"user": f"u{index}", "comment": f"c{index}", "timestamp": "2024-01-01"} for index in range(count)]
+
+
+def test_comments_paginate_in_insertion_order(client, article_payload):
+    article_id = client.post("/articles", json=article_payload()).json()["_id"]
+    for index in range(5):
+        response = client.post(
+            f"/articles/{article_id}/comments",
+            json={"user": "u", "comment": f"c{index}", "timestamp": "2024-01-01"},
+        )
+        assert response.status_code == 201
+
+    first = client.get(f"/articles/{article_id}/comments", params={"limit": 3}).json()
+    assert [item["comment"] for item in first["comments"]] == ["c0", "c1", "c2"]
+    second = client.get(
+        f"/articles/{article_id}/comments", params={"limit": 3, "after": first["next_cursor"]}
+    ).json()
+    assert [item["comment"] for item in second["comments"]] == ["c3", "c4"]
+    assert second["next_cursor"] is None
+
+
+def test_put_cannot_replace_appended_comments(client, article_payload, collections):
+    article_id = client.post("/articles", json=article_payload()).json()["_id"]
+    client.post(f"/articles/{article_id}/comments", json={"user": "u", "comment": "kept", "timestamp": "2024-01-01"})
+
+    response = client.put(
+        f"/articles/{article_id}",
+        json={"title": "new title", "comments": [{"user": "u", "comment": "x", "timestamp": "2024-01-02"}]},
+    )
+    assert response.status_code == 400
+    comments = client.get(f"/articles/{article_id}/comments").json()["comments"]
+    assert [item["comment"] for item in comments] == ["kept"]
+    stored = collections["articles"].find_one({"_id": ObjectId(article_id)})
+    assert stored["title"] != "new title"
+    assert stored["comment_count"] == 1
+
+
+def test_migrated_comments_sort_by_their_original_time(client, article_payload, app_module, collections):
+    article_id = client.post("/articles", json=article_payload()).json()["_id"]
+    client.post(f"/articles/{article_id}/comments", json={"user": "u", "comment": "posted", "timestamp": "2025-01-01"})
+    embedded = [
+        {"user": "u", "comment": "first", "timestamp": "2023-05-01T10:00:00Z"},
+        {"user": "u", "comment": "second", "timestamp": "2023-05-01T10:00:00Z"},
+        {"user": "u", "comment": "undated", "timestamp": "yesterday"},
+    ]
+    article = {"_id": ObjectId(article_id), "comments": embedded}
+    migrate_embedded_comments.migrate_article_comments(collections, article, build_comment_docs)
+
+    first = client.get(f"/articles/{article_id}/comments", params={"limit": 2}).json()
+    second = client.get(f"/articles/{article_id}/comments", params={"after": first["next_cursor"]}).json()
+    assert [item["comment"] for item in first["comments"] + second["comments"]] == [
+        "first",
+        "second",
+        "undated",
+        "posted",
+    ]
+
+
+def test_migration_is_idempotent_after_a_partial_run(collections):
+    article_id = ObjectId()
+    article = {"_id": article_id, "comments": embedded_comments(3)}
+    collections["articles"].insert_one(dict(article))
+
+    partial = dict(article, comments=embedded_comments(2))
+    migrate_embedded_comments.migrate_article_comments(collections, partial, build_comment_docs)
+    collections["articles"].update_one({"_id": article_id}, {"$set": {"comments": embedded_comments(3)}})
+
+    for _ in range(2):
+        migrate_embedded_comments.migrate_article_comments(collections, article, build_comment_docs)
+
+    stored = list(collections["comments"].find({"article_id": article_id}).sort("_id", 1))
+    assert [doc["comment"] for doc in stored] == ["c0", "c1", "c2"]
+    migrated = collections["articles"].find_one({"_id": article_id})
+    assert migrated["comment_count"] == 3
+    assert "comments" not in migrated
+
+
+def test_migration_script_reports_stats(app_module, collections, monkeypatch, capsys):
+    collections["articles"].insert_one({"_id": ObjectId(), "comments": embedded_comments(2)})
+    collections["articles"].insert_one({"_id": ObjectId(), "title": "no comments"})
+    monkeypatch.setattr(sys, "argv", ["migrate_embedded_comments"])
+
+    migrate_embedded_comments.main()
+    assert '"comments_migrated": 2' in capsys.readouterr().out
+    migrate_embedded_comments.main()
+    assert '"articles_migrated": 0' in capsys.readouterr().out
+    assert collections["comments"].count_documents({}) == 2
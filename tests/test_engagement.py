@@ -0,0 +1,119 @@
+import pytest
+from bson import ObjectId
+from pymongo.errors import BulkWriteError
+
+from backend.engagement import EngagementBuffer
+
+
+class PartiallyFailingCollection:
+    def __init__(self, bad_ids):
+        self.bad_ids = set(bad_ids)
+        self.likes = {}
+
+    def bulk_write(self, operations, ordered=True):
+        errors = []
+        for index, operation in enumerate(operations):
+            article_id = operation._filter["_id"]
+            if article_id in self.bad_ids:
+                errors.append({"index": index, "code": 14, "errmsg": "Cannot apply $inc to a non-numeric value"})
+                continue
+            self.likes[article_id] = self.likes.get(article_id, 0) + operation._doc["$inc"]["engagement.likes"]
+        if errors:
+            raise BulkWriteError({"writeErrors": errors, "nInserted": 0})
+
+
+def test_buffer_aggregates_increments_per_article(collections):
+    article_id = collections["articles"].insert_one({"engagement": {"likes": 0, "shares": 0, "views": 5}}).inserted_id
+    buffer = EngagementBuffer()
+    buffer.add(article_id, {"views": 1})
+    assert buffer.add(article_id, {"views": 2, "likes": 1}) == {"likes": 1, "shares": 0, "views": 3}
+    assert buffer.pending_count() == 1
+
+    assert buffer.flush(collections["articles"]) == 1
+    assert collections["articles"].find_one({"_id": article_id})["engagement"] == {"likes": 1, "shares": 0, "views": 8}
+    assert buffer.pending_count() == 0
+    assert buffer.flush(collections["articles"]) == 0
+
+
+def test_failed_flush_keeps_increments():
+    class FailingCollection:
+        def bulk_write(self, operations, ordered=True):
+            raise RuntimeError("mongo down")
+
+    buffer = EngagementBuffer()
+    article_id = ObjectId()
+    buffer.add(article_id, {"likes": 2})
+    try:
+        buffer.flush(FailingCollection())
+    except RuntimeError:
+        pass
+    assert buffer.add(article_id, {}) == {"likes": 2, "shares": 0, "views": 0}
+
+
+def test_partial_failure_retries_only_the_failed_ops():
+    good, bad = ObjectId(), ObjectId()
+    collection = PartiallyFailingCollection([bad])
+    buffer = EngagementBuffer(max_retries=2)
+    buffer.add(good, {"likes": 1})
+    buffer.add(bad, {"likes": 1})
+
+    for _ in range(3):
+        with pytest.raises(BulkWriteError):
+            buffer.flush(collection)
+        assert collection.likes == {good: 1}
+    assert buffer.pending_count() == 0
+    stats = buffer.stats()
+    assert (stats["flush_failures"], stats["dropped"]) == (3, 1)
+    assert buffer.flush(collection) == 0
+
+
+def test_bad_document_does_not_reapply_committed_increments(collections):
+    articles = collections["articles"]
+    good = articles.insert_one({"engagement": {"likes": 0, "shares": 0, "views": 0}}).inserted_id
+    bad = articles.insert_one({"engagement": {"likes": "many", "shares": 0, "views": 0}}).inserted_id
+    buffer = EngagementBuffer()
+    buffer.add(good, {"likes": 1})
+    buffer.add(bad, {"likes": 1})
+
+    for _ in range(3):
+        with pytest.raises(BulkWriteError):
+            buffer.flush(articles)
+    assert articles.find_one({"_id": good})["engagement"]["likes"] == 1
+    assert articles.find_one({"_id": bad})["engagement"]["likes"] == "many"
+    assert buffer.pending_count() == 1
+
+
+def test_unknown_failures_are_retried_a_bounded_number_of_times():
+    class DownCollection:
+        def bulk_write(self, operations, ordered=True):
+            raise ConnectionError("mongo down")
+
+    buffer = EngagementBuffer(max_retries=1)
+    buffer.add(ObjectId(), {"views": 1})
+    for expected_pending in (1, 0):
+        with pytest.raises(ConnectionError):
+            buffer.flush(DownCollection())
+        assert buffer.pending_count() == expected_pending
+
+
+def test_buffer_rejects_new_articles_when_full(client, app_module, monkeypatch):
+    buffer = EngagementBuffer(max_pending_articles=1, max_buffered_articles=2)
+    monkeypatch.setattr(app_module, "engagement_buffer", buffer)
+    first, second, third = (str(ObjectId()) for _ in range(3))
+    for article_id in (first, second, first):
+        assert client.post(f"/articles/{article_id}/engagement", json={"views": 1}).status_code == 202
+    assert client.post(f"/articles/{third}/engagement", json={"views": 1}).status_code == 503
+    assert app_module.worker_stats()["engagement"]["rejected"] == 1
+
+
+def test_engagement_flush_keeps_query_cache(client, app_module, article_payload):
+    article_id = client.post("/articles", json=article_payload()).json()["_id"]
+    etag = client.get("/articles").headers["ETag"]
+
+    assert client.post(f"/articles/{article_id}/engagement", json={"views": 3}).status_code == 202
+    assert client.post(f"/articles/{article_id}/engagement", json={}).status_code == 400
+    assert app_module.flush_engagement() == 1
+
+    assert client.get("/articles", headers={"If-None-Match": etag}).status_code == 304
+    stored = app_module.get_collections()[0]["articles"].find_one({"_id": ObjectId(article_id)})
+    assert stored["engagement"]["views"] == 3
@@ -0,0 +1,123 @@
+import random
+
+from backend.benchmarks.run import build_scorer
+from backend.entity_extraction import TOPIC_STOPWORDS, EntityExtractor, PhraseAutomaton, is_specific_topic, tokenize
+from backend.memory_graph import MemoryGraph
+
+
+def brute_force_matches(patterns, words):
+    found = []
+    covered_until = 0
+    for start in range(len(words)):
+        if start < covered_until:
+            continue
+        for end in range(len(words), start, -1):
+            entries = patterns.get(tuple(words[start:end]))
+            if entries:
+                found.append((start, end, entries))
+                covered_until = end
+                break
+    return found
+
+
+def test_automaton_matches_brute_force_leftmost_longest():
+    rng = random.Random(11)
+    vocabulary = ["new", "york", "federal", "reserve", "bank", "of", "times", "policy"]
+    automaton = PhraseAutomaton(min_length=1)
+    patterns = {}
+    for index in range(40):
+        words = [rng.choice(vocabulary) for _ in range(rng.randint(1, 4))]
+        name = f"{' '.join(words)} {index}"
+        automaton.add("Organization", name, [" ".join(words)])
+        patterns.setdefault(tuple(words), []).append(("Organization", name))
+
+    for _ in range(200):
+        words = [rng.choice(vocabulary + ["the"]) for _ in range(rng.randint(0, 25))]
+        expected = brute_force_matches(patterns, words)
+        actual = [(start, end, sorted(entries)) for start, end, entries in automaton.find(words)]
+        assert actual == [(start, end, sorted(entries)) for start, end, entries in expected]
+
+
+def test_longest_overlapping_match_wins_and_failure_links_recover():
+    extractor = EntityExtractor()
+    extractor.add("Organization", "Federal Reserve Bank of New York")
+    extractor.add("Organization", "New York")
+    extractor.add("Organization", "National Rifle Association")
+    extractor.add("ThinkTank", "Policy Institute")
+    extractor.publish()
+
+    detected = extractor.extract("The Federal Reserve Bank of New York", "a national policy institute report")
+    assert detected["organizations"] == ["Federal Reserve Bank of New York"]
+    assert detected["think_tanks"] == ["Policy Institute"]
+
+    extractor.add("Organization", "Reserve Bank")
+    extractor.publish()
+    assert extractor.extract("reserve bank of australia")["organizations"] == ["Reserve Bank"]
+
+
+def test_generic_topics_are_not_compiled():
+    assert not is_specific_topic("News")
+    assert not is_specific_topic("the new")
+    assert not is_specific_topic("tax")
+    assert not is_specific_topic("2024")
+    assert is_specific_topic("Climate Change")
+    assert is_specific_topic("new zealand")
+
+    extractor = EntityExtractor(topic_stopwords=TOPIC_STOPWORDS | {"climate"})
+    for name in ("new", "News", "latest update", "tax", "Climate"):
+        assert extractor.add("Topic", name) == 0
+    assert extractor.add("Topic", "Immigration", ["news", "migration"]) == 2
+    assert extractor.add("Organization", "News Corp") == 1
+    extractor.publish()
+
+    detected = extractor.extract("New news on migration", "from News Corp")
+    assert detected["keywords"] == ["Immigration"]
+    assert detected["organizations"] == ["News Corp"]
+
+
+def test_refresh_loads_graph_names_incrementally():
+    graph = MemoryGraph()
+    graph.nodes[("Topic", "news")] = {"name": "News"}
+    graph.nodes[("Organization", "acme institute")] = {"name": "Acme Institute", "aliases": ["Acme"]}
+    scorer = build_scorer(graph, enable_ml_model=False)
+    extractor = EntityExtractor()
+    assert not extractor.ready
+
+    assert extractor.refresh(scorer) == 2
+    assert extractor.ready
+    assert extractor.refresh(scorer) == 0
+    assert tokenize("ACME-Institute") == ["acme", "institute"]
+    assert extractor.extract("Acme said")["organizations"] == ["Acme Institute"]
+
+
+def test_extract_uses_a_compiled_automaton_until_the_next_publish():
+    extractor = EntityExtractor()
+    extractor.add("Organization", "Acme Institute")
+    assert extractor.extract("Acme Institute")["organizations"] == []
+    assert extractor.publish()
+    assert not extractor.publish()
+
+    published = extractor._automaton
+    assert not published._dirty
+    assert extractor.add("Organization", "Acme Institute") == 0
+    assert extractor.add("ThinkTank", "Policy Institute") == 1
+    assert extractor._automaton is published
+    assert extractor.extract("Acme Institute and Policy Institute")["think_tanks"] == []
+
+    extractor.publish()
+    assert extractor._automaton is not published and not extractor._automaton._dirty
+    assert extractor.pattern_count() == 2
+    detected = extractor.extract("Acme Institute and Policy Institute")
+    assert (detected["organizations"], detected["think_tanks"]) == (["Acme Institute"], ["Policy Institute"])
+
+
+def test_detection_does_not_refresh_on_the_request_path(app_module, monkeypatch):
+    def refresh(scorer):
+        raise AssertionError("refresh on request path")
+
+    monkeypatch.setattr(app_module, "ENABLE_ENTITY_EXTRACTION", True)
+    monkeypatch.setattr(app_module, "entity_extractor", EntityExtractor())
+    monkeypatch.setattr(app_module.entity_extractor, "refresh", refresh)
+    detected = app_module.detect_article_entities("Acme Institute", "")
+    assert detected == {"organizations": [], "think_tanks": [], "keywords": []}
+    assert "entity-extraction-refresh" in {stats["name"] for stats in app_module.worker_stats()["workers"]}
@@ -0,0 +1,37 @@
+from backend.main import build_search_tokens, match_entity_ids
+
+
+def test_search_tokens_are_word_suffixes_of_name_and_aliases():
+    assert build_search_tokens("Associated Press", ["AP"]) == ["associated press", "press", "ap"]
+
+
+def test_match_entity_ids_unions_exact_token_and_prefix(app_module, collections):
+    app_module.ensure_indexes(collections)
+    publishers = collections["publishers"]
+    ids = {}
+    for name in ("Associated Press", "Pressroom Daily", "Press", "Daily Ledger"):
+        ids[name] = publishers.insert_one(
+            {
+                "name": name,
+                "publisher_key": name.lower(),
+                "aliases": [],
+                "search_tokens": build_search_tokens(name, []),
+            }
+        ).inserted_id
+
+    matched = set(match_entity_ids(publishers, "publisher", "press"))
+    assert matched == {ids["Associated Press"], ids["Pressroom Daily"], ids["Press"]}
+    assert match_entity_ids(publishers, "publisher", "ledg") == [ids["Daily Ledger"]]
+    assert match_entity_ids(publishers, "publisher", "nothing") == []
+    assert match_entity_ids(publishers, "publisher", "  ") == []
+
+
+def test_author_filter_matches_alias_prefix(client, article_payload):
+    client.post("/articles", json=article_payload(author={"name": "Jane Doe", "aliases": ["J. Q. Public"]}))
+    client.post("/articles", json=article_payload(title="Other", author={"name": "John Smith"}))
+
+    assert [item["author"]["name"] for item in client.get("/articles", params={"author": "publ"}).json()] == [
+        "Jane Doe"
+    ]
+    assert len(client.get("/articles", params={"author": "j"}).json()) == 2
+    assert client.get("/articles", params={"author": "zed"}).json() == []
@@ -0,0 +1,87 @@
+from backend.entity_resolution import AliasIndex
+
+
+def test_alias_cannot_shadow_another_canonical_name():
+    index = AliasIndex()
+    index.add("Publisher", "associated press", "Associated Press", ["AP"])
+    index.add("Publisher", "daily blog", "Daily Blog", ["Associated Press", "The Blog"])
+
+    assert index.resolve("Publisher", "Associated Press")["key"] == "associated press"
+    assert index.resolve("Publisher", "A.P.") is None
+    assert index.resolve("Publisher", "ap") == {
+        "key": "associated press",
+        "name": "Associated Press",
+        "method": "alias",
+        "score": 1.0,
+    }
+    assert index.resolve("Publisher", "the blog")["key"] == "daily blog"
+
+
+def test_canonical_name_wins_over_an_alias_added_first():
+    index = AliasIndex()
+    index.add("Publisher", "daily blog", "Daily Blog", ["Associated Press"])
+    assert index.resolve("Publisher", "Associated Press")["key"] == "daily blog"
+
+    index.add("Publisher", "associated press", "Associated Press")
+    resolved = index.resolve("Publisher", "Associated Press")
+    assert (resolved["key"], resolved["method"]) == ("associated press", "exact")
+    index.add("Publisher", "daily blog", "Daily Blog", ["Associated Press"])
+    assert index.resolve("Publisher", "Associated Press")["key"] == "associated press"
+
+
+def test_fuzzy_match_and_duplicate_pairs():
+    index = AliasIndex(fuzzy=True, fuzzy_threshold=0.6)
+    index.add("Organization", "federal reserve", "Federal Reserve", ["The Fed"])
+    index.add("Organization", "the fed", "The Fed")
+    index.add("Organization", "federal reserv", "Federal Reserv")
+
+    assert index.resolve("Organization", "The Fed")["key"] == "the fed"
+    resolved = index.resolve("Organization", "Federal Reservee")
+    assert resolved["method"] == "fuzzy"
+    assert index.resolve("Organization", "Federal Reservee", fuzzy=False) is None
+
+    nodes = [
+        {"label": "Organization", "key": "federal reserve", "name": "Federal Reserve"},
+        {"label": "Organization", "key": "the fed", "name": "The Fed"},
+        {"label": "Organization", "key": "federal reserv", "name": "Federal Reserv"},
+    ]
+    pairs = index.duplicate_pairs(nodes)
+    assert [(pair["duplicate"], pair["canonical"], pair["method"]) for pair in pairs] == [
+        ("the fed", "federal reserve", "alias")
+    ]
+    pairs = index.duplicate_pairs(nodes, fuzzy=True)
+    assert {(pair["duplicate"], pair["canonical"]) for pair in pairs} == {
+        ("federal reserv", "federal reserve"),
+        ("the fed", "federal reserve"),
+    }
+
+
+def test_request_aliases_are_registered_without_hijacking_canonical_names(app_module, collections, monkeypatch):
+    monkeypatch.setattr(app_module, "ENABLE_ENTITY_RESOLUTION", True)
+    monkeypatch.setattr(app_module, "alias_index", AliasIndex())
+    publishers = collections["publishers"]
+    authors = collections["authors"]
+
+    press_id = app_module.resolve_publisher(publishers, app_module.PublisherModel(name="Associated Press"))
+    blog_id = app_module.resolve_publisher(
+        publishers, app_module.PublisherModel(name="Daily Blog", aliases=["Associated Press", "Reuters"])
+    )
+    assert blog_id != press_id
+    assert app_module.alias_index.resolve("Publisher", "Reuters")["key"] == "daily blog"
+    assert app_module.alias_index.resolve("Publisher", "Associated Press")["key"] == "associated press"
+    assert app_module.resolve_publisher(publishers, source="Associated Press") == press_id
+
+    again = app_module.resolve_publisher(
+        publishers,
+        app_module.PublisherModel(name="daily-blog", website="https://daily.example", aliases=["Bloomberg Blog"]),
+    )
+    assert again == blog_id
+    blog = publishers.find_one({"_id": blog_id})
+    assert blog["aliases"] == ["Associated Press", "Reuters", "daily-blog", "Bloomberg Blog"]
+    assert blog["website"] == "https://daily.example"
+    assert app_module.alias_index.resolve("Publisher", "Bloomberg Blog")["key"] == "daily blog"
+    assert app_module.resolve_publisher(publishers, source="Bloomberg Blog") == blog_id
+
+    app_module.resolve_author(authors, app_module.AuthorModel(name="Jane Doe", aliases=["J. Doe"]))
+    assert app_module.alias_index.resolve("Author", "J. Doe")["key"] == "jane doe"
+    assert app_module.alias_index.resolve("Author", "Jane Doe")["method"] == "exact"
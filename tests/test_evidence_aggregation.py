@@ -0,0 +1,160 @@
+import random
+
+from backend.benchmarks.run import build_scorer
+from backend.graph_traversal import hop_decay
+from backend.knowledge_graph import DEFAULT_NODE_IMPORTANCE, EVIDENCE_TOP_K, KnowledgeGraphScorer, clamp, parse_float
+
+
+def loop_aggregate(candidates, node_data_list, known_bias_keys):
+    # The per-row aggregation that the vectorized version replaced.
+    available_weight = 0.0
+    total_contribution_weight = 0.0
+    weighted_score_sum = 0.0
+    weighted_confidence_sum = 0.0
+    evidence = []
+    per_candidate_rollup = {}
+    for candidate, node_data in zip(candidates, node_data_list):
+        if not node_data:
+            continue
+        candidate_key = candidate["key"]
+        has_related_evidence = False
+        node_score = parse_float(node_data.get("bias_score"))
+        node_confidence = clamp(parse_float(node_data.get("bias_confidence"), 0.65) or 0.65, 0.0, 1.0)
+        default_importance = DEFAULT_NODE_IMPORTANCE.get(candidate["label"], 0.5)
+        node_importance = max(
+            0.0, parse_float(node_data.get("importance_weight"), default_importance) or default_importance
+        )
+        if node_score is not None:
+            available_weight += candidate["base_weight"]
+            contribution_weight = candidate["base_weight"] * node_importance
+            weighted_score = float(node_score) * contribution_weight
+            weighted_score_sum += weighted_score
+            weighted_confidence_sum += node_confidence * contribution_weight
+            total_contribution_weight += contribution_weight
+            has_related_evidence = True
+            evidence.append(
+                {
+                    "source_entity": candidate["name"],
+                    "source_type": candidate["entity_type"],
+                    "matched_node": node_data.get("node_name"),
+                    "matched_type": node_data.get("node_type"),
+                    "path_hops": 0,
+                    "bias_score": float(node_score),
+                    "confidence": node_confidence,
+                    "contribution_weight": round(contribution_weight, 6),
+                    "weighted_contribution": round(weighted_score, 6),
+                }
+            )
+        for related in node_data.get("related", []):
+            related_score = parse_float(related.get("bias_score"))
+            if related_score is None:
+                continue
+            related_confidence = clamp(parse_float(related.get("bias_confidence"), 0.55) or 0.55, 0.0, 1.0)
+            related_importance = max(0.0, parse_float(related.get("importance_weight"), 0.35) or 0.35)
+            relationship_weight = max(0.0, parse_float(related.get("relationship_weight"), 0.75) or 0.75)
+            hops = int(related.get("hops") or 1)
+            contribution_weight = candidate["base_weight"] * related_importance * relationship_weight * hop_decay(hops)
+            if contribution_weight <= 0:
+                continue
+            weighted_score = float(related_score) * contribution_weight
+            weighted_score_sum += weighted_score
+            weighted_confidence_sum += related_confidence * contribution_weight
+            total_contribution_weight += contribution_weight
+            has_related_evidence = True
+            rollup = per_candidate_rollup.setdefault(
+                candidate_key, {"weight_sum": 0.0, "weighted_sum": 0.0, "confidence_weighted_sum": 0.0}
+            )
+            rollup["weight_sum"] += contribution_weight
+            rollup["weighted_sum"] += weighted_score
+            rollup["confidence_weighted_sum"] += related_confidence * contribution_weight
+            evidence.append(
+                {
+                    "source_entity": candidate["name"],
+                    "source_type": candidate["entity_type"],
+                    "matched_node": related.get("node_name"),
+                    "matched_type": related.get("node_type"),
+                    "path_hops": hops,
+                    "bias_score": float(related_score),
+                    "confidence": related_confidence,
+                    "relationship_weight": round(relationship_weight, 6),
+                    "contribution_weight": round(contribution_weight, 6),
+                    "weighted_contribution": round(weighted_score, 6),
+                }
+            )
+        if candidate_key not in known_bias_keys and has_related_evidence:
+            available_weight += candidate["base_weight"] * 0.6
+    top_evidence = sorted(evidence, key=lambda item: abs(item["weighted_contribution"]), reverse=True)
+    return {
+        "available_weight": available_weight,
+        "total_contribution_weight": total_contribution_weight,
+        "weighted_score_sum": weighted_score_sum,
+        "weighted_confidence_sum": weighted_confidence_sum,
+        "per_candidate_rollup": per_candidate_rollup,
+        "evidence": top_evidence[:EVIDENCE_TOP_K],
+    }
+
+
+def assert_matches_loop(scorer, candidates, node_data_list, known_bias_keys=frozenset()):
+    expected = loop_aggregate(candidates, node_data_list, set(known_bias_keys))
+    aggregate = scorer._aggregate_graph_evidence(candidates, node_data_list, set(known_bias_keys))
+    for field in ("available_weight", "total_contribution_weight", "weighted_score_sum", "weighted_confidence_sum"):
+        assert aggregate[field] == expected[field], field
+    assert aggregate["per_candidate_rollup"] == expected["per_candidate_rollup"]
+    requested_weight = sum(candidate["base_weight"] for candidate in candidates)
+    summary = scorer._summarize_graph_evidence(aggregate, requested_weight)
+    if summary["status"] != "no_graph_match":
+        signal = scorer._build_graph_signal(aggregate, summary, requested_weight, 0)
+        assert signal["evidence"] == expected["evidence"]
+    return summary["status"]
+
+
+def test_matches_the_loop_on_synthetic_articles(synthetic_graph, synthetic_articles):
+    scorer = build_scorer(synthetic_graph.build_memory_graph(), enable_ml_model=False)
+    graph = scorer._get_driver()
+    for article in synthetic_articles:
+        candidates = scorer._build_candidate_entities(article)
+        node_data_list = [
+            graph.fetch_node_with_neighbors(
+                candidate["label"], candidate["key"], DEFAULT_NODE_IMPORTANCE.get(candidate["label"], 0.5)
+            )
+            for candidate in candidates
+        ]
+        known = {
+            candidate["key"]
+            for candidate, data in zip(candidates, node_data_list)
+            if data and data["bias_score"] is not None
+        }
+        assert_matches_loop(scorer, candidates, node_data_list, known)
+
+
+def test_matches_the_loop_on_irregular_rows():
+    rng = random.Random(19)
+    values = [None, 0, 0.0, "0.4", "bad", -0.3, 0.7, 1.5, "2"]
+    candidates = []
+    node_data_list = []
+    for index in range(6):
+        candidates.append(
+            {"label": "Topic", "key": f"topic {index}", "name": f"Topic {index}", "entity_type": "topic",
+             "base_weight": rng.choice([0.5, 1.0, 1.3])}
+        )
+        related = [
+            {
+                "node_name": f"node {index}-{row}",
+                "node_type": "Publisher",
+                "bias_score": rng.choice(values),
+                "bias_confidence": rng.choice(values),
+                "importance_weight": rng.choice(values),
+                "relationship_weight": rng.choice(values),
+                "hops": rng.choice([None, 1, 2, "2", 0]),
+            }
+            for row in range(rng.randint(0, 40))
+        ]
+        related += [dict(related[0], node_name=f"tie {index}-{row}") for row in range(5)] if related else []
+        node_data_list.append(
+            {"bias_score": rng.choice([None, -0.4, "0.2"]), "bias_confidence": rng.choice(values),
+             "importance_weight": rng.choice(values), "related": related, "node_name": f"Topic {index}",
+             "node_type": "Topic"}
+        )
+    node_data_list.append(None)
+    candidates.append(dict(candidates[0], key="missing"))
+    assert assert_matches_loop(KnowledgeGraphScorer(), candidates, node_data_list, {"topic 1"}) != "no_graph_match"
@@ -0,0 +1,32 @@
+def test_facets_count_labels_categories_and_keywords(client, article_payload):
+    client.post("/articles", json=article_payload(keywords=["budget", "taxes"], category="politics"))
+    client.post("/articles", json=article_payload(title="Storm", keywords=["weather"], category="science"))
+    client.post("/articles", json=article_payload(title="Tax cuts", keywords=["taxes"], category="politics"))
+
+    body = client.get("/articles/facets").json()
+    assert body["total"] == 3
+    assert body["total_is_estimate"] is False
+    categories = {row["value"]: row["count"] for row in body["facets"]["category"]}
+    assert categories == {"politics": 2, "science": 1}
+    keywords = body["facets"]["keywords"]
+    assert keywords[0] == {"value": "taxes", "count": 2}
+    assert sum(row["count"] for row in body["facets"]["label"]) == 3
+
+
+def test_facets_respect_filters_and_keyword_limit(client, article_payload):
+    client.post("/articles", json=article_payload(keywords=["budget", "taxes"], category="politics"))
+    client.post("/articles", json=article_payload(title="Storm", keywords=["weather"], category="science"))
+
+    body = client.get("/articles/facets", params={"category": "science", "keyword_limit": 1}).json()
+    assert body["total"] == 1
+    assert body["facets"]["keywords"] == [{"value": "weather", "count": 1}]
+
+
+def test_estimated_total_only_without_filters(client, article_payload):
+    client.post("/articles", json=article_payload())
+    estimated = client.get("/articles/facets", params={"estimated_total": True}).json()
+    assert estimated["total"] == 1
+    assert estimated["total_is_estimate"] is True
+    filtered = client.get("/articles/facets", params={"estimated_total": True, "category": "politics"}).json()
+    assert filtered["total_is_estimate"] is False
+    assert filtered["total"] == 1
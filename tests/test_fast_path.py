@@ -0,0 +1,85 @@
+from backend.benchmarks.run import CountingMemoryGraph, build_scorer
+
+ARTICLE = {
+    "author": "Jane Doe",
+    "publisher": "Daily Ledger",
+    "organizations": ["Acme Institute"],
+    "keywords": ["budget"],
+}
+FULL_FETCHES = {"_fetch_node_with_neighbors", "_fetch_node_with_pruned_neighbors"}
+
+
+def seeded_graph(confidence=0.9, inferred=False):
+    graph = CountingMemoryGraph()
+    graph.nodes[("Author", "jane doe")] = {
+        "name": "Jane Doe",
+        "bias_score": -0.6,
+        "bias_confidence": confidence,
+        "inferred_from_articles": inferred,
+    }
+    graph.nodes[("Publisher", "daily ledger")] = {
+        "name": "Daily Ledger",
+        "bias_score": -0.4,
+        "bias_confidence": confidence,
+        "inferred_from_articles": inferred,
+    }
+    return graph
+
+
+def test_confident_direct_biases_skip_the_traversal():
+    graph = seeded_graph()
+    scorer = build_scorer(graph, enable_ml_model=False, scoring_mode="adaptive")
+    signal = scorer.evaluate_graph_signal(ARTICLE)
+
+    assert signal["status"] == "ok_fast_path"
+    assert signal["label"] in {"Left", "Lean Left"}
+    assert "traversal" not in signal
+    round_trips = graph.reset_round_trips()
+    assert round_trips["_fetch_direct_nodes"] == 1
+    assert not FULL_FETCHES & set(round_trips)
+
+    metrics = scorer.get_scoring_metrics()
+    assert metrics["paths"]["fast_path"]["articles"] == 1
+    assert metrics["fast_path_hit_rate"] == 1.0
+
+
+def test_low_confidence_falls_back_to_the_full_path():
+    full = build_scorer(seeded_graph(confidence=0.5), enable_ml_model=False).evaluate_graph_signal(ARTICLE)
+    graph = seeded_graph(confidence=0.5)
+    scorer = build_scorer(graph, enable_ml_model=False, scoring_mode="adaptive")
+    signal = scorer.evaluate_graph_signal(ARTICLE)
+
+    assert signal["status"] == full["status"] != "ok_fast_path"
+    for field in ("label", "score", "confidence", "coverage_ratio", "evidence"):
+        assert signal[field] == full[field], field
+    assert FULL_FETCHES & set(graph.reset_round_trips())
+    metrics = scorer.get_scoring_metrics()
+    assert metrics["paths"]["fast_path_miss"]["articles"] == 1
+    assert metrics["fast_path_hit_rate"] == 0.0
+
+
+def test_inferred_biases_do_not_count_toward_the_fast_path():
+    scorer = build_scorer(seeded_graph(inferred=True), enable_ml_model=False, scoring_mode="adaptive")
+    assert scorer.evaluate_graph_signal(ARTICLE)["status"] != "ok_fast_path"
+    assert "fast_path" not in scorer.get_scoring_metrics()["paths"]
+
+
+def test_probe_reads_all_candidates_in_one_transaction():
+    graph = CountingMemoryGraph()
+    scorer = build_scorer(graph, enable_ml_model=False, scoring_mode="adaptive")
+    scorer.evaluate_graph_signal(ARTICLE)
+    assert graph.reset_round_trips()["_fetch_direct_nodes"] == 1
+
+
+def test_fast_path_does_not_persist_inference_for_unknown_candidates():
+    graph = seeded_graph()
+    scorer = build_scorer(graph, enable_ml_model=False, scoring_mode="adaptive")
+    signal = scorer.evaluate_graph_signal(ARTICLE)
+
+    assert signal["status"] == "ok_fast_path"
+    assert signal["inferred_unknown_nodes"] == 0
+    assert graph.nodes[("Organization", "acme institute")].get("bias_score") is None
+    assert graph.nodes[("Topic", "budget")].get("bias_score") is None
+
+    full = build_scorer(graph, enable_ml_model=False)
+    assert full.evaluate_graph_signal(ARTICLE)["inferred_unknown_nodes"] == 2
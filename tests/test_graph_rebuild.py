@@ -0,0 +1,107 @@
+from bson import ObjectId
+
+from backend.benchmarks.run import build_scorer
+from backend.graph_rebuild import (
+    ArticleGraphLoader,
+    clear_checkpoint,
+    iter_article_pages,
+    read_checkpoint,
+    write_checkpoint,
+)
+from backend.memory_graph import MemoryGraph
+
+
+def seed_articles(collections, count):
+    authors = [ObjectId() for _ in range(3)]
+    publishers = [ObjectId() for _ in range(2)]
+    collections["authors"].insert_many(
+        [{"_id": author_id, "name": f"Author {index}"} for index, author_id in enumerate(authors)]
+    )
+    collections["publishers"].insert_many(
+        [{"_id": publisher_id, "name": f"Publisher {index}"} for index, publisher_id in enumerate(publishers)]
+    )
+    collections["articles"].insert_many(
+        [
+            {
+                "_id": ObjectId(),
+                "title": f"Article {index}",
+                "content": "body",
+                "author_id": authors[index % 3],
+                "publisher_id": publishers[index % 2],
+                "organizations": [f"Org {index % 4}"],
+                "keywords": ["budget", f"topic {index % 5}"],
+                "category": "politics",
+            }
+            for index in range(count)
+        ]
+    )
+
+
+def rebuild(collections, build_context, scorer, checkpoint="articles", max_pages=0, page_size=4):
+    state = read_checkpoint(collections, checkpoint) or {}
+    loader = ArticleGraphLoader(scorer, batch_size=3)
+    articles = 0
+    last_article_id = state.get("last_article_id")
+    for page, (last_article_id, contexts) in enumerate(
+        iter_article_pages(collections, build_context, last_article_id, page_size), start=1
+    ):
+        for context in contexts:
+            loader.add(context)
+        loader.flush()
+        articles += len(contexts)
+        write_checkpoint(collections, checkpoint, last_article_id, {"articles_processed": articles})
+        if max_pages and page >= max_pages:
+            return articles
+    write_checkpoint(collections, checkpoint, last_article_id, {"articles_processed": articles}, completed=True)
+    return articles
+
+
+def test_pages_follow_id_order_and_resume_after_an_id(app_module, collections):
+    seed_articles(collections, 10)
+    pages = list(iter_article_pages(collections, app_module.build_scoring_context, None, 4))
+    assert [len(contexts) for _, contexts in pages] == [4, 4, 2]
+    assert pages[0][1][0]["author"] == "Author 0"
+    assert pages[0][1][1]["publisher"] == "Publisher 1"
+
+    resumed = list(iter_article_pages(collections, app_module.build_scoring_context, pages[0][0], 4))
+    assert [len(contexts) for _, contexts in resumed] == [4, 2]
+    assert resumed[-1][0] == pages[-1][0]
+
+
+def test_checkpoint_round_trip(collections):
+    assert read_checkpoint(collections, "articles") is None
+    write_checkpoint(collections, "articles", "abc", {"pages": 2})
+    saved = read_checkpoint(collections, "articles")
+    assert (saved["last_article_id"], saved["stats"], saved["completed"]) == ("abc", {"pages": 2}, False)
+    clear_checkpoint(collections, "articles")
+    assert read_checkpoint(collections, "articles") is None
+
+
+def test_loader_writes_each_node_and_edge_once():
+    graph = MemoryGraph()
+    scorer = build_scorer(graph, enable_ml_model=False)
+    loader = ArticleGraphLoader(scorer, batch_size=2)
+    context = {"author": "Jane Doe", "publisher": "Daily Ledger", "keywords": ["budget"]}
+
+    assert loader.add(context) > 0
+    assert loader.add(dict(context)) == 0
+    assert loader.add({**context, "keywords": ["budget", "tax policy"]}) > 0
+    counts = loader.flush()
+    assert counts["nodes_created"] == len(graph.nodes) == loader.seen_counts()["nodes"]
+    assert counts["relationships_created"] == len(graph.relationships) == loader.seen_counts()["relationships"]
+
+
+def test_resumed_rebuild_matches_a_single_pass(app_module, collections):
+    seed_articles(collections, 11)
+    full_graph = MemoryGraph()
+    assert rebuild(collections, app_module.build_scoring_context, build_scorer(full_graph, False), "full") == 11
+
+    graph = MemoryGraph()
+    assert rebuild(collections, app_module.build_scoring_context, build_scorer(graph, False), max_pages=1) == 4
+    assert not read_checkpoint(collections, "articles")["completed"]
+    assert rebuild(collections, app_module.build_scoring_context, build_scorer(graph, False)) == 7
+    assert read_checkpoint(collections, "articles")["completed"]
+
+    assert set(graph.nodes) == set(full_graph.nodes)
+    assert set(graph.relationships) == set(full_graph.relationships)
+    assert graph.version > 0
@@ -0,0 +1,94 @@
+import json
+
+import numpy as np
+import pytest
+
+from backend.benchmarks.run import build_scorer
+from backend.graph_snapshot import MANIFEST_FILE, GraphSnapshot, write_snapshot
+from backend.knowledge_graph import KnowledgeGraphScorer
+from backend.memory_graph import MemoryGraph
+
+NODES = [
+    {"label": "Topic", "key": "climate", "name": "Climate", "bias_score": None},
+    {"label": "Publisher", "key": "zeta news", "name": "Zeta News", "bias_score": 0.4, "bias_confidence": 0.8},
+    {"label": "Publisher", "key": "ápex", "name": "Ápex", "bias_score": -0.5, "importance_weight": 0.95},
+    {"label": "PublisherHouse", "key": "zeta corp", "name": "Zeta Corp"},
+]
+RELATIONSHIPS = [
+    {"from_label": "Publisher", "from_key": "zeta news", "to_label": "PublisherHouse", "to_key": "zeta corp",
+     "type": "OWNED_BY", "weight": 0.9},
+    {"from_label": "Publisher", "from_key": "ápex", "to_label": "Topic", "to_key": "climate",
+     "type": "COVERS", "weight": None},
+    {"from_label": "Topic", "from_key": "climate", "to_label": "Topic", "to_key": "climate",
+     "type": "RELATED_TO", "weight": 0.5},
+    {"from_label": "Publisher", "from_key": "missing", "to_label": "Topic", "to_key": "climate",
+     "type": "COVERS", "weight": 0.6},
+]
+
+
+def test_round_trip_is_memory_mapped(tmp_path):
+    manifest = write_snapshot(str(tmp_path), NODES, RELATIONSHIPS, metadata={"graph_version": 7})
+    assert manifest["node_count"] == 4
+    assert manifest["relationship_count"] == 3
+
+    snapshot = GraphSnapshot.load(str(tmp_path))
+    assert isinstance(snapshot._arrays["adj_indptr"], np.memmap)
+    assert snapshot.graph_version == 7
+    assert snapshot.find_node("Publisher", "missing") is None
+    assert snapshot.find_node("Author", "zeta news") is None
+
+    apex = snapshot.find_node("Publisher", "ápex")
+    assert snapshot.node_properties(apex) == {
+        "label": "Publisher",
+        "key": "ápex",
+        "name": "Ápex",
+        "bias_score": -0.5,
+        "bias_confidence": None,
+        "importance_weight": 0.95,
+    }
+    climate = snapshot.find_node("Topic", "climate")
+    assert sorted(node for _, node, _ in snapshot.neighbors(climate)) == sorted([apex, climate])
+    assert [weight for _, node, weight in snapshot.neighbors(apex)] == [None]
+    assert snapshot.has_relationship(apex, climate, "COVERS")
+    assert not snapshot.has_relationship(climate, apex, "COVERS")
+
+    def rel_key(rel):
+        return (rel["from_key"], rel["to_key"], rel["type"])
+
+    assert sorted(snapshot.iter_relationships(), key=rel_key) == sorted(RELATIONSHIPS[:3], key=rel_key)
+    assert sorted(node["key"] for node in snapshot.iter_nodes()) == sorted(node["key"] for node in NODES)
+
+
+def test_rejects_unknown_format(tmp_path):
+    write_snapshot(str(tmp_path), NODES, RELATIONSHIPS)
+    manifest_path = tmp_path / MANIFEST_FILE
+    manifest = json.loads(manifest_path.read_text())
+    manifest["format_version"] = 99
+    manifest_path.write_text(json.dumps(manifest))
+    with pytest.raises(ValueError):
+        GraphSnapshot.load(str(tmp_path))
+    with pytest.raises(FileNotFoundError):
+        GraphSnapshot.load(str(tmp_path / "absent"))
+
+
+def test_offline_scoring_matches_the_live_graph(tmp_path, synthetic_graph, synthetic_articles):
+    exporter = build_scorer(synthetic_graph.build_memory_graph(), enable_ml_model=False)
+    exporter.export_snapshot(str(tmp_path))
+    snapshot = GraphSnapshot.load(str(tmp_path))
+    assert snapshot.node_count == len(exporter._get_driver().read_snapshot_nodes())
+
+    offline = KnowledgeGraphScorer()
+    offline.graph_backend = "neo4j"
+    offline.neo4j_uri = None
+    offline.load_snapshot(str(tmp_path))
+
+    scored = 0
+    for article in synthetic_articles:
+        live = build_scorer(MemoryGraph.from_snapshot(snapshot), enable_ml_model=False)
+        expected = live.evaluate_graph_signal(article)
+        actual = offline.evaluate_graph_signal(article)
+        assert actual["graph_source"] == "snapshot"
+        for field in ("label", "score", "confidence", "coverage_ratio", "available_weight", "evidence"):
+            assert actual[field] == expected[field], field
+        scored += bool(actual["evidence"])
+    assert scored > len(synthetic_articles) // 2
@@ -0,0 +1,90 @@
+from backend.graph_traversal import beam_traverse, collect_related_nodes, neighbor_expander
+from backend.knowledge_graph import GRAPH_TRAVERSAL_EXPAND_QUERY, KnowledgeGraphScorer
+from backend.memory_graph import MemoryGraph, MemoryResult
+
+
+def hub_graph(publishers=40):
+    graph = MemoryGraph()
+    graph.merge_candidate_node({"label": "Topic", "key": "budget", "name": "Budget"})
+    for index in range(publishers):
+        key = f"publisher {index:02d}"
+        graph.seed_row({"entity_type": "publisher", "name": key, "bias_label": "center"})
+        graph.merge_relationship("Publisher", key, "Topic", "budget", "COVERS", round(0.2 + index / 100, 2))
+    graph.seed_row(
+        {"entity_type": "publisher", "name": "publisher 39", "bias_label": "left", "target_type": "publisher_house",
+         "target_name": "House", "relationship_type": "OWNED_BY", "relationship_weight": "0.9"}
+    )
+    return graph
+
+
+def traverse(graph, start, max_hops=2, fanout=5, min_path_weight=0.0):
+    return beam_traverse(
+        start, neighbor_expander(graph._neighbors, graph._node_properties), max_hops, fanout, min_path_weight
+    )
+
+
+def test_fanout_keeps_the_heaviest_relationships():
+    graph = hub_graph()
+    related, stats = traverse(graph, ("Topic", "budget"), max_hops=1)
+    assert [item["node_name"] for item in related] == [f"publisher {index}" for index in (39, 38, 37, 36, 35)]
+    assert stats["fanout_truncated"] == 35
+    assert stats["paths_explored"] == 5
+    assert stats["truncated"]
+
+
+def test_second_hop_does_not_reuse_relationships_and_cuts_the_beam():
+    graph = hub_graph()
+    related, stats = traverse(graph, ("Publisher", "publisher 39"), fanout=3)
+    two_hop = [item for item in related if item["hops"] == 2]
+    assert "publisher 39" not in [item["node_name"] for item in two_hop]
+    assert len(two_hop) == 3
+    assert abs(two_hop[0]["relationship_weight"] - 0.59 * 0.58) < 1e-9
+    assert stats["fanout_truncated"] == 36
+
+    full = collect_related_nodes(("Publisher", "publisher 39"), graph._neighbors, graph._node_properties)
+    unbounded_related, unbounded = traverse(graph, ("Publisher", "publisher 39"), fanout=1000)
+    assert unbounded["truncated"] is False
+    assert sorted(unbounded_related, key=repr) == sorted(full, key=repr)
+
+
+def test_weight_floor_prunes_light_paths():
+    graph = hub_graph()
+    _, stats = traverse(graph, ("Topic", "budget"), max_hops=1, fanout=100, min_path_weight=0.3)
+    kept = [index for index in range(40) if round(0.2 + index / 100, 2) * 0.55 >= 0.3]
+    assert stats["paths_explored"] == len(kept)
+    assert stats["weight_pruned"] == 40 - len(kept)
+
+
+class ExpandQueryTx:
+    def __init__(self, graph):
+        self.graph = graph
+        self.expand = neighbor_expander(graph._neighbors, graph._node_properties)
+        self.expand_calls = 0
+
+    def run(self, query, **params):
+        if query == GRAPH_TRAVERSAL_EXPAND_QUERY:
+            self.expand_calls += 1
+            frontier = [{"node": row["node_id"], "rel_ids": row["rel_ids"]} for row in params["frontier"]]
+            return MemoryResult(
+                [
+                    {"index": index, "expansions": items, "available": available}
+                    for index, (items, available) in enumerate(self.expand(frontier, params["fanout"]))
+                    if available
+                ]
+            )
+        node_data = self.graph._node_data("Topic", params["key"], params["default_importance"])
+        return MemoryResult([{"node_id": ("Topic", params["key"]), "node_data": node_data}] if node_data else [])
+
+
+def test_neo4j_expansion_matches_the_memory_beam():
+    assert "LIMIT $fanout" in GRAPH_TRAVERSAL_EXPAND_QUERY
+    assert "COUNT {" in GRAPH_TRAVERSAL_EXPAND_QUERY
+    graph = hub_graph()
+    tx = ExpandQueryTx(graph)
+    scorer = KnowledgeGraphScorer()
+    actual = scorer._fetch_node_with_pruned_neighbors(tx, "Topic", "budget", 0.5, 2, 4, 0.01)
+    expected = graph.fetch_node_with_pruned_neighbors("Topic", "budget", 0.5, 2, 4, 0.01)
+    assert actual["related"] == expected["related"]
+    assert actual["traversal"] == expected["traversal"]
+    assert tx.expand_calls == 2
+    assert scorer._fetch_node_with_pruned_neighbors(tx, "Topic", "missing", 0.5, 2, 4, 0.01) is None
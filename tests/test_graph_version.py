@@ -0,0 +1,72 @@
+from backend.benchmarks.run import CountingMemoryGraph, build_scorer
+from backend.knowledge_graph import KnowledgeGraphScorer
+
+
+def test_bump_writes_counter_and_label_versions_in_one_transaction():
+    graph = CountingMemoryGraph()
+    scorer = build_scorer(graph, enable_ml_model=False)
+    with graph.session() as session:
+        value = scorer._bump_graph_version(session, ["Topic", "Author", "Topic"])
+
+    assert value == graph.version == 1
+    assert graph.label_versions == {"Author": 1, "Topic": 1}
+    assert graph.reset_round_trips() == {"_write_graph_version_bump": 1}
+
+
+def test_direct_scoring_defers_the_bump_to_one_flush(synthetic_graph, synthetic_articles):
+    graph = CountingMemoryGraph.wrap(synthetic_graph.build_memory_graph())
+    scorer = build_scorer(graph, enable_ml_model=False)
+    start_version = graph.version
+    node_count = len(graph.nodes)
+
+    for article in synthetic_articles:
+        scorer.evaluate_graph_signal(article)
+    assert len(graph.nodes) > node_count
+    assert graph.version == start_version
+    assert "_write_graph_version_bump" not in graph.reset_round_trips()
+
+    assert scorer.flush_graph_version() == start_version + 1
+    assert graph.reset_round_trips() == {"_write_graph_version_bump": 1}
+    assert graph.label_versions
+    assert set(graph.label_versions.values()) == {start_version + 1}
+    assert scorer.flush_graph_version() is None
+    assert graph.reset_round_trips() == {}
+
+
+def test_signal_is_stamped_with_the_version_read_before_scoring(synthetic_graph, synthetic_articles, monkeypatch):
+    scorer = build_scorer(synthetic_graph.build_memory_graph(), enable_ml_model=False)
+    scorer.graph_version_refresh_seconds = 0.0
+    graph = scorer._get_driver()
+    before = scorer.get_graph_version()
+    original = scorer._fetch_candidate_nodes
+
+    def fetch_with_concurrent_bump(session, candidates):
+        graph.bump_graph_version(["Topic"])
+        return original(session, candidates)
+
+    monkeypatch.setattr(scorer, "_fetch_candidate_nodes", fetch_with_concurrent_bump)
+    signal = scorer.evaluate_graph_signal(synthetic_articles[0])
+    assert signal["graph_version"] == before
+    assert scorer.get_graph_version() == before + 1
+    assert scorer.is_signal_stale(signal, graph.version, graph.label_versions)
+
+
+def test_signal_labels_include_candidates_without_a_node(synthetic_graph, synthetic_articles):
+    scorer = build_scorer(synthetic_graph.build_memory_graph(), enable_ml_model=False, write_mode="coalesced")
+    graph = scorer._get_driver()
+    missing = 0
+    for article in synthetic_articles:
+        candidates = scorer._build_candidate_entities(article)
+        missing += sum((candidate["label"], candidate["key"]) not in graph.nodes for candidate in candidates)
+        signal = scorer.evaluate_graph_signal(article)
+        assert {candidate["label"] for candidate in candidates} <= set(signal["graph_labels"])
+    assert missing
+
+
+def test_signal_is_stale_only_when_one_of_its_labels_changed():
+    signal = {"graph_version": 3, "graph_labels": ["Publisher", "Topic"]}
+    assert not KnowledgeGraphScorer.is_signal_stale(signal, 3, {})
+    assert not KnowledgeGraphScorer.is_signal_stale(signal, 5, {"Topic": 3, "Author": 5})
+    assert KnowledgeGraphScorer.is_signal_stale(signal, 5, {"Topic": 4})
+    assert KnowledgeGraphScorer.is_signal_stale({"graph_version": 3}, 5, {})
+    assert KnowledgeGraphScorer.is_signal_stale(signal, None, {})
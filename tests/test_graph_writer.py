@@ -0,0 +1,78 @@
+import pytest
+
+from backend.benchmarks.run import build_scorer
+from backend.graph_writer import GraphWriteQueue
+from backend.memory_graph import MemoryGraph
+
+CANDIDATES = [
+    {"label": "Publisher", "key": "daily ledger", "name": "Daily Ledger"},
+    {"label": "Topic", "key": "budget", "name": "Budget"},
+]
+RELATIONSHIPS = [
+    {"from": CANDIDATES[0], "to": CANDIDATES[1], "type": "COVERS", "weight": 0.62},
+]
+
+
+class FailingSession:
+    def execute_write(self, *args, **kwargs):
+        raise ConnectionError("neo4j down")
+
+    execute_read = execute_write
+
+
+def test_writes_are_deduplicated_and_flushed_in_batches():
+    graph = MemoryGraph()
+    scorer = build_scorer(graph, enable_ml_model=False, write_mode="coalesced")
+    queue = GraphWriteQueue(batch_size=1)
+    queue.add(CANDIDATES, RELATIONSHIPS)
+    assert queue.add(CANDIDATES, RELATIONSHIPS) == 3
+
+    counts = scorer.flush_graph_writes(queue)
+    assert counts["nodes_created"] == 2
+    assert counts["relationships_created"] == 1
+    assert counts["labels"] == ["Publisher", "Topic"]
+    assert queue.pending_count() == 0
+    assert graph.relationships[(("Publisher", "daily ledger"), "COVERS", ("Topic", "budget"))]["weight"] == 0.62
+    assert queue.stats()["flushes"] == 1
+
+
+def test_failed_flush_is_restored_and_recorded():
+    queue = GraphWriteQueue()
+    queue.add(CANDIDATES, RELATIONSHIPS)
+    with pytest.raises(ConnectionError):
+        queue.flush(FailingSession(), build_scorer(MemoryGraph(), enable_ml_model=False))
+    stats = queue.stats()
+    assert stats["pending"] == 3
+    assert stats["flush_failures"] == 1
+    assert stats["last_error"] == "ConnectionError: neo4j down"
+
+
+def test_full_queue_flushes_inline(synthetic_graph, synthetic_articles):
+    scorer = build_scorer(synthetic_graph.build_memory_graph(), enable_ml_model=False, write_mode="coalesced")
+    scorer.graph_write_queue = GraphWriteQueue(max_pending_writes=5, max_queued_writes=20)
+    largest_article = 0
+    for article in synthetic_articles:
+        candidates = scorer._build_candidate_entities(article)
+        largest_article = max(largest_article, len(candidates) + len(scorer._build_article_relationships(candidates)))
+        scorer.evaluate_graph_signal(article)
+        assert scorer.graph_write_queue.pending_count() < 20 + largest_article
+
+    stats = scorer.get_scoring_metrics()["write_queue"]
+    assert stats["inline_flushes"] > 0
+    assert stats["flushes"] == stats["inline_flushes"]
+
+
+def test_full_queue_rejects_writes_when_the_inline_flush_fails():
+    scorer = build_scorer(MemoryGraph(), enable_ml_model=False, write_mode="coalesced")
+    scorer.graph_write_queue = GraphWriteQueue(max_pending_writes=1, max_queued_writes=3)
+    scorer.graph_write_queue.add(CANDIDATES, RELATIONSHIPS)
+    extra = [{"label": "Topic", "key": "taxes", "name": "Taxes", "base_weight": 1.0}]
+
+    class ReadOnlySession(FailingSession):
+        def execute_read(self, *args, **kwargs):
+            return []
+
+    with pytest.raises(ConnectionError):
+        scorer._queue_article_context(ReadOnlySession(), extra)
+    assert scorer.graph_write_queue.pending_count() == 3
+    assert scorer.get_scoring_metrics()["write_queue"]["flush_failures"] == 1
@@ -0,0 +1,83 @@
+import pytest
+
+from backend.benchmarks.run import build_scorer
+from backend.inference_buffer import InferenceBuffer
+from backend.memory_graph import MemoryGraph, MemoryGraphSession
+
+TOPICS = ["budget", "climate", "taxes"]
+
+
+class FlakySession(MemoryGraphSession):
+    def __init__(self, graph, fail_on_call):
+        super().__init__(graph)
+        self.fail_on_call = fail_on_call
+        self.calls = 0
+
+    def execute_write(self, transaction_function, *args, **kwargs):
+        self.calls += 1
+        if self.calls == self.fail_on_call:
+            raise ConnectionError("neo4j down")
+        return super().execute_write(transaction_function, *args, **kwargs)
+
+
+def unknown_topic_graph():
+    graph = MemoryGraph()
+    for key in TOPICS:
+        graph.merge_candidate_node({"label": "Topic", "key": key, "name": key.title()})
+    return graph
+
+
+def observe(buffer, label, keys, score):
+    for key in keys:
+        buffer.add(label, key, {"weight_sum": 1.0, "weighted_sum": score, "confidence_weighted_sum": 0.5,
+                                "observations": 1})
+
+
+def test_observations_accumulate_before_flushing():
+    graph = unknown_topic_graph()
+    buffer = InferenceBuffer()
+    observe(buffer, "Topic", ["budget"], -0.6)
+    observe(buffer, "Topic", ["budget"], 0.2)
+    assert buffer.pending_count() == 1
+
+    result = buffer.flush(graph.session(), build_scorer(graph, enable_ml_model=False))
+    assert result == {"nodes_updated": 1, "labels": ["Topic"], "error": None}
+    node = graph.nodes[("Topic", "budget")]
+    assert node["inference_observations"] == 2
+    assert node["bias_score"] == pytest.approx(-0.2)
+
+
+def test_failed_flush_only_restores_uncommitted_batches():
+    graph = unknown_topic_graph()
+    scorer = build_scorer(graph, enable_ml_model=False)
+    buffer = InferenceBuffer(batch_size=1)
+    observe(buffer, "Topic", TOPICS, -0.5)
+
+    result = buffer.flush(FlakySession(graph, fail_on_call=2), scorer)
+    assert isinstance(result["error"], ConnectionError)
+    assert result["nodes_updated"] == 1
+    assert buffer.pending_count() == 2
+
+    buffer.flush(graph.session(), scorer)
+    assert [graph.nodes[("Topic", key)]["inference_observations"] for key in TOPICS] == [1, 1, 1]
+
+
+def test_scorer_bumps_committed_labels_before_raising():
+    graph = unknown_topic_graph()
+    scorer = build_scorer(graph, enable_ml_model=False, inference_mode="deferred")
+    scorer.inference_buffer = InferenceBuffer(batch_size=1)
+    observe(scorer.inference_buffer, "Topic", TOPICS[:2], 0.4)
+    observe(scorer.inference_buffer, "Organization", ["union"], 0.4)
+    graph.merge_candidate_node({"label": "Organization", "key": "union", "name": "Union"})
+    version = graph.version
+
+    original_session = graph.session
+    graph.session = lambda database=None: FlakySession(graph, fail_on_call=3)
+    try:
+        with pytest.raises(ConnectionError):
+            scorer.flush_inference()
+    finally:
+        graph.session = original_session
+    assert graph.version > version
+    assert scorer.inference_buffer.pending_count() == 1
+    assert scorer.flush_inference() == 1
@@ -0,0 +1,136 @@
+import re
+from collections import Counter
+from pathlib import Path
+
+from backend.graph_traversal import DEFAULT_RELATIONSHIP_WEIGHT
+from backend.memory_graph import MemoryGraph, MemoryGraphSession
+
+SEED_ROWS = [
+    {"entity_type": "publisher", "name": "Daily Ledger", "bias_label": "lean right", "bias_confidence": "0.8",
+     "target_type": "publisher_house", "target_name": "Ledger Group", "relationship_type": "OWNED_BY",
+     "relationship_weight": "0.9"},
+    {"entity_type": "publisher_house", "name": "Ledger Group", "bias_label": "right", "bias_confidence": "0.7"},
+    {"entity_type": "author", "name": "Jane Doe", "bias_label": "center",
+     "target_type": "publisher", "target_name": "Daily Ledger", "relationship_type": "WRITES_FOR"},
+    {"entity_type": "think_tank", "name": "Policy Lab", "bias_label": "left", "bias_confidence": "0.6",
+     "target_type": "topic", "target_name": "Budget", "relationship_type": "ADVOCATES_FOR",
+     "relationship_weight": "0.68"},
+]
+
+
+def seeded_graph():
+    graph = MemoryGraph()
+    for row in SEED_ROWS:
+        graph.seed_row(row)
+    graph.merge_candidate_node({"label": "Topic", "key": "budget", "name": "Budget"})
+    graph.merge_candidate_node({"label": "Organization", "key": "union", "name": "Union"})
+    graph.merge_relationship("Publisher", "daily ledger", "Topic", "budget", "COVERS", 0.62)
+    graph.merge_relationship("Organization", "union", "Topic", "budget", "ADVOCATES_FOR", None)
+    graph.merge_relationship("Topic", "budget", "Topic", "budget", "RELATED_TO", 0.5)
+    graph.merge_relationship("Publisher", "daily ledger", "PublisherHouse", "ledger group", "SYNDICATES", 0.4)
+    return graph
+
+
+def cypher_related(graph, start):
+    # (n)-[rels*1..2]-(m) WHERE m.bias_score IS NOT NULL, with Cypher's per-path relationship uniqueness.
+    edges = [(ref, props.get("weight")) for ref, props in graph.relationships.items()]
+
+    def steps(node, used):
+        for index, ((source, _, target), weight) in enumerate(edges):
+            if index in used:
+                continue
+            if source == node:
+                yield index, target, weight
+            elif target == node:
+                yield index, source, weight
+
+    factor = lambda weight: DEFAULT_RELATIONSHIP_WEIGHT if weight is None else weight
+    rows = []
+    for first, middle, first_weight in steps(start, set()):
+        paths = [(middle, factor(first_weight), 1)]
+        for _, end, second_weight in steps(middle, {first}):
+            paths.append((end, factor(first_weight) * factor(second_weight), 2))
+        for node, weight, hops in paths:
+            if graph.nodes[node].get("bias_score") is not None:
+                rows.append((graph.nodes[node]["name"], round(weight, 9), hops))
+    return Counter(rows)
+
+
+def test_related_nodes_follow_variable_length_match_semantics():
+    graph = seeded_graph()
+    for ref in graph.nodes:
+        node_data = graph.fetch_node_with_neighbors(ref[0], ref[1], 0.5)
+        actual = Counter(
+            (item["node_name"], round(item["relationship_weight"], 9), item["hops"]) for item in node_data["related"]
+        )
+        assert actual == cypher_related(graph, ref), ref
+
+
+def test_merge_semantics_match_cypher_coalesce_rules():
+    graph = seeded_graph()
+    assert graph.merge_candidate_node({"label": "Topic", "key": "budget", "name": "Budget Talks"}) == {
+        "has_bias": False,
+        "inferred": False,
+        "created": False,
+    }
+    budget = graph.nodes[("Topic", "budget")]
+    assert budget["name"] == "Budget Talks"
+    assert budget["source"] == "article_metadata"
+
+    publisher = graph.nodes[("Publisher", "daily ledger")]
+    assert graph.merge_candidate_node({"label": "Publisher", "key": "daily ledger", "name": "Daily Ledger"})[
+        "has_bias"
+    ]
+    assert publisher["importance_weight"] == 0.95
+    assert publisher["source"] == "allsides.com"
+
+    covers = (("Publisher", "daily ledger"), "COVERS", ("Topic", "budget"))
+    assert graph.merge_relationship("Publisher", "daily ledger", "Topic", "budget", "COVERS", 0.1) is False
+    assert graph.relationships[covers]["weight"] == 0.62
+    advocates = (("Organization", "union"), "ADVOCATES_FOR", ("Topic", "budget"))
+    assert graph.relationships[advocates]["weight"] is None
+    graph.merge_relationship("Organization", "union", "Topic", "budget", "ADVOCATES_FOR", 0.3)
+    assert graph.relationships[advocates]["weight"] == 0.3
+    assert graph.merge_relationship("Organization", "missing", "Topic", "budget", "ADVOCATES_FOR", 0.3) is False
+
+    graph.seed_row(dict(SEED_ROWS[0], relationship_weight="0.5"))
+    owned = (("Publisher", "daily ledger"), "OWNED_BY", ("PublisherHouse", "ledger group"))
+    assert graph.relationships[owned]["weight"] == 0.5
+    assert graph.nodes[("PublisherHouse", "ledger group")]["bias_label"] == "Right"
+
+
+def test_inference_only_fills_missing_bias():
+    graph = seeded_graph()
+    assert graph.update_inferred_node_bias("Topic", "budget", -0.3, 0.4, "Lean Left") == 1
+    assert graph.update_inferred_node_bias("Topic", "budget", 0.9, 0.4, "Right") == 0
+    assert graph.update_inferred_node_bias("Publisher", "daily ledger", -0.9, 0.4, "Left") == 0
+    assert graph.update_inferred_node_bias("Topic", "missing", -0.9, 0.4, "Left") == 0
+    assert graph.nodes[("Topic", "budget")]["bias_score"] == -0.3
+    [direct] = graph.fetch_direct_nodes({"Topic": [{"key": "budget", "default_importance": 0.5}]})
+    assert direct["node_data"]["inferred"] is True
+    assert graph.read_candidate_bias_state("Topic", ["budget", "missing"]) == [{"key": "budget", "inferred": True}]
+
+
+def test_every_scorer_transaction_has_a_memory_operation():
+    source = Path(__file__).resolve().parents[1].joinpath("backend", "knowledge_graph.py").read_text()
+    used = set(re.findall(r"execute_(?:read|write)\(\s*(?:self|KnowledgeGraphScorer)\.(\w+)", source))
+    assert used
+    assert used <= set(MemoryGraphSession(MemoryGraph())._operations)
+
+
+def test_scoring_creates_article_nodes_once(synthetic_graph, synthetic_articles):
+    from backend.benchmarks.run import build_scorer
+
+    scorer = build_scorer(synthetic_graph.build_memory_graph(), enable_ml_model=False)
+    graph = scorer._get_driver()
+    for article in synthetic_articles:
+        first = scorer.evaluate_graph_signal(article)
+        if first["inferred_unknown_nodes"]:
+            break
+    assert first["inferred_unknown_nodes"]
+    node_count = len(graph.nodes)
+    relationship_count = len(graph.relationships)
+    second = scorer.evaluate_graph_signal(article)
+    assert first["status"].startswith("ok")
+    assert (len(graph.nodes), len(graph.relationships)) == (node_count, relationship_count)
+    assert second["inferred_unknown_nodes"] == 0
@@ -0,0 +1,58 @@
+from bson import ObjectId
+
+from backend.near_duplicates import (
+    LSH_BANDS,
+    build_fingerprint,
+    estimate_similarity,
+    find_near_duplicates,
+    minhash_signature,
+)
+
+BASE_TEXT = " ".join(f"word{index}" for index in range(400))
+
+
+def test_minhash_estimates_jaccard_similarity():
+    near = BASE_TEXT + " one extra closing sentence"
+    other = " ".join(f"other{index}" for index in range(400))
+    base_signature = minhash_signature(BASE_TEXT)
+    assert estimate_similarity(base_signature, minhash_signature(BASE_TEXT)) == 1.0
+    assert estimate_similarity(base_signature, minhash_signature(near)) > 0.9
+    assert estimate_similarity(base_signature, minhash_signature(other)) < 0.1
+    assert minhash_signature("") is None
+    assert len(build_fingerprint(ObjectId(), BASE_TEXT)["lsh_buckets"]) == LSH_BANDS
+
+
+def test_candidates_are_ranked_by_shared_buckets_before_the_limit(collections):
+    query = build_fingerprint(ObjectId(), BASE_TEXT)
+    noise = minhash_signature("completely unrelated filler text about the weather")
+    for _ in range(30):
+        collections["article_fingerprints"].insert_one(
+            {"_id": ObjectId(), "minhash": [int(value) for value in noise], "lsh_buckets": query["lsh_buckets"][:1]}
+        )
+    duplicate = build_fingerprint(ObjectId(), BASE_TEXT + " plus a short note")
+    collections["article_fingerprints"].insert_one(dict(duplicate, cluster_id=duplicate["_id"]))
+
+    matches = find_near_duplicates(collections["article_fingerprints"], query, 0.8, max_candidates=5)
+    assert [match["article_id"] for match in matches] == [duplicate["_id"]]
+
+
+def test_content_updates_recluster_the_article(client, app_module, article_payload):
+    original = client.post("/articles", json=article_payload(content=BASE_TEXT)).json()
+    copy = client.post("/articles", json=article_payload(title="Copy", content=BASE_TEXT + " reposted")).json()
+    assert copy["near_duplicate_of"] == original["_id"]
+    assert copy["duplicate_cluster_id"] == original["duplicate_cluster_id"]
+
+    rewritten = client.put(
+        f"/articles/{copy['_id']}", json={"content": " ".join(f"fresh{index}" for index in range(300))}
+    ).json()
+    assert "near_duplicate_of" not in rewritten
+    assert rewritten["duplicate_cluster_id"] == copy["_id"]
+    fingerprints = app_module.get_collections()[0]["article_fingerprints"]
+    assert str(fingerprints.find_one({"_id": ObjectId(copy["_id"])})["cluster_id"]) == copy["_id"]
+
+    restored = client.put(f"/articles/{copy['_id']}", json={"content": BASE_TEXT + " again"}).json()
+    assert restored["near_duplicate_of"] == original["_id"]
+    assert restored["duplicate_cluster_id"] == original["duplicate_cluster_id"]
+
+    duplicates = client.get(f"/articles/{original['_id']}/duplicates").json()
+    assert [item["article_id"] for item in duplicates["duplicates"]] == [copy["_id"]]
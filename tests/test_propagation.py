@@ -0,0 +1,106 @@
+import random
+
+import numpy as np
+import pytest
+
+from backend.benchmarks.run import build_scorer
+from backend.graph_traversal import DEFAULT_RELATIONSHIP_WEIGHT
+from backend.propagation import DEFAULT_ANCHOR_CONFIDENCE, build_propagation_arrays, propagate_bias
+
+
+def node(key, score=None, confidence=None, inferred=False):
+    return {"label": "Topic", "key": key, "bias_score": score, "bias_confidence": confidence, "inferred": inferred}
+
+
+def rel(source, target, weight=None):
+    return {"from_label": "Topic", "from_key": source, "to_label": "Topic", "to_key": target, "weight": weight}
+
+
+def reference_propagation(nodes, relationships, max_iterations, tolerance, decay):
+    anchors = [item["bias_score"] is not None and not item["inferred"] for item in nodes]
+    position = {item["key"]: index for index, item in enumerate(nodes)}
+    edges = []
+    for item in relationships:
+        source, target = position[item["from_key"]], position[item["to_key"]]
+        weight = DEFAULT_RELATIONSHIP_WEIGHT if item["weight"] is None else item["weight"]
+        if source != target and weight > 0:
+            edges += [(source, target, weight), (target, source, weight)]
+    scores = [item["bias_score"] if anchor else 0.0 for item, anchor in zip(nodes, anchors)]
+    confidence = [
+        (DEFAULT_ANCHOR_CONFIDENCE if item["bias_confidence"] is None else item["bias_confidence"]) if anchor else 0.0
+        for item, anchor in zip(nodes, anchors)
+    ]
+    for _ in range(max_iterations):
+        next_scores, next_confidence = list(scores), list(confidence)
+        for index, anchor in enumerate(anchors):
+            if anchor:
+                continue
+            incoming = [(source, weight) for source, target, weight in edges if target == index]
+            mass = sum(weight * confidence[source] for source, weight in incoming)
+            if mass <= 0:
+                continue
+            informed = sum(weight for source, weight in incoming if confidence[source] > 0)
+            next_scores[index] = max(-1.0, min(1.0, sum(weight * confidence[source] * scores[source]
+                                                        for source, weight in incoming) / mass))
+            next_confidence[index] = decay * mass / informed
+        delta = max(abs(a - b) for a, b in zip(next_scores + next_confidence, scores + confidence))
+        scores, confidence = next_scores, next_confidence
+        if delta < tolerance:
+            break
+    return scores, confidence
+
+
+def test_free_node_between_opposite_anchors_settles_in_the_middle():
+    nodes = [node("left", -1.0, 1.0), node("middle"), node("right", 1.0, 1.0), node("island"), node("loop")]
+    relationships = [rel("left", "middle", 0.5), rel("middle", "right", 0.5), rel("loop", "loop", 0.9)]
+    result = propagate_bias(build_propagation_arrays(nodes, relationships))
+    assert result["scores"][1] == pytest.approx(0.0)
+    assert result["confidence"][1] == pytest.approx(0.85)
+    assert list(result["informed"]) == [False, True, False, False, False]
+    assert list(result["scores"][[0, 2]]) == [-1.0, 1.0]
+    assert result["stats"]["edges"] == 2
+    assert result["stats"]["unreached_nodes"] == 2
+    assert result["stats"]["converged"]
+
+
+def test_inferred_nodes_are_recomputed_rather_than_anchored():
+    nodes = [node("seed", 0.8, 0.9), node("stale", -0.9, 0.5, inferred=True)]
+    result = propagate_bias(build_propagation_arrays(nodes, [rel("seed", "stale")]))
+    assert result["stats"]["anchors"] == 1
+    assert result["scores"][1] == pytest.approx(0.8)
+
+
+def test_vectorized_propagation_matches_a_plain_loop():
+    rng = random.Random(11)
+    nodes = []
+    for index in range(60):
+        if rng.random() < 0.3:
+            nodes.append(node(f"n{index}", round(rng.uniform(-1, 1), 3), rng.choice([None, 0.6, 0.9])))
+        else:
+            nodes.append(node(f"n{index}"))
+    relationships = [
+        rel(f"n{rng.randrange(60)}", f"n{rng.randrange(60)}", rng.choice([None, 0.3, 0.7, 1.0])) for _ in range(150)
+    ]
+    result = propagate_bias(build_propagation_arrays(nodes, relationships), max_iterations=50, tolerance=1e-6)
+    scores, confidence = reference_propagation(nodes, relationships, 50, 1e-6, 0.85)
+    assert np.allclose(result["scores"], scores)
+    assert np.allclose(result["confidence"], confidence)
+
+
+def test_scorer_writes_only_free_nodes(synthetic_graph):
+    graph = synthetic_graph.build_memory_graph()
+    scorer = build_scorer(graph, enable_ml_model=False)
+    seeded = {ref: node["bias_score"] for ref, node in graph.nodes.items() if node.get("bias_score") is not None}
+    version = graph.version
+
+    dry = scorer.propagate_graph_bias(dry_run=True)
+    assert dry["nodes_updated"] == 0
+    assert graph.version == version
+
+    stats = scorer.propagate_graph_bias(batch_size=7)
+    assert stats["nodes_updated"] == stats["informed_nodes"] > 0
+    assert graph.version > version
+    assert {ref: graph.nodes[ref]["bias_score"] for ref in seeded} == seeded
+    propagated = [node for node in graph.nodes.values() if node.get("inference_model") == "graph-propagation-v1"]
+    assert len(propagated) == stats["nodes_updated"]
+    assert all(0.15 <= node["bias_confidence"] <= 0.85 for node in propagated)
@@ -0,0 +1,67 @@
+from backend.query_cache import QueryResultCache, build_cache_key, etag_matches
+
+
+def test_cache_key_ignores_empty_params_and_order():
+    assert build_cache_key("articles", {"b": 1, "a": None, "c": ""}) == build_cache_key("articles", {"b": 1})
+
+
+def test_put_and_get_round_trip():
+    cache = QueryResultCache(max_entries=4, ttl_seconds=30)
+    etag = cache.put("k", [1, 2], cache.generation)
+    assert cache.get("k") == ([1, 2], etag)
+    assert etag_matches(etag, etag)
+    assert etag_matches("*", etag)
+    assert not etag_matches(None, etag)
+
+
+def test_bump_generation_invalidates_and_rejects_stale_puts():
+    cache = QueryResultCache(max_entries=4, ttl_seconds=30)
+    generation = cache.generation
+    cache.put("k", "old", generation)
+    cache.bump_generation()
+    assert cache.get("k") is None
+    cache.put("k", "computed before bump", generation)
+    assert cache.get("k") is None
+
+
+def test_lru_eviction():
+    cache = QueryResultCache(max_entries=2, ttl_seconds=30)
+    for key in ("a", "b"):
+        cache.put(key, key, cache.generation)
+    cache.get("a")
+    cache.put("c", "c", cache.generation)
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+    assert cache.get("c") is not None
+
+
+def test_ttl_expiry(monkeypatch):
+    import backend.query_cache as query_cache_module
+
+    now = [100.0]
+    monkeypatch.setattr(query_cache_module.time, "monotonic", lambda: now[0])
+    cache = QueryResultCache(max_entries=2, ttl_seconds=5)
+    cache.put("k", "v", cache.generation)
+    now[0] += 6
+    assert cache.get("k") is None
+
+
+def test_disabled_cache_stores_nothing():
+    cache = QueryResultCache(max_entries=0, ttl_seconds=30)
+    cache.put("k", "v", cache.generation)
+    assert cache.get("k") is None
+
+
+def test_articles_etag_and_write_invalidation(client, article_payload):
+    client.post("/articles", json=article_payload())
+    first = client.get("/articles")
+    etag = first.headers["ETag"]
+    assert len(first.json()) == 1
+
+    assert client.get("/articles", headers={"If-None-Match": etag}).status_code == 304
+
+    client.post("/articles", json=article_payload(title="Second article"))
+    second = client.get("/articles", headers={"If-None-Match": etag})
+    assert second.status_code == 200
+    assert len(second.json()) == 2
+    assert second.headers["ETag"] != etag
@@ -0,0 +1,85 @@
+from backend.knowledge_graph import GRAPH_VERSION_READ_QUERY, KnowledgeGraphScorer
+from backend.scoring_cache import ScoringCache
+
+
+class RecordingSession:
+    def __init__(self, calls):
+        self.calls = calls
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return None
+
+    def execute_read(self, fn, *args):
+        self.calls.append(("read", fn.__name__, args))
+        return 7
+
+    def execute_write(self, fn, *args):
+        self.calls.append(("write", fn.__name__, args))
+        return 7
+
+
+class RecordingDriver:
+    def __init__(self):
+        self.calls = []
+
+    def session(self, database=None):
+        return RecordingSession(self.calls)
+
+
+def test_cache_is_keyed_by_fingerprint_and_graph_version(collections):
+    cache = ScoringCache(max_entries=2, persist=True)
+    bundle = {"classification": {"label": "Center"}}
+    cache.put("fp", 3, bundle, collections["scoring_cache"])
+    assert cache.get("fp", 3) == bundle
+    assert cache.get("fp", 4) is None
+
+    returned = cache.get("fp", 3)
+    returned["classification"]["label"] = "mutated"
+    assert cache.get("fp", 3) == bundle
+
+    memory_only = ScoringCache(max_entries=2, persist=True)
+    assert memory_only.get("fp", 3, collections["scoring_cache"]) == bundle
+    assert memory_only.stats()["persistent_hits"] == 1
+
+
+def test_cache_evicts_least_recently_used():
+    cache = ScoringCache(max_entries=2)
+    cache.put("a", 1, {"v": "a"})
+    cache.put("b", 1, {"v": "b"})
+    cache.get("a", 1)
+    cache.put("c", 1, {"v": "c"})
+    assert cache.get("b", 1) is None
+    assert cache.get("a", 1) == {"v": "a"}
+
+
+def test_graph_version_is_read_without_a_write_transaction():
+    scorer = KnowledgeGraphScorer()
+    driver = RecordingDriver()
+    scorer._driver = driver
+    scorer.graph_version_refresh_seconds = 0.0
+
+    assert scorer.get_graph_version() == 7
+    assert driver.calls == [("read", "_run_graph_version_query", (GRAPH_VERSION_READ_QUERY,))]
+    assert "MERGE" not in GRAPH_VERSION_READ_QUERY
+
+
+def test_result_is_cached_under_the_version_read_before_scoring(app_module, collections, monkeypatch):
+    scorer = app_module.kg_scorer
+    scorer.graph_version_refresh_seconds = 0.0
+    before = scorer.get_graph_version()
+    original = scorer.compute_article_bias
+
+    def scoring_with_concurrent_bump(scoring_context, ml_signal=None):
+        scorer._memory_graph.version += 5
+        return original(scoring_context, ml_signal=ml_signal)
+
+    monkeypatch.setattr(scorer, "compute_article_bias", scoring_with_concurrent_bump)
+    context = {"title": "t", "content": "c", "author": "Jane Doe", "publisher": "Daily Ledger"}
+    app_module.score_article(context, collections, fingerprint="fp")
+
+    cached_versions = {key.rsplit(":g", 1)[1] for key in app_module.scoring_cache._entries}
+    assert cached_versions == {str(before)}
+    assert scorer.get_graph_version() >= before + 5
@@ -0,0 +1,63 @@
+from bson import ObjectId
+
+from backend.similar_articles import EntityInvertedIndex
+
+
+def test_refresh_batches_legacy_articles(collections):
+    with_entities = collections["articles"].insert_one(
+        {"graph_entities": [{"key": "Topic:budget", "weight": 1.0}]}
+    ).inserted_id
+    legacy_ids = [collections["articles"].insert_one({"title": f"legacy {index}"}).inserted_id for index in range(5)]
+    batches = []
+
+    def load(article_ids):
+        batches.append(list(article_ids))
+        return {article_id: [{"key": "Topic:budget", "weight": 0.5}] for article_id in article_ids}
+
+    index = EntityInvertedIndex(batch_size=2)
+    assert not index.ready
+    assert index.refresh(collections["articles"], load) == 6
+    assert index.ready
+    assert [len(batch) for batch in batches] == [2, 2, 1]
+    assert sorted(article_id for batch in batches for article_id in batch) == sorted(legacy_ids)
+    assert [match["article_id"] for match in index.similar(with_entities, k=10)]
+
+
+def test_concurrent_refresh_is_skipped(collections):
+    collections["articles"].insert_one({"graph_entities": [{"key": "Topic:budget", "weight": 1.0}]})
+    index = EntityInvertedIndex()
+    index._refresh_lock.acquire()
+    try:
+        assert index.refresh(collections["articles"], lambda article_ids: {}) == 0
+        assert not index.ready
+        assert len(index) == 0
+    finally:
+        index._refresh_lock.release()
+    assert index.refresh(collections["articles"], lambda article_ids: {}) == 1
+
+
+def test_endpoint_does_not_scan_collection_until_background_refresh(client, app_module, collections, article_payload):
+    first = client.post("/articles", json=article_payload()).json()
+    app_module.similar_index = type(app_module.similar_index)()
+    legacy_id = collections["articles"].insert_one(
+        {
+            "title": "Legacy budget",
+            "content": "Budget talks continue.",
+            "category": "politics",
+            "keywords": ["budget"],
+            "author_id": collections["authors"].find_one()["_id"],
+            "publisher_id": collections["publishers"].find_one()["_id"],
+        }
+    ).inserted_id
+
+    response = client.get(f"/articles/{first['_id']}/similar").json()
+    assert response["index_ready"] is False
+    assert response["similar"] == []
+    assert "graph_entities" not in collections["articles"].find_one({"_id": legacy_id})
+
+    app_module.refresh_similar_index()
+    response = client.get(f"/articles/{first['_id']}/similar").json()
+    assert response["index_ready"] is True
+    assert str(legacy_id) in [match["article_id"] for match in response["similar"]]
+    assert collections["articles"].find_one({"_id": legacy_id})["graph_entities"]
+    assert client.get(f"/articles/{ObjectId()}/similar").status_code == 404
@@ -0,0 +1,100 @@
+import random
+from bisect import insort
+
+from backend.entity_index import PrefixIndex, SuggestionIndex, prefix_entries
+
+
+class StubScorer:
+    def __init__(self, rows=None):
+        self.rows = rows or []
+        self.calls = []
+
+    def list_entity_names(self, updated_since=None):
+        self.calls.append(updated_since)
+        return list(self.rows)
+
+    def get_connection_error(self):
+        return None
+
+
+def test_bulk_build_matches_incremental_inserts():
+    rng = random.Random(7)
+    words = ["alpha", "beta", "gamma", "delta", "press", "daily", "times"]
+    entries = set()
+    for _ in range(300):
+        entries |= prefix_entries(" ".join(rng.choice(words) for _ in range(rng.randint(1, 3))))
+
+    expected = []
+    for entry in entries:
+        insort(expected, entry)
+    assert PrefixIndex(entries)._tokens == expected
+
+    incremental = PrefixIndex()
+    incremental.add_entries(list(entries)[:50])
+    incremental.add_entries(list(entries)[50:])
+    assert incremental._tokens == expected
+
+
+def test_search_matches_word_prefixes_and_aliases():
+    index = PrefixIndex()
+    index.add("Associated Press", ["AP"])
+    index.add("Pressroom Daily")
+    index.add("Daily Ledger")
+    assert index.search("pre") == ["Associated Press", "Pressroom Daily"]
+    assert index.search("ap") == ["Associated Press"]
+    assert index.search("daily") == ["Pressroom Daily", "Daily Ledger"]
+    assert index.search("daily", limit=1) == ["Pressroom Daily"]
+    assert index.search("  ") == []
+
+
+def test_full_rebuild_drops_deleted_names(collections):
+    index = SuggestionIndex()
+    collections["publishers"].insert_one({"name": "Daily Ledger", "aliases": []})
+    removed = collections["publishers"].insert_one({"name": "Daily Gone", "aliases": []}).inserted_id
+    scorer = StubScorer([{"label": "Organization", "name": "Sierra Club", "aliases": []}])
+
+    counts = index.refresh(collections, scorer)
+    assert counts["full"] is True
+    assert index.ready
+    assert index.suggest("publisher", "daily") == ["Daily Gone", "Daily Ledger"]
+    assert index.suggest("organization", "sier") == ["Sierra Club"]
+
+    collections["publishers"].delete_one({"_id": removed})
+    assert index.refresh(collections, scorer)["full"] is False
+    assert index.suggest("publisher", "daily") == ["Daily Gone", "Daily Ledger"]
+
+    index.refresh(collections, scorer, full=True)
+    assert index.suggest("publisher", "daily") == ["Daily Ledger"]
+    assert scorer.calls[-1] is None
+
+
+def test_adds_during_a_rebuild_are_kept(collections):
+    index = SuggestionIndex()
+
+    class AddingScorer(StubScorer):
+        def list_entity_names(self, updated_since=None):
+            index.add("author", "Written Mid Rebuild")
+            return []
+
+    index.refresh(collections, AddingScorer(), full=True)
+    assert index.suggest("author", "written") == ["Written Mid Rebuild"]
+
+
+def test_suggest_endpoint_never_refreshes_inline(client, app_module, article_payload, monkeypatch):
+    def fail(*args, **kwargs):
+        raise AssertionError("refresh must run in the background worker")
+
+    monkeypatch.setattr(app_module.suggestion_index, "refresh", fail)
+    client.post("/articles", json=article_payload(organizations=["Sierra Club"]))
+
+    body = client.get("/suggest/organization", params={"prefix": "sie"}).json()
+    assert body["suggestions"] == ["Sierra Club"]
+    assert body["index_ready"] is False
+    assert client.get("/suggest/unknown", params={"prefix": "x"}).status_code == 400
+
+
+def test_refresh_suggestions_worker_task(app_module, collections, client, article_payload):
+    client.post("/articles", json=article_payload(publisher={"name": "Daily Ledger"}))
+    counts = app_module.refresh_suggestions()
+    assert counts["full"] is True
+    assert app_module.suggestion_index.suggest("publisher", "led") == ["Daily Ledger"]
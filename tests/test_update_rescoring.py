@@ -0,0 +1,69 @@
+import pytest
+
+
+@pytest.fixture
+def scoring_calls(app_module, monkeypatch):
+    calls = []
+    original = app_module.kg_scorer.compute_article_bias
+
+    def counting(scoring_context, ml_signal=None):
+        calls.append(scoring_context)
+        return original(scoring_context, ml_signal=ml_signal)
+
+    monkeypatch.setattr(app_module.kg_scorer, "compute_article_bias", counting)
+    app_module.scoring_cache.max_entries = 0
+    return calls
+
+
+def test_non_scoring_updates_skip_the_graph(client, article_payload, scoring_calls):
+    article_id = client.post("/articles", json=article_payload()).json()["_id"]
+    assert len(scoring_calls) == 1
+
+    response = client.put(
+        f"/articles/{article_id}",
+        json={
+            "engagement": {"likes": 3},
+            "published_date": "2024-02-01",
+        },
+    )
+    assert response.status_code == 200
+    assert response.json()["engagement"]["likes"] == 3
+    assert len(scoring_calls) == 1
+
+
+def test_unchanged_scoring_inputs_reuse_the_stored_result(client, article_payload, scoring_calls):
+    created = client.post("/articles", json=article_payload(keywords=["budget", "taxes"])).json()
+
+    updated = client.put(f"/articles/{created['_id']}", json={"keywords": ["Taxes", "budget"]}).json()
+    assert len(scoring_calls) == 1
+    assert updated["scoring_fingerprint"] == created["scoring_fingerprint"]
+
+    changed = client.put(f"/articles/{created['_id']}", json={"keywords": ["immigration"]}).json()
+    assert len(scoring_calls) == 2
+    assert changed["scoring_fingerprint"] != created["scoring_fingerprint"]
+
+
+def test_update_validation(client, article_payload):
+    article_id = client.post("/articles", json=article_payload()).json()["_id"]
+    assert client.put(f"/articles/{article_id}", json={}).status_code == 400
+    assert client.put("/articles/not-an-id", json={"title": "x"}).status_code == 400
+    assert client.put("/articles/" + "0" * 24, json={"title": "x"}).status_code == 404
+
+
+@pytest.mark.parametrize(
+    "setting, value",
+    [
+        ("ml_weight", 0.2),
+        ("graph_weight", 0.8),
+        ("graph_traversal_mode", "pruned"),
+        ("graph_traversal_max_hops", 3),
+        ("graph_traversal_fanout", 5),
+        ("graph_traversal_min_path_weight", 0.2),
+        ("graph_scoring_mode", "adaptive"),
+    ],
+)
+def test_scorer_settings_change_the_fingerprint(app_module, monkeypatch, setting, value):
+    context = {"author": "Jane Doe", "keywords": ["budget"]}
+    before = app_module.scoring_fingerprint(context)
+    monkeypatch.setattr(app_module.kg_scorer, setting, value)
+    assert app_module.scoring_fingerprint(context) != before